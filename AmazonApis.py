@@ -1,3 +1,5 @@
+import re
+import heapq
 import uuid
 from typing import Dict, List, Union, Literal, Any
 from datetime import datetime, timedelta
@@ -6,6 +8,169 @@ from state_loader import load_default_state
 
 DEFAULT_STATE = load_default_state("AmazonApis")
 
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({"a", "an", "and", "the", "of", "for", "with", "in", "on", "to", "by", "my", "me", "some"})
+_PHONETIC_RULES = (
+    ("sch", "sk"), ("tch", "ch"), ("ph", "f"), ("gh", "g"), ("ck", "k"), ("kn", "n"),
+    ("wr", "r"), ("wh", "w"), ("qu", "kw"), ("dg", "j"), ("x", "ks"), ("z", "s"), ("q", "k"),
+)
+_VOWELS = frozenset("aeiouy")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercases text and splits it into alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _trigrams(token: str) -> set:
+    """Returns the padded character trigrams of a token ("ipad" -> {"$ip", "ipa", "pad", "ad$"})."""
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _phonetic_key(token: str) -> str:
+    """
+    Builds a coarse sound-alike key for a token so that spoken-form spellings collide
+    ("eyepad" and "ipad" both map to "apd", "fone" and "phone" both map to "fn").
+    Digits are kept verbatim so model numbers are not conflated.
+    """
+    if token.isdigit():
+        return token
+    for pattern, replacement in _PHONETIC_RULES:
+        token = token.replace(pattern, replacement)
+    token = re.sub(r"c(?=[eiy])", "s", token).replace("c", "k")
+    key = "a" if token[0] in _VOWELS else token[0]
+    for char in token[1:]:
+        if char in _VOWELS or char in "hw" or char == key[-1]:
+            continue
+        key += char
+    return key
+
+
+def _bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Edit distance between a and b counting insertions, deletions, substitutions and adjacent
+    transpositions ("kindel" -> "kindle" is one edit). Gives up as soon as a whole row exceeds
+    max_distance and returns max_distance + 1 in that case.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = min(previous[j - 1] + (char_a != char_b), previous[j] + 1, current[j - 1] + 1)
+            if before_previous is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before_previous[j - 2] + 1)
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > max_distance:
+            return max_distance + 1
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+class _ProductNameIndex:
+    """
+    Approximate-match index over product names, built once per product catalog.
+
+    Each distinct name token is reachable three ways: exactly, through its phonetic key, and
+    through its character trigrams (candidates are then verified with a bounded edit distance).
+    Tokens map to the product IDs whose names contain them, so a query only touches the
+    postings of the handful of terms it resolves to.
+    """
+
+    def __init__(self, products: Dict[str, Dict]):
+        self.token_postings: Dict[str, set] = {}
+        self.trigram_postings: Dict[str, List[str]] = {}
+        self.phonetic_postings: Dict[str, List[str]] = {}
+        self.name_lengths: Dict[str, int] = {}
+        self._term_cache: Dict[str, List[tuple]] = {}
+        for product_id, product_info in products.items():
+            tokens = _tokenize(product_info.get("name", ""))
+            self.name_lengths[product_id] = len(tokens)
+            for token in tokens:
+                self.token_postings.setdefault(token, set()).add(product_id)
+        for token in self.token_postings:
+            for gram in _trigrams(token):
+                self.trigram_postings.setdefault(gram, []).append(token)
+            self.phonetic_postings.setdefault(_phonetic_key(token), []).append(token)
+
+    def _resolve_term(self, term: str) -> List[tuple]:
+        """
+        Resolves a query term to (vocabulary token, weight) pairs. Exact hits weigh 1.0; spelling
+        variants within the edit bound weigh 1 - distance / length; sound-alike tokens weigh at
+        least 0.8 and get a 0.1 bonus when they are also a close spelling variant.
+        """
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+        matches: Dict[str, float] = {}
+        if term in self.token_postings:
+            matches[term] = 1.0
+        if len(term) > 2:
+            max_distance = 1 if len(term) <= 7 else 2
+            term_key = _phonetic_key(term)
+            sounds_alike = set()
+            if len(term_key) > 1 and len(term) > 3:
+                sounds_alike.update(self.phonetic_postings.get(term_key, ()))
+            term_grams = _trigrams(term)
+            required_overlap = max(1, len(term_grams) - 3 * max_distance)
+            overlap: Dict[str, int] = {}
+            for gram in term_grams:
+                for token in self.trigram_postings.get(gram, ()):
+                    overlap[token] = overlap.get(token, 0) + 1
+            candidates = {token for token, shared in overlap.items() if shared >= required_overlap}
+            for token in candidates | sounds_alike:
+                if token in matches:
+                    continue
+                distance = _bounded_edit_distance(term, token, max_distance)
+                weight = 1.0 - distance / max(len(term), len(token)) if distance <= max_distance else 0.0
+                if token in sounds_alike:
+                    weight = max(weight, 0.8) + (0.1 if weight > 0.0 else 0.0)
+                if weight > 0.0:
+                    matches[token] = min(weight, 0.95)
+        resolved = list(matches.items())
+        self._term_cache[term] = resolved
+        return resolved
+
+    def search(self, query: str, limit: int) -> List[tuple]:
+        """
+        Returns up to limit (score, product_id) pairs ranked best first. Adjacent query words
+        are also tried joined together so split transcriptions ("eye pad") reach "ipad".
+        """
+        words = _tokenize(query)
+        content = [word for word in words if word not in _STOPWORDS] or words
+        if not content:
+            return []
+        position_scores: List[Dict[str, float]] = [{} for _ in content]
+        units = [((i,), word) for i, word in enumerate(content)]
+        units += [((i, i + 1), content[i] + content[i + 1]) for i in range(len(content) - 1)]
+        for positions, term in units:
+            unit_scores: Dict[str, float] = {}
+            for token, weight in sorted(self._resolve_term(term), key=lambda match: match[1]):
+                unit_scores.update(dict.fromkeys(self.token_postings[token], weight))
+            for position in positions:
+                scores = position_scores[position]
+                if not scores:
+                    scores.update(unit_scores)
+                    continue
+                for product_id, weight in unit_scores.items():
+                    if weight > scores.get(product_id, 0.0):
+                        scores[product_id] = weight
+        totals: Dict[str, float] = dict(position_scores[0])
+        for scores in position_scores[1:]:
+            for product_id, weight in scores.items():
+                totals[product_id] = totals.get(product_id, 0.0) + weight
+        ranked = (
+            (total / len(content), -self.name_lengths[product_id], product_id)
+            for product_id, total in totals.items()
+        )
+        return [(score, product_id) for score, _, product_id in heapq.nlargest(limit, ranked)]
+
+
 class AmazonApis:
     """
     Inspired by https://appworld.dev/
@@ -34,6 +199,8 @@ class AmazonApis:
         """
         self.state = deepcopy(DEFAULT_STATE)
         self._api_description = "Amazon API simulation inspired by AppWorld's style."
+        self._product_name_index = None
+        self._product_name_index_key = None
 
     def _get_current_user_id(self) -> Union[str, None]:
         """
@@ -74,6 +241,26 @@ class AmazonApis:
             return {"status": False, "message": "You must be logged in to perform this action."}
         return None
 
+    def _get_product_name_index(self) -> _ProductNameIndex:
+        """
+        Returns the approximate-match index over product names, rebuilding it only when the
+        product catalog has been replaced or has gained or lost products since the last build.
+        
+        Returns:
+            _ProductNameIndex: Index used by fuzzy_search_products and the search_products fallback.
+        
+        Notes:
+            - Built lazily on the first fuzzy lookup so plain instantiation stays cheap
+            - Product names are not mutated by any endpoint, so price and stock changes
+              never require a rebuild
+        """
+        products = self.state.get("products", {})
+        index_key = (id(products), len(products))
+        if self._product_name_index is None or self._product_name_index_key != index_key:
+            self._product_name_index = _ProductNameIndex(products)
+            self._product_name_index_key = index_key
+        return self._product_name_index
+
     def _get_user_data(self, user_id: str) -> Union[Dict, None]:
         """
         Retrieves the complete data record for a specific user by their ID.
@@ -1499,19 +1686,95 @@ class AmazonApis:
         
         Notes:
             - Query searches both name and description fields
+            - When nothing matches exactly, falls back to fuzzy_search_products so misspelled or
+              phonetically transcribed names still find candidates; those results are ranked best
+              first and the response carries "fuzzy_match": True
             - Returns empty list if no products match
             - All filters are AND-ed together
             - Does not require user login
         """
+        query_lower = query.lower()
+        category_lower = category.lower() if category is not None else None
         results = []
         for product_id, product_info in self.state["products"].items():
             if (
-                query.lower() in product_info["name"].lower()
-                or query.lower() in product_info["description"].lower()
-            ) and (category is None or product_info["category"].lower() == category.lower()) and (
+                query_lower in product_info["name"].lower()
+                or query_lower in product_info["description"].lower()
+            ) and (category_lower is None or product_info["category"].lower() == category_lower) and (
                 min_price <= product_info["price"] <= max_price
             ):
                 results.append({"product_id": product_id, **product_info})
+        if not results:
+            fuzzy_results = self.fuzzy_search_products(
+                query, category=category, min_price=min_price, max_price=max_price
+            )["products"]
+            if fuzzy_results:
+                return {"search_status": True, "products": fuzzy_results, "fuzzy_match": True}
+        return {"search_status": True, "products": results}
+
+    def fuzzy_search_products(
+        self,
+        query: str,
+        category: Union[str, None] = None,
+        min_price: float = 0.0,
+        max_price: float = float('inf'),
+        max_results: int = 10,
+    ) -> Dict[str, Union[bool, List[Dict]]]:
+        """
+        Finds products whose names approximately match a spoken or misspelled query and returns
+        them ranked by match quality.
+        
+        Args:
+            query (str): Product name as heard or typed, e.g. "eye pad", "lord of the rings book"
+                        or "noise cancelling ear buds". Case-insensitive.
+            category (Union[str, None], optional): Filter by product category. If None, all categories
+                                                   included. Case-insensitive exact match. Default is None.
+            min_price (float, optional): Minimum price filter (inclusive). Default is 0.0.
+            max_price (float, optional): Maximum price filter (inclusive). Default is infinity.
+            max_results (int, optional): Maximum number of candidates to return. Default is 10.
+        
+        Returns:
+            Dict[str, Union[bool, List[Dict]]]: Search results containing:
+                - search_status (bool): Always True (even if no results)
+                - products (List[Dict]): Candidate products, best match first, each containing:
+                    - product_id (str): Product's unique identifier
+                    - match_score (float): Fraction of query words matched, between 0 and 1
+                    (Plus every field of the product record, as in search_products)
+        
+        Example:
+            >>> api.fuzzy_search_products("eye pad")
+            {"search_status": True, "products": [
+                {"product_id": "prod-456", "match_score": 0.9, "name": "Apple iPad Air", ...}
+            ]}
+        
+        Notes:
+            - Each query word is matched against product name words exactly, by sound-alike key,
+              or by spelling within one edit (two for words longer than seven letters)
+            - Adjacent query words are also tried joined, so "eye pad" can match "iPad"
+            - Filler words such as "the", "of" and "my" are ignored when other words are present
+            - Ties are broken in favour of shorter product names
+            - Only product names are indexed; descriptions are not searched
+            - Does not require user login
+        """
+        if max_results <= 0:
+            return {"search_status": True, "products": []}
+        category_lower = category.lower() if category is not None else None
+        products = self.state["products"]
+        index = self._get_product_name_index()
+        filtered = category_lower is not None or min_price > 0.0 or max_price != float('inf')
+        candidates = index.search(query, len(products) if filtered else max_results)
+        results = []
+        for score, product_id in candidates:
+            product_info = products.get(product_id)
+            if product_info is None:
+                continue
+            if category_lower is not None and product_info["category"].lower() != category_lower:
+                continue
+            if not (min_price <= product_info["price"] <= max_price):
+                continue
+            results.append({"product_id": product_id, "match_score": round(score, 3), **product_info})
+            if len(results) >= max_results:
+                break
         return {"search_status": True, "products": results}
 
     def show_product_details(self, product_id: str) -> Dict[str, Union[bool, Dict]]:
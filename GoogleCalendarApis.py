@@ -9,14 +9,519 @@ than post_calendar))
 -Some parts of Google Calendar aren't implemented here (e.g., ACLs, colors, settings, etc.) for brevity.
 The focus was on core calendar and event management functionality.
 """
+import bisect
 import copy
+import heapq
+import itertools
+import random
 import uuid
-from typing import Dict, Union, Any, Optional, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Union, Any, Optional, List, Tuple
+from datetime import MAXYEAR, datetime, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from state_loader import load_default_state
 
 DEFAULT_STATE = load_default_state("GoogleCalendarApis")
 
+
+@lru_cache(maxsize=None)
+def _time_zone(name: Optional[str]) -> tzinfo:
+    """Return the tzinfo for an IANA time zone name, falling back to UTC for unknown or missing names."""
+    if not name:
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def _to_epoch_seconds(value: Any, time_zone: Optional[str] = None) -> Optional[int]:
+    """
+    Convert an RFC 3339 date-time (or YYYY-MM-DD date) to UTC epoch seconds.
+    
+    Values with a "Z" suffix or a UTC offset are taken as-is; naive values are interpreted in
+    time_zone (UTC if not given). Returns None for missing or unparseable values.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_time_zone(time_zone))
+    return int(parsed.timestamp())
+
+
+def _event_bounds(event: Dict[str, Any], default_time_zone: Optional[str] = None) -> Optional[Tuple[int, int]]:
+    """
+    Return an event's (start, end) in UTC epoch seconds, or None if either bound cannot be parsed.
+    
+    Naive times are interpreted in the start/end "timeZone", falling back to default_time_zone.
+    All-day events ("date" instead of "dateTime") start at midnight in that zone.
+    """
+    start = event.get("start") or {}
+    end = event.get("end") or {}
+    start_epoch = _to_epoch_seconds(start.get("dateTime") or start.get("date"), start.get("timeZone") or default_time_zone)
+    end_epoch = _to_epoch_seconds(end.get("dateTime") or end.get("date"), end.get("timeZone") or default_time_zone)
+    if start_epoch is None or end_epoch is None:
+        return None
+    return start_epoch, end_epoch
+
+
+def _format_epoch(seconds: int) -> str:
+    """Format UTC epoch seconds as an RFC 3339 "YYYY-MM-DDTHH:MM:SSZ" string."""
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _merge_busy_intervals(interval_lists: List[List[Tuple[int, int]]]) -> List[Tuple[int, int]]:
+    """
+    Merge start-sorted lists of (start, end) intervals into disjoint, start-sorted busy periods.
+    
+    The lists are merged lazily in start order and swept once, so overlapping or touching
+    intervals (from one calendar or several) collapse into a single period.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in heapq.merge(*interval_lists):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _subtract_intervals(windows: List[Tuple[int, int]], busy: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Return the parts of the start-sorted, disjoint windows not covered by the start-sorted,
+    disjoint busy periods, sweeping both lists once.
+    """
+    free: List[Tuple[int, int]] = []
+    position = 0
+    for window_start, window_end in windows:
+        while position < len(busy) and busy[position][1] <= window_start:
+            position += 1
+        cursor = window_start
+        scan = position
+        while scan < len(busy) and busy[scan][0] < window_end:
+            if busy[scan][0] > cursor:
+                free.append((cursor, busy[scan][0]))
+            cursor = max(cursor, busy[scan][1])
+            scan += 1
+        if cursor < window_end:
+            free.append((cursor, window_end))
+    return free
+
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+
+
+def _parse_recurrence(lines: List[str]) -> Tuple[Dict[str, Any], List[Tuple[str, Optional[str]]]]:
+    """
+    Parse an event's "recurrence" lines (one RRULE plus any EXDATE lines).
+    
+    Supports FREQ=DAILY/WEEKLY/MONTHLY/YEARLY with INTERVAL, COUNT or UNTIL, and BYDAY
+    (weekly rules only). Returns the rule fields and the raw (value, TZID) exception dates;
+    raises ValueError for anything else.
+    """
+    if not isinstance(lines, list) or not all(isinstance(line, str) for line in lines):
+        raise ValueError("recurrence must be a list of strings")
+    rule: Optional[Dict[str, Any]] = None
+    exdates: List[Tuple[str, Optional[str]]] = []
+    for line in lines:
+        name, _, value = line.strip().partition(":")
+        name, *params = name.split(";")
+        name = name.upper()
+        if name == "RRULE":
+            if rule is not None:
+                raise ValueError("only one RRULE is supported")
+            parts = dict(part.split("=", 1) for part in value.upper().split(";") if "=" in part)
+            unsupported = set(parts) - {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "WKST"}
+            if unsupported:
+                raise ValueError(f"unsupported RRULE parts: {', '.join(sorted(unsupported))}")
+            if parts.get("FREQ") not in _FREQUENCIES:
+                raise ValueError(f"unsupported FREQ: {parts.get('FREQ')}")
+            if "COUNT" in parts and "UNTIL" in parts:
+                raise ValueError("COUNT and UNTIL cannot both be set")
+            by_day = ()
+            if "BYDAY" in parts:
+                if parts["FREQ"] != "WEEKLY" or not set(parts["BYDAY"].split(",")) <= set(_WEEKDAYS):
+                    raise ValueError(f"unsupported BYDAY: {parts['BYDAY']}")
+                by_day = tuple(sorted({_WEEKDAYS[day] for day in parts["BYDAY"].split(",")}))
+            interval = int(parts.get("INTERVAL", 1))
+            occurrences = int(parts["COUNT"]) if "COUNT" in parts else None
+            if interval < 1 or (occurrences is not None and occurrences < 1):
+                raise ValueError("INTERVAL and COUNT must be positive")
+            if "UNTIL" in parts:
+                _parse_rule_time(parts["UNTIL"], timezone.utc)
+            rule = {
+                "frequency": parts["FREQ"],
+                "interval": interval,
+                "count": occurrences,
+                "until": parts.get("UNTIL"),
+                "by_day": by_day,
+            }
+        elif name == "EXDATE":
+            tzid = next((param[5:] for param in params if param.upper().startswith("TZID=")), None)
+            for item in filter(None, (item.strip() for item in value.split(","))):
+                _parse_rule_time(item, timezone.utc)
+                exdates.append((item, tzid))
+        else:
+            raise ValueError(f"unsupported recurrence line: {line}")
+    if rule is None:
+        raise ValueError("recurrence needs an RRULE")
+    return rule, exdates
+
+
+def _parse_rule_time(value: str, time_zone: tzinfo) -> Tuple[datetime, bool]:
+    """Parse an iCalendar DATE or DATE-TIME value into a local naive datetime and an is-date flag."""
+    if value.endswith("Z"):
+        parsed = datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        return parsed.astimezone(time_zone).replace(tzinfo=None), False
+    if "T" in value:
+        return datetime.strptime(value, "%Y%m%dT%H%M%S"), False
+    return datetime.strptime(value, "%Y%m%d"), True
+
+
+class _RecurringSeries:
+    """
+    A recurring event's rule, expanded on demand.
+    
+    Occurrences are generated in the event's local wall-clock time, so they keep their hour
+    across DST changes. instances() jumps straight to the first period that can reach the
+    query window, so expanding a window costs time proportional to that window rather than
+    to the length of the series.
+    """
+
+    __slots__ = ("start", "duration", "all_day", "time_zone", "time_zone_name", "first_start",
+                 "frequency", "interval", "count", "until", "by_day", "excluded")
+
+    def __init__(self, event: Dict[str, Any], default_time_zone: Optional[str] = None):
+        bounds = _event_bounds(event, default_time_zone)
+        if bounds is None:
+            raise ValueError("recurring events need a valid start and end")
+        rule, exdates = _parse_recurrence(event.get("recurrence"))
+        start = event.get("start") or {}
+        self.time_zone_name = start.get("timeZone") or default_time_zone
+        self.time_zone = _time_zone(self.time_zone_name)
+        self.all_day = not start.get("dateTime")
+        self.first_start, self.duration = bounds[0], bounds[1] - bounds[0]
+        self.start = datetime.fromtimestamp(self.first_start, self.time_zone).replace(tzinfo=None)
+        self.frequency = rule["frequency"]
+        self.interval = rule["interval"]
+        self.count = rule["count"]
+        self.by_day = rule["by_day"] or ((self.start.weekday(),) if self.frequency == "WEEKLY" else ())
+        self.until = None
+        if rule["until"]:
+            until, is_date = _parse_rule_time(rule["until"], self.time_zone)
+            # A date-only UNTIL includes the whole of that day
+            self.until = self._epoch(until + timedelta(days=1)) - 1 if is_date else self._epoch(until)
+        self.excluded = set()
+        for value, tzid in exdates:
+            local, is_date = _parse_rule_time(value, self.time_zone)
+            if is_date:
+                local = datetime.combine(local.date(), self.start.time())
+            elif tzid and not value.endswith("Z"):
+                local = local.replace(tzinfo=_time_zone(tzid)).astimezone(self.time_zone).replace(tzinfo=None)
+            self.excluded.add(self._epoch(local))
+
+    @property
+    def bounded(self) -> bool:
+        return self.count is not None or self.until is not None
+
+    def _epoch(self, local: datetime) -> int:
+        return int(local.replace(tzinfo=self.time_zone).timestamp())
+
+    def _period_units(self, local: datetime) -> int:
+        if self.frequency == "DAILY":
+            return (local.date() - self.start.date()).days
+        if self.frequency == "WEEKLY":
+            week_start = self.start.date() - timedelta(days=self.start.weekday())
+            return (local.date() - week_start).days // 7
+        if self.frequency == "MONTHLY":
+            return (local.year - self.start.year) * 12 + local.month - self.start.month
+        return local.year - self.start.year
+
+    def _period_starts(self, period: int) -> List[datetime]:
+        """Local start times of the occurrences in the given period (raises OverflowError past year 9999)."""
+        step = period * self.interval
+        if self.frequency == "DAILY":
+            return [self.start + timedelta(days=step)]
+        if self.frequency == "WEEKLY":
+            week_start = self.start - timedelta(days=self.start.weekday() - 7 * step)
+            starts = [week_start + timedelta(days=weekday) for weekday in self.by_day]
+            return [start for start in starts if start >= self.start] if period == 0 else starts
+        months = self.start.month - 1 + (step if self.frequency == "MONTHLY" else 12 * step)
+        year = self.start.year + months // 12
+        if year > MAXYEAR:
+            raise OverflowError("recurrence runs past the supported date range")
+        try:
+            return [self.start.replace(year=year, month=months % 12 + 1)]
+        except ValueError:
+            # The 29th-31st do not exist in every month; such periods have no occurrence
+            return []
+
+    def _occurrences_before(self, period: int) -> int:
+        if self.frequency == "DAILY" or period == 0:
+            return period
+        if self.frequency == "WEEKLY":
+            return len(self._period_starts(0)) + (period - 1) * len(self.by_day)
+        if self.start.day <= 28:
+            return period
+        return sum(len(self._period_starts(earlier)) for earlier in range(period))
+
+    def instances(self, time_min: Optional[int] = None, time_max: Optional[int] = None):
+        """
+        Yield (start, end) epoch seconds of occurrences with end >= time_min and start < time_max,
+        in start order, skipping exception dates. Unbounded series need time_max to terminate.
+        """
+        first_period = 0
+        if time_min is not None and time_min - self.duration > self.first_start:
+            earliest = datetime.fromtimestamp(time_min - self.duration, self.time_zone).replace(tzinfo=None)
+            # Step back one period so DST shifts can never skip an occurrence
+            first_period = max(0, self._period_units(earliest) // self.interval - 1)
+        position = self._occurrences_before(first_period) if self.count is not None else 0
+        for period in itertools.count(first_period):
+            try:
+                starts = self._period_starts(period)
+            except OverflowError:
+                return
+            for local in starts:
+                position += 1
+                if self.count is not None and position > self.count:
+                    return
+                start = self._epoch(local)
+                if (self.until is not None and start > self.until) or (time_max is not None and start >= time_max):
+                    return
+                if start in self.excluded:
+                    continue
+                end = start + self.duration
+                if time_min is None or end >= time_min:
+                    yield start, end
+
+    def occurrence_start(self, stamp: str) -> Optional[int]:
+        """Return the start of the occurrence named by an instance-ID suffix, or None if there is none."""
+        try:
+            local, _ = _parse_rule_time(stamp, self.time_zone)
+        except ValueError:
+            return None
+        start = self._epoch(local)
+        if any(candidate == start for candidate, _ in self.instances(start, start + 1)):
+            return start
+        return None
+
+    def instance_id(self, event_id: str, start: int) -> str:
+        """Instance IDs follow the API's "<event id>_<original start>" form."""
+        moment = datetime.fromtimestamp(start, self.time_zone if self.all_day else timezone.utc)
+        return f"{event_id}_{moment.strftime('%Y%m%d' if self.all_day else '%Y%m%dT%H%M%SZ')}"
+
+    def exdate(self, start: int) -> str:
+        """The EXDATE line that cancels the occurrence starting at the given time."""
+        stamp = self.instance_id("", start)[1:]
+        return f"EXDATE;VALUE=DATE:{stamp}" if self.all_day else f"EXDATE:{stamp}"
+
+    def make_instance(self, event: Dict[str, Any], event_id: str, start: int) -> Dict[str, Any]:
+        """Build the single-event view of one occurrence of the recurring event."""
+        instance = {key: value for key, value in event.items() if key != "recurrence"}
+        instance["id"] = self.instance_id(event_id, start)
+        instance["recurringEventId"] = event_id
+        for field, moment in (("start", start), ("end", start + self.duration)):
+            local = datetime.fromtimestamp(moment, self.time_zone)
+            if self.all_day:
+                instance[field] = {"date": local.date().isoformat()}
+            else:
+                instance[field] = {"dateTime": local.isoformat()}
+                if self.time_zone_name:
+                    instance[field]["timeZone"] = self.time_zone_name
+        instance["originalStartTime"] = dict(instance["start"])
+        return instance
+
+
+def _tagged_instances(event_id: str, series: _RecurringSeries, time_min: Optional[int], time_max: Optional[int]):
+    """Yield (start, end, event_id) for one series; event_id is bound here, not in a caller's loop."""
+    for start, end in series.instances(time_min, time_max):
+        yield start, end, event_id
+
+
+class _IntervalNode:
+    """A node of the interval treap: one event interval plus the largest end in its subtree."""
+
+    __slots__ = ("key", "priority", "left", "right", "max_end")
+
+    def __init__(self, key: Tuple[int, int, str], priority: float):
+        self.key = key
+        self.priority = priority
+        self.left: Optional["_IntervalNode"] = None
+        self.right: Optional["_IntervalNode"] = None
+        self.max_end = key[1]
+
+    def refresh(self) -> None:
+        self.max_end = max(
+            self.key[1],
+            self.left.max_end if self.left is not None else self.key[1],
+            self.right.max_end if self.right is not None else self.key[1],
+        )
+
+
+def _split_intervals(node: Optional[_IntervalNode], key: Tuple[int, int, str]):
+    """Split a treap into the nodes before key and the nodes from key on."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, after = _split_intervals(node.right, key)
+        node.refresh()
+        return node, after
+    before, node.left = _split_intervals(node.left, key)
+    node.refresh()
+    return before, node
+
+
+def _merge_intervals(before: Optional[_IntervalNode], after: Optional[_IntervalNode]) -> Optional[_IntervalNode]:
+    """Join two treaps where every key of before sorts ahead of every key of after."""
+    if before is None or after is None:
+        return before if after is None else after
+    if before.priority > after.priority:
+        before.right = _merge_intervals(before.right, after)
+        before.refresh()
+        return before
+    after.left = _merge_intervals(before, after.left)
+    after.refresh()
+    return after
+
+
+class _EventIntervalIndex:
+    """
+    The events of one calendar as (start, end, event_id) intervals in epoch seconds.
+    
+    Intervals live in a treap (a randomly balanced search tree) ordered by start, where each
+    node also holds the largest end in its subtree. Adding or removing an event touches one
+    root-to-leaf path, O(log n) expected, and a window query skips every subtree whose largest
+    end is before the window, so it reports its k overlapping events in O((k + 1) log n).
+    Recurring events are kept aside as series and expanded only over the window being queried.
+    """
+
+    __slots__ = ("_root", "_key_by_id", "series")
+
+    def __init__(self):
+        self._root: Optional[_IntervalNode] = None
+        self._key_by_id: Dict[str, Tuple[int, int, str]] = {}
+        self.series: Dict[str, _RecurringSeries] = {}
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._key_by_id or event_id in self.series
+
+    def add(self, event_id: str, start: int, end: int) -> None:
+        self.discard(event_id)
+        key = (start, end, event_id)
+        self._key_by_id[event_id] = key
+        before, after = _split_intervals(self._root, key)
+        self._root = _merge_intervals(_merge_intervals(before, _IntervalNode(key, random.random())), after)
+
+    def extend(self, intervals: List[Tuple[str, int, int]]) -> None:
+        """Bulk-add (event_id, start, end) intervals to an empty index in O(n log n)."""
+        keys = sorted((start, end, event_id) for event_id, start, end in intervals)
+        for key in keys:
+            self._key_by_id[key[2]] = key
+        # Build a balanced tree over the sorted keys, handing out priorities in descending
+        # order level by level so every parent outranks its children
+        priorities = sorted((random.random() for _ in keys), reverse=True)
+        levels = [(0, len(keys), None, None)]
+        next_priority = 0
+        while levels:
+            next_levels = []
+            for low, high, parent, is_left in levels:
+                if low >= high:
+                    continue
+                middle = (low + high) // 2
+                node = _IntervalNode(keys[middle], priorities[next_priority])
+                next_priority += 1
+                if parent is None:
+                    self._root = node
+                elif is_left:
+                    parent.left = node
+                else:
+                    parent.right = node
+                next_levels.append((low, middle, node, True))
+                next_levels.append((middle + 1, high, node, False))
+            levels = next_levels
+        self._refresh_all()
+
+    def _refresh_all(self) -> None:
+        """Recompute max_end bottom-up over the whole tree (used after a bulk build)."""
+        order = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+        for node in reversed(order):
+            node.refresh()
+
+    def add_series(self, event_id: str, series: _RecurringSeries) -> None:
+        self.discard(event_id)
+        self.series[event_id] = series
+
+    def discard(self, event_id: str) -> None:
+        self.series.pop(event_id, None)
+        key = self._key_by_id.pop(event_id, None)
+        if key is None:
+            return
+        before, rest = _split_intervals(self._root, key)
+        _, after = _split_intervals(rest, (key[0], key[1], key[2] + "\0"))
+        self._root = _merge_intervals(before, after)
+
+    def bounds(self, event_id: str) -> Optional[Tuple[int, int]]:
+        key = self._key_by_id.get(event_id)
+        return (key[0], key[1]) if key else None
+
+    def overlapping(self, time_min: Optional[int] = None, time_max: Optional[int] = None) -> List[str]:
+        """
+        Return the IDs of events with end >= time_min and start < time_max, ordered by start.
+        Either bound may be None for an open-ended window.
+        """
+        matches = []
+        stack = []
+        node = self._root
+        while True:
+            # Walk left, skipping subtrees that end before the window
+            while node is not None and (time_min is None or node.max_end >= time_min):
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return matches
+            node = stack.pop()
+            if time_max is not None and node.key[0] >= time_max:
+                return matches
+            if time_min is None or node.key[1] >= time_min:
+                matches.append(node.key[2])
+            node = node.right
+
+    def instances(self, time_min: Optional[int] = None, time_max: Optional[int] = None):
+        """
+        Yield (start, end, event_id) for the occurrences of every recurring event with
+        end >= time_min and start < time_max, merged in start order.
+        """
+        return heapq.merge(*(
+            _tagged_instances(event_id, series, time_min, time_max)
+            for event_id, series in self.series.items()
+        ))
+
+    def busy_intervals(self, time_min: int, time_max: int) -> List[Tuple[int, int]]:
+        """
+        Return the (start, end) of events and recurring-event occurrences that strictly overlap
+        [time_min, time_max), clipped to the window and ordered by start. Zero-length events
+        are ignored.
+        """
+        if time_max <= time_min:
+            return []
+        singles = ((*self.bounds(event_id), event_id) for event_id in self.overlapping(time_min + 1, time_max))
+        return [
+            (max(start, time_min), min(end, time_max))
+            for start, end, _ in heapq.merge(singles, self.instances(time_min + 1, time_max))
+            if start < end
+        ]
+
 class GoogleCalendarApis:
     """
     A API class for simulating Google Calendar operations.
@@ -52,6 +557,10 @@ class GoogleCalendarApis:
         self.users: Dict[str, Any] = {}
         self._api_description = "This tool belongs to the Google Calendar API, which provides core functionality for managing calendars and events."
         self.current_user: Optional[str] = None  # Currently authenticated user ID
+        self._event_indexes: Dict[Tuple[str, str], _EventIntervalIndex] = {}  # (user ID, calendar ID) -> interval index
+        self._etag_counter = itertools.count(1)  # Never reset, so an etag is never reused for different content
+        self._events_etags: Dict[Tuple[str, str], str] = {}  # (user ID, calendar ID) -> etag of the event list
+        self._calendar_list_etags: Dict[str, str] = {}  # user ID -> etag of the calendar list
         self._load_scenario(DEFAULT_STATE)
 
     def _load_scenario(self, scenario: Dict) -> None:
@@ -107,6 +616,18 @@ class GoogleCalendarApis:
             GoogleCalendarApis: Loaded scenario with users and their UUIDs.
         """
         self.users = copy.deepcopy(scenario).get("users", {})
+        self._event_indexes = {}
+        self._events_etags = {}
+        self._calendar_list_etags = {}
+        for user_id, user_data in self.users.items():
+            for calendar in (user_data.get("calendar_data") or {}).get("calendars", {}).values():
+                if "etag" not in calendar:
+                    calendar["etag"] = self._next_etag()
+            for calendar_id, calendar_events in (user_data.get("calendar_data") or {}).get("events", {}).items():
+                for event in calendar_events.values():
+                    self._ensure_event_fields(event)
+                # Parse every event's times once, up front, rather than on each query
+                self._get_event_index(user_id, calendar_id)
         # Set first user as authenticated user by default
         if self.users and not self.current_user:
             self.current_user = next(iter(self.users.keys()))
@@ -219,7 +740,7 @@ class GoogleCalendarApis:
         Note:
             Uses Python's uuid.uuid4() which generates cryptographically strong random UUIDs.
             Collision probability is effectively zero for practical purposes.
-            Used for calendar IDs, event IDs, and etag values.
+            Used for calendar and event IDs; etags come from _next_etag.
             
         Example:
             >>> api = GoogleCalendarApis()
@@ -428,6 +949,126 @@ class GoogleCalendarApis:
         calendar_data = self._get_user_calendar_data(user_id)
         return calendar_data.get("events") if calendar_data else None
 
+    def _ensure_event_fields(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fills in the standard event fields (kind, etag, status, created, updated) if missing.
+        
+        Done once per stored event so read paths can return events without patching each copy.
+        """
+        now = datetime.now().isoformat() + "Z"
+        event.setdefault("kind", "calendar#event")
+        if "etag" not in event:
+            event["etag"] = self._next_etag()
+        event.setdefault("status", "confirmed")
+        event.setdefault("created", now)
+        event.setdefault("updated", now)
+        return event
+
+    def _next_etag(self) -> str:
+        """
+        Returns a new entity tag from the version counter.
+        
+        Stored resources keep their etag until they change, so clients can send it back as
+        if_none_match and get a not-modified response for unchanged data.
+        """
+        return f'"{next(self._etag_counter)}"'
+
+    def _get_events_etag(self, user_id: str, calendar_id: str) -> str:
+        """Returns the etag of a calendar's event list; it changes whenever any of its events does."""
+        etag = self._events_etags.get((user_id, calendar_id))
+        if etag is None:
+            etag = self._events_etags[(user_id, calendar_id)] = self._next_etag()
+        return etag
+
+    def _touch_events(self, user_id: str, calendar_id: str) -> None:
+        """Records a change to one of a calendar's events."""
+        self._events_etags[(user_id, calendar_id)] = self._next_etag()
+
+    def _get_calendar_list_etag(self, user_id: str) -> str:
+        """Returns the etag of a user's calendar list; it changes whenever any of their calendars does."""
+        etag = self._calendar_list_etags.get(user_id)
+        if etag is None:
+            etag = self._calendar_list_etags[user_id] = self._next_etag()
+        return etag
+
+    def _touch_calendar_list(self, user_id: str) -> None:
+        """Records a change to one of a user's calendars."""
+        self._calendar_list_etags[user_id] = self._next_etag()
+
+    def _get_event_index(self, user_id: str, calendar_id: str) -> _EventIntervalIndex:
+        """
+        Returns the interval index of a calendar's events, building it on first use.
+        
+        Events whose start or end cannot be parsed are left out of the index.
+        """
+        index = self._event_indexes.get((user_id, calendar_id))
+        if index is None:
+            index = self._event_indexes[(user_id, calendar_id)] = _EventIntervalIndex()
+            calendar_time_zone = (self._get_user_calendars(user_id) or {}).get(calendar_id, {}).get("timeZone")
+            intervals = []
+            for event_id, event in ((self._get_user_events(user_id) or {}).get(calendar_id) or {}).items():
+                if not self._index_series(index, event_id, event, calendar_time_zone):
+                    bounds = _event_bounds(event, calendar_time_zone)
+                    if bounds is not None:
+                        intervals.append((event_id, *bounds))
+            index.extend(intervals)
+        return index
+
+    @staticmethod
+    def _index_series(index: _EventIntervalIndex, event_id: str, event: Dict[str, Any], calendar_time_zone: Optional[str]) -> bool:
+        """
+        Adds a recurring event to the index as a series. Returns False for single events, and
+        for recurring events whose rule cannot be expanded (these are indexed as single events).
+        """
+        if not event.get("recurrence"):
+            return False
+        try:
+            index.add_series(event_id, _RecurringSeries(event, calendar_time_zone))
+        except ValueError:
+            return False
+        return True
+
+    def _reindex_event(self, user_id: str, calendar_id: str, event_id: str, event: Optional[Dict[str, Any]]) -> None:
+        """
+        Updates an already-built calendar index after an event is added, changed (event given)
+        or removed (event None). Calendars that have not been indexed yet are left alone.
+        """
+        index = self._event_indexes.get((user_id, calendar_id))
+        if index is None:
+            return
+        index.discard(event_id)
+        if event is not None:
+            calendar_time_zone = (self._get_user_calendars(user_id) or {}).get(calendar_id, {}).get("timeZone")
+            if self._index_series(index, event_id, event, calendar_time_zone):
+                return
+            bounds = _event_bounds(event, calendar_time_zone)
+            if bounds is not None:
+                index.add(event_id, *bounds)
+
+    def _find_recurring_instance(self, user_id: str, calendar_id: str, instance_id: str) -> Optional[Tuple[str, _RecurringSeries, int]]:
+        """
+        Resolves an instance ID ("<event id>_<original start>") to the recurring event's ID,
+        its series and the occurrence start. Returns None if no such occurrence exists.
+        """
+        event_id, _, stamp = instance_id.rpartition("_")
+        series = self._get_event_index(user_id, calendar_id).series.get(event_id)
+        if series is None:
+            return None
+        start = series.occurrence_start(stamp)
+        if start is None or series.instance_id(event_id, start) != instance_id:
+            return None
+        return event_id, series, start
+
+    def _busy_intervals(self, user_id: str, calendar_ids: List[str], time_min: int, time_max: int) -> List[Tuple[int, int]]:
+        """
+        Returns the merged busy periods of a user's calendars within [time_min, time_max) as
+        disjoint (start, end) epoch-second pairs, clipped to the window and ordered by start.
+        """
+        return _merge_busy_intervals([
+            self._get_event_index(user_id, calendar_id).busy_intervals(time_min, time_max)
+            for calendar_id in calendar_ids
+        ])
+
     def get_user_by_id(self, user_id: str) -> Dict[str, Any]:
         """
         Retrieves complete user information by user ID, including credentials.
@@ -457,7 +1098,7 @@ class GoogleCalendarApis:
         result.update(user_data)
         return result
 
-    def list_calendar_list(self) -> Dict[str, Any]:
+    def list_calendar_list(self, if_none_match: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieves all calendars in the authenticated user's calendar list.
         
@@ -466,6 +1107,12 @@ class GoogleCalendarApis:
         
         Real API endpoint: GET /users/me/calendarList
 
+        Args:
+            if_none_match (Optional[str]): etag from an earlier response. If the calendar list
+                has not changed since, a not-modified response is returned instead:
+                {"kind": "calendar#calendarList", "etag": str, "notModified": True}
+                Default: None (always return the full list)
+
         Returns:
             Dict[str, Any]: Calendar list resource with structure:
                 {
@@ -495,7 +1142,8 @@ class GoogleCalendarApis:
             Exception: If no user is authenticated (via _ensure_authenticated)
             
         Note:
-            - Each calendar gets a new etag value per request
+            - etags are stable: a calendar's etag changes only when it is updated, and the
+              list's etag only when a calendar is inserted, updated or deleted
             - Primary calendar has primary=True flag
             - Empty calendar list is valid (new users may have no calendars)
             - Access role determines permissions for calendar operations
@@ -513,11 +1161,14 @@ class GoogleCalendarApis:
         """
         user_id = self._ensure_authenticated()
         calendars = self._get_user_calendars(user_id)
+        list_etag = self._get_calendar_list_etag(user_id)
+        if if_none_match is not None and if_none_match == list_etag:
+            return {"kind": "calendar#calendarList", "etag": list_etag, "notModified": True}
         
         if not calendars:
             return {
                 "kind": "calendar#calendarList",
-                "etag": self._generate_id(),
+                "etag": list_etag,
                 "items": []
             }
         
@@ -525,7 +1176,7 @@ class GoogleCalendarApis:
         for cal_id, cal_data in calendars.items():
             items.append({
                 "kind": "calendar#calendarListEntry",
-                "etag": self._generate_id(),
+                "etag": cal_data.get("etag") or list_etag,
                 "id": cal_id,
                 "summary": cal_data.get("summary", ""),
                 "timeZone": cal_data.get("timeZone", "UTC"),
@@ -540,7 +1191,7 @@ class GoogleCalendarApis:
         
         return {
             "kind": "calendar#calendarList",
-            "etag": self._generate_id(),
+            "etag": list_etag,
             "items": items
         }
 
@@ -577,7 +1228,7 @@ class GoogleCalendarApis:
                 
         Note:
             - "primary" keyword is automatically resolved to actual calendar UUID
-            - Returns new etag value per request
+            - etag is stable until the calendar is updated
             - Description field may be empty string if not set
             - TimeZone affects how event times are interpreted
             
@@ -604,7 +1255,7 @@ class GoogleCalendarApis:
         calendar = calendars[calendar_id]
         return {
             "kind": "calendar#calendar",
-            "etag": self._generate_id(),
+            "etag": calendar["etag"],
             "id": calendar_id,
             "summary": calendar.get("summary", ""),
             "description": calendar.get("description", ""),
@@ -687,7 +1338,7 @@ class GoogleCalendarApis:
         new_calendar_id = self._generate_id()
         new_calendar = {
             "kind": "calendar#calendar",
-            "etag": self._generate_id(),
+            "etag": self._next_etag(),
             "id": new_calendar_id,
             "summary": summary,
             "description": description,
@@ -695,6 +1346,7 @@ class GoogleCalendarApis:
         }
         calendars[new_calendar_id] = new_calendar
         events[new_calendar_id] = {}
+        self._touch_calendar_list(user_id)
 
         user_email = self._get_user_email_by_id(user_id)
         print(f"Calendar created: {summary} for {user_email}")
@@ -781,13 +1433,19 @@ class GoogleCalendarApis:
             calendar["description"] = description
         if time_zone is not None:
             calendar["timeZone"] = time_zone
+            # Naive event times are read in the calendar's zone, so rebuild the index on next use
+            # and invalidate the event list etag
+            self._event_indexes.pop((user_id, calendar_id), None)
+            self._touch_events(user_id, calendar_id)
+        calendar["etag"] = self._next_etag()
+        self._touch_calendar_list(user_id)
         
         user_email = self._get_user_email_by_id(user_id)
         print(f"Calendar '{calendar_id}' updated for {user_email}")
         
         return {
             "kind": "calendar#calendar",
-            "etag": self._generate_id(),
+            "etag": calendar["etag"],
             "id": calendar_id,
             "summary": calendar.get("summary", ""),
             "description": calendar.get("description", ""),
@@ -858,6 +1516,9 @@ class GoogleCalendarApis:
         del calendars[calendar_id]
         if calendar_id in events_data:
             del events_data[calendar_id]
+        self._event_indexes.pop((user_id, calendar_id), None)
+        self._events_etags.pop((user_id, calendar_id), None)
+        self._touch_calendar_list(user_id)
         
         user_email = self._get_user_email_by_id(user_id)
         print(f"Calendar '{calendar_id}' deleted for {user_email}")
@@ -872,6 +1533,8 @@ class GoogleCalendarApis:
         q: Optional[str] = None,
         order_by: Optional[str] = None,
         single_events: bool = False,
+        read_only: bool = False,
+        if_none_match: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Retrieves events from a specified calendar with filtering and pagination support.
@@ -886,11 +1549,13 @@ class GoogleCalendarApis:
                 Example: "primary", "calendar-uuid-123"
             time_min (Optional[str]): Lower bound (inclusive) for event's end time to filter by.
                 Events ending at or after this time are included.
-                Format: ISO 8601 (e.g., "2025-01-01T00:00:00Z")
+                Format: ISO 8601 (e.g., "2025-01-01T00:00:00Z"); times without an offset
+                are interpreted in the calendar's time zone.
                 Default: None (no lower bound)
             time_max (Optional[str]): Upper bound (exclusive) for event's start time to filter by.
                 Events starting before this time are included.
-                Format: ISO 8601 (e.g., "2025-12-31T23:59:59Z")
+                Format: ISO 8601 (e.g., "2025-12-31T23:59:59Z"); times without an offset
+                are interpreted in the calendar's time zone.
                 Default: None (no upper bound)
             max_results (int): Maximum number of events to return per page.
                 Valid range: 1-2500
@@ -911,14 +1576,25 @@ class GoogleCalendarApis:
                 - None: No specific ordering
                 Default: None
             single_events (bool): Whether to expand recurring events into instances.
-                Currently not implemented - included for API compatibility.
+                If True, each occurrence in the window is returned as its own event with
+                id "<event id>_<original start>" and "recurringEventId" set; time_max is then
+                required when a recurring event has neither COUNT nor UNTIL.
+                If False, recurring events are returned once, as the recurring event itself.
+                Default: False
+            read_only (bool): Return the stored event dictionaries instead of deep copies.
+                Callers passing True must not modify the returned items.
                 Default: False
+            if_none_match (Optional[str]): etag from an earlier response for this calendar.
+                If none of the calendar's events changed since, a not-modified response is
+                returned without filtering or copying anything:
+                {"kind": "calendar#events", "etag": str, "notModified": True}
+                Default: None (always return the events)
 
         Returns:
             Dict[str, Any]: Events list resource with structure:
                 {
                     "kind": "calendar#events",
-                    "etag": str,              # Generated entity tag
+                    "etag": str,              # Changes whenever any event in the calendar changes
                     "summary": str,           # Calendar summary (empty if not set)
                     "updated": str,           # ISO 8601 timestamp
                     "timeZone": str,          # Calendar timezone ("UTC")
@@ -952,16 +1628,24 @@ class GoogleCalendarApis:
         
         Raises:
             Exception: If no user is authenticated (via _ensure_authenticated)
+            Exception: If time_min or time_max cannot be parsed
+                Error message: "Invalid time_min: {time_min}" / "Invalid time_max: {time_max}"
+            Exception: If single_events is True, time_max is missing and a recurring event never ends
+                Error message: "time_max is required to expand recurring events without COUNT or UNTIL"
             
         Note:
             - Returns empty items array if calendar not found (graceful handling)
-            - Time filters use event end/start times (not both)
+            - Time filters use event end/start times (not both), compared as UTC instants,
+              so events and bounds in different time zones are matched correctly
+            - Time-window queries are answered from the calendar's interval index and return
+              events ordered by start time; events with unparseable times never match a window
             - Text search is case-insensitive and searches summary and description
             - Pagination tokens are simple string indices (not opaque tokens)
-            - Events are deep copied to prevent accidental modifications
-            - Standard event fields (created, updated, status) auto-added if missing
+            - Events are deep copied to prevent accidental modifications (unless read_only)
+            - Standard event fields (kind, etag, created, updated, status) are filled in once if missing
             - nextPageToken only present when more results available
-            - single_events parameter accepted but not implemented
+            - Recurring events are expanded lazily, only over the requested window; with
+              single_events=False they are matched if any occurrence falls in the window
             
         Example:
             >>> api = GoogleCalendarApis()
@@ -1007,48 +1691,58 @@ class GoogleCalendarApis:
                 "items": []
             }
 
-        all_events_in_calendar = list(events_by_calendar[calendar_id].values())
-        
-        filtered_events = []
-        for event in all_events_in_calendar:
-            match = True
-            
-            # Apply time filters
-            if time_min:
-                event_end = event.get("end", {}).get("dateTime", "")
-                if event_end < time_min:
-                    match = False
-            if time_max:
-                event_start = event.get("start", {}).get("dateTime", "")
-                if event_start >= time_max:
-                    match = False
+        events_etag = self._get_events_etag(user_id, calendar_id)
+        if if_none_match is not None and if_none_match == events_etag:
+            return {"kind": "calendar#events", "etag": events_etag, "notModified": True}
+
+        calendar_events = events_by_calendar[calendar_id]
+        if time_min or time_max or order_by == "startTime" or single_events:
+            calendar_time_zone = (self._get_user_calendars(user_id) or {}).get(calendar_id, {}).get("timeZone")
+            min_epoch = _to_epoch_seconds(time_min, calendar_time_zone) if time_min else None
+            if time_min and min_epoch is None:
+                raise Exception(f"Invalid time_min: {time_min}")
+            max_epoch = _to_epoch_seconds(time_max, calendar_time_zone) if time_max else None
+            if time_max and max_epoch is None:
+                raise Exception(f"Invalid time_max: {time_max}")
             
-            # Apply text search
-            if q:
-                summary = event.get("summary", "").lower()
-                description = event.get("description", "").lower()
-                if q.lower() not in summary and q.lower() not in description:
-                    match = False
-            
-            if match:
-                # Add standard event fields
-                event_copy = copy.deepcopy(event)
-                event_copy["kind"] = "calendar#event"
-                event_copy["etag"] = self._generate_id()
-                if "created" not in event_copy:
-                    event_copy["created"] = datetime.now().isoformat() + "Z"
-                if "updated" not in event_copy:
-                    event_copy["updated"] = datetime.now().isoformat() + "Z"
-                if "status" not in event_copy:
-                    event_copy["status"] = "confirmed"
-                
-                filtered_events.append(event_copy)
-
-        # Apply ordering
-        if order_by == "startTime":
-            filtered_events.sort(key=lambda e: e.get("start", {}).get("dateTime", ""))
-        elif order_by == "updated":
-            filtered_events.sort(key=lambda e: e.get("updated", ""))
+            event_index = self._get_event_index(user_id, calendar_id)
+            if single_events and max_epoch is None and not all(series.bounded for series in event_index.series.values()):
+                raise Exception("time_max is required to expand recurring events without COUNT or UNTIL")
+            singles = (
+                (event_index.bounds(event_id)[0], event_id, calendar_events[event_id])
+                for event_id in event_index.overlapping(min_epoch, max_epoch)
+            )
+            if single_events:
+                # Occurrences are generated only for the requested window
+                recurring = (
+                    (start, event_id, event_index.series[event_id].make_instance(calendar_events[event_id], event_id, start))
+                    for start, _, event_id in event_index.instances(min_epoch, max_epoch)
+                )
+            else:
+                # A recurring event is listed once, if any of its occurrences falls in the window
+                recurring = sorted(
+                    (series.first_start, event_id, calendar_events[event_id])
+                    for event_id, series in event_index.series.items()
+                    if next(series.instances(min_epoch, max_epoch), None) is not None
+                )
+            candidates = [event for _, _, event in heapq.merge(singles, recurring)]
+            if not time_min and not time_max:
+                # Events with unparseable times still appear in an unfiltered listing, after the rest
+                candidates.extend(event for event_id, event in calendar_events.items() if event_id not in event_index)
+        else:
+            candidates = list(calendar_events.values())
+        
+        # Apply text search
+        if q:
+            q_lower = q.lower()
+            candidates = [
+                event for event in candidates
+                if q_lower in event.get("summary", "").lower() or q_lower in event.get("description", "").lower()
+            ]
+
+        # Apply ordering (the index already returns events by start time)
+        if order_by == "updated":
+            candidates.sort(key=lambda e: e.get("updated", ""))
 
         # Apply pagination
         start_index = 0
@@ -1058,12 +1752,15 @@ class GoogleCalendarApis:
             except ValueError:
                 start_index = 0
 
-        paginated_events = filtered_events[start_index : start_index + max_results]
-        next_page_token = str(start_index + max_results) if start_index + max_results < len(filtered_events) else None
+        paginated_events = [
+            event if read_only else copy.deepcopy(event)
+            for event in map(self._ensure_event_fields, candidates[start_index : start_index + max_results])
+        ]
+        next_page_token = str(start_index + max_results) if start_index + max_results < len(candidates) else None
 
         result = {
             "kind": "calendar#events",
-            "etag": self._generate_id(),
+            "etag": events_etag,
             "summary": "",
             "updated": datetime.now().isoformat() + "Z",
             "timeZone": "UTC",
@@ -1076,7 +1773,7 @@ class GoogleCalendarApis:
         
         return result
 
-    def get_event(self, calendar_id: str, event_id: str) -> Dict[str, Any]:
+    def get_event(self, calendar_id: str, event_id: str, if_none_match: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieves a single event by its unique identifier.
         
@@ -1090,15 +1787,20 @@ class GoogleCalendarApis:
                 To retrieve calendar IDs use calendarList.list method.
                 Use "primary" for user's primary calendar.
                 Example: "primary", "calendar-uuid-123"
-            event_id (str): Unique event identifier.
+            event_id (str): Unique event identifier, or the instance ID of one occurrence of a
+                recurring event ("<event id>_<original start>", as returned by list_events).
                 Format: UUID string
-                Example: "event-uuid-456"
+                Example: "event-uuid-456", "event-uuid-456_20250616T140000Z"
+            if_none_match (Optional[str]): etag from an earlier response for this event.
+                If the event has not changed since, a not-modified response is returned
+                without copying it: {"kind": "calendar#event", "id": str, "etag": str, "notModified": True}
+                Default: None (always return the event)
 
         Returns:
             Dict[str, Any]: Complete event resource with structure:
                 {
                     "kind": "calendar#event",
-                    "etag": str,                    # Generated entity tag
+                    "etag": str,                    # Changes only when the event changes
                     "id": str,                      # Event identifier
                     "status": str,                  # "confirmed", "tentative", "cancelled"
                     "created": str,                 # ISO 8601 creation timestamp
@@ -1133,7 +1835,7 @@ class GoogleCalendarApis:
         Note:
             - Returns deep copy to prevent accidental modifications
             - Standard fields (created, updated, status) added if missing
-            - kind and etag fields automatically added
+            - kind field automatically added; etag is stable until the event changes
             - Event data retrieved from backend storage
             - Auto-sets "confirmed" status if not already set
             
@@ -1161,11 +1863,18 @@ class GoogleCalendarApis:
 
         event = events_by_calendar[calendar_id].get(event_id)
         if not event:
-            raise Exception(f"Event not found: {event_id}")
+            instance = self._find_recurring_instance(user_id, calendar_id, event_id)
+            if instance is None:
+                raise Exception(f"Event not found: {event_id}")
+            recurring_event_id, series, start = instance
+            event = series.make_instance(events_by_calendar[calendar_id][recurring_event_id], recurring_event_id, start)
+        
+        self._ensure_event_fields(event)
+        if if_none_match is not None and if_none_match == event["etag"]:
+            return {"kind": "calendar#event", "id": event_id, "etag": event["etag"], "notModified": True}
         
         event_copy = copy.deepcopy(event)
         event_copy["kind"] = "calendar#event"
-        event_copy["etag"] = self._generate_id()
         if "created" not in event_copy:
             event_copy["created"] = datetime.now().isoformat() + "Z"
         if "updated" not in event_copy:
@@ -1185,6 +1894,7 @@ class GoogleCalendarApis:
         description: Optional[str] = None,
         location: Optional[str] = None,
         attendees: Optional[List[Dict[str, str]]] = None,
+        recurrence: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Creates a new event in the specified calendar.
@@ -1232,6 +1942,11 @@ class GoogleCalendarApis:
                     }
                 Example: [{"email": "bob@example.com"}, {"email": "carol@example.com"}]
                 Default: None (no attendees)
+            recurrence (Optional[List[str]]): Makes the event recurring, starting at start_time.
+                One RRULE line (FREQ=DAILY/WEEKLY/MONTHLY/YEARLY with optional INTERVAL,
+                COUNT or UNTIL, and BYDAY for weekly rules) plus optional EXDATE lines.
+                Example: ["RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10", "EXDATE:20250616T140000Z"]
+                Default: None (single event)
 
         Returns:
             Dict[str, Any]: Created event resource with structure:
@@ -1254,12 +1969,14 @@ class GoogleCalendarApis:
                     "created": str,           # ISO 8601 timestamp (now)
                     "updated": str,           # ISO 8601 timestamp (now)
                     "attendees": List,        # If provided
+                    "recurrence": List[str],  # If provided
                 }
         
         Raises:
             Exception: With descriptive message if:
                 - No user is authenticated (via _ensure_authenticated)
                 - Calendar not found: "Calendar not found: {calendar_id}"
+                - Recurrence cannot be parsed: "Invalid recurrence: {reason}"
                 
         Side Effects:
             - Creates new event in backend storage
@@ -1276,6 +1993,8 @@ class GoogleCalendarApis:
             - Attendee emails should be valid (not validated)
             - Optional fields only included in result if provided
             - Event immediately available for retrieval
+            - Occurrences of recurring events are not stored; they are expanded per query
+              window by list_events(single_events=True) and check_free_busy
             
         Example:
             >>> api = GoogleCalendarApis()
@@ -1318,6 +2037,11 @@ class GoogleCalendarApis:
 
         if calendar_id not in calendars:
             raise Exception(f"Calendar not found: {calendar_id}")
+        if recurrence:
+            try:
+                _parse_recurrence(recurrence)
+            except ValueError as e:
+                raise Exception(f"Invalid recurrence: {e}")
 
         # Ensure events dictionary exists for this calendar
         if calendar_id not in events_data:
@@ -1326,7 +2050,7 @@ class GoogleCalendarApis:
         new_event_id = self._generate_id()
         new_event = {
             "kind": "calendar#event",
-            "etag": self._generate_id(),
+            "etag": self._next_etag(),
             "id": new_event_id,
             "status": "confirmed",
             "summary": summary,
@@ -1341,8 +2065,12 @@ class GoogleCalendarApis:
             new_event["location"] = location
         if attendees:
             new_event["attendees"] = attendees
+        if recurrence:
+            new_event["recurrence"] = list(recurrence)
 
         events_data[calendar_id][new_event_id] = new_event
+        self._reindex_event(user_id, calendar_id, new_event_id, new_event)
+        self._touch_events(user_id, calendar_id)
 
         user_email = self._get_user_email_by_id(user_id)
         print(f"Event '{summary}' created in calendar '{calendar_id}' for {user_email}")
@@ -1359,6 +2087,7 @@ class GoogleCalendarApis:
         description: Optional[str] = None,
         location: Optional[str] = None,
         attendees: Optional[List[Dict[str, str]]] = None,
+        recurrence: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Updates an existing event with new details.
@@ -1411,6 +2140,9 @@ class GoogleCalendarApis:
                     {"email": str, "displayName": str, ...}
                 Example: [{"email": "newperson@example.com"}]
                 Default: None (no change)
+            recurrence (Optional[List[str]]): New RRULE/EXDATE lines (same format as insert_event).
+                An empty list turns a recurring event back into a single event.
+                Default: None (no change)
 
         Returns:
             Dict[str, Any]: Updated event resource with structure:
@@ -1433,6 +2165,7 @@ class GoogleCalendarApis:
                     "created": str,           # Original creation timestamp
                     "updated": str,           # Current timestamp (now)
                     "attendees": List,        # Updated or existing (if set)
+                    "recurrence": List[str],  # Updated or existing (if set)
                 }
         
         Raises:
@@ -1440,6 +2173,7 @@ class GoogleCalendarApis:
                 - No user is authenticated (via _ensure_authenticated)
                 - Calendar not found: "Calendar not found: {calendar_id}"
                 - Event not found: "Event not found: {event_id}"
+                - Recurrence cannot be parsed: "Invalid recurrence: {reason}"
                 
         Side Effects:
             - Modifies event in backend storage
@@ -1501,6 +2235,11 @@ class GoogleCalendarApis:
         event = events_by_calendar[calendar_id].get(event_id)
         if not event:
             raise Exception(f"Event not found: {event_id}")
+        if recurrence:
+            try:
+                _parse_recurrence(recurrence)
+            except ValueError as e:
+                raise Exception(f"Invalid recurrence: {e}")
 
         if summary is not None:
             event["summary"] = summary
@@ -1517,9 +2256,16 @@ class GoogleCalendarApis:
             event["location"] = location
         if attendees is not None:
             event["attendees"] = attendees
+        if recurrence:
+            event["recurrence"] = list(recurrence)
+        elif recurrence is not None:
+            event.pop("recurrence", None)
         
         event["updated"] = datetime.now().isoformat() + "Z"
-        event["etag"] = self._generate_id()
+        event["etag"] = self._next_etag()
+        self._touch_events(user_id, calendar_id)
+        if start_time is not None or end_time is not None or time_zone is not None or recurrence is not None:
+            self._reindex_event(user_id, calendar_id, event_id, event)
 
         user_email = self._get_user_email_by_id(user_id)
         print(f"Event '{event_id}' updated in calendar '{calendar_id}' for {user_email}")
@@ -1547,8 +2293,10 @@ class GoogleCalendarApis:
                 Use "primary" for user's primary calendar.
                 Example: "primary", "calendar-uuid-123"
             event_id (str): Unique identifier of the event to delete.
+                An instance ID ("<event id>_<original start>") deletes only that occurrence of a
+                recurring event, by adding an EXDATE to its recurrence.
                 Format: UUID string
-                Example: "event-uuid-456"
+                Example: "event-uuid-456", "event-uuid-456_20250616T140000Z"
 
         Returns:
             None: This method doesn't return a value on success.
@@ -1591,9 +2339,24 @@ class GoogleCalendarApis:
             raise Exception(f"Calendar not found: {calendar_id}")
         
         if event_id not in events_by_calendar[calendar_id]:
-            raise Exception(f"Event not found: {event_id}")
+            instance = self._find_recurring_instance(user_id, calendar_id, event_id)
+            if instance is None:
+                raise Exception(f"Event not found: {event_id}")
+            # Deleting one occurrence adds an exception date to its recurring event
+            recurring_event_id, series, start = instance
+            event = events_by_calendar[calendar_id][recurring_event_id]
+            event["recurrence"].append(series.exdate(start))
+            event["updated"] = datetime.now().isoformat() + "Z"
+            event["etag"] = self._next_etag()
+            self._reindex_event(user_id, calendar_id, recurring_event_id, event)
+            self._touch_events(user_id, calendar_id)
+            user_email = self._get_user_email_by_id(user_id)
+            print(f"Event '{event_id}' deleted from calendar '{calendar_id}' for {user_email}")
+            return
         
         del events_by_calendar[calendar_id][event_id]
+        self._reindex_event(user_id, calendar_id, event_id, None)
+        self._touch_events(user_id, calendar_id)
         user_email = self._get_user_email_by_id(user_id)
         print(f"Event '{event_id}' deleted from calendar '{calendar_id}' for {user_email}")
 
@@ -1711,9 +2474,13 @@ class GoogleCalendarApis:
         event = source_events[event_id]
         del source_events[event_id]
         events_by_calendar[destination][event_id] = event
+        self._reindex_event(user_id, calendar_id, event_id, None)
+        self._reindex_event(user_id, destination, event_id, event)
         
         event["updated"] = datetime.now().isoformat() + "Z"
-        event["etag"] = self._generate_id()
+        event["etag"] = self._next_etag()
+        self._touch_events(user_id, calendar_id)
+        self._touch_events(user_id, destination)
 
         user_email = self._get_user_email_by_id(user_id)
         print(f"Event '{event_id}' moved from '{calendar_id}' to '{destination}' for {user_email}")
@@ -1745,6 +2512,7 @@ class GoogleCalendarApis:
             items (List[Dict]): List of calendars to query for availability.
                 Each dict should contain:
                     {"id": str}  # Calendar identifier or "primary" keyword
+                Plain calendar ID strings are accepted as well.
                 Example: [{"id": "primary"}, {"id": "calendar-uuid-123"}]
 
         Returns:
@@ -1757,8 +2525,8 @@ class GoogleCalendarApis:
                         "<calendar_id>": {      # For each queried calendar
                             "busy": [           # List of busy time periods
                                 {
-                                    "start": str,  # ISO 8601 start time
-                                    "end": str     # ISO 8601 end time
+                                    "start": str,  # UTC start, "YYYY-MM-DDTHH:MM:SSZ"
+                                    "end": str     # UTC end, "YYYY-MM-DDTHH:MM:SSZ"
                                 },
                                 ...
                             ],
@@ -1782,10 +2550,13 @@ class GoogleCalendarApis:
             - "primary" keyword is resolved to user's primary calendar ID
             - Busy intervals include only events that overlap with query range
             - Events checked for overlap: max(query_start, event_start) < min(query_end, event_end)
+            - Overlapping or adjacent events are merged into one busy period, clipped to the query range
+            - Recurring events are expanded only over the query range, skipping their exception dates
+            - Event times are parsed once (at load or write) and looked up in the calendar's interval index
             - Invalid calendar IDs result in "notFound" error for that calendar
             - Invalid time formats result in "invalid" error for that calendar
             - Handles various timezone formats (Z suffix, explicit offset, naive)
-            - Naive datetimes are made timezone-aware using query time's timezone
+            - Naive datetimes are interpreted in the event's or calendar's time zone
             - Events with invalid datetime formats are silently skipped
             - Free time is implicit (any time not listed as busy)
             
@@ -1835,81 +2606,38 @@ class GoogleCalendarApis:
 
         calendars_result = {}
         for item in items:
-            calendar_id = item.get("id")
+            calendar_id = item.get("id") if isinstance(item, dict) else item
             calendar_id_resolved = self._resolve_calendar_id(calendar_id)
-            
-            if calendar_id_resolved in calendars_data:
-                busy_intervals = []
-                
-                # Parse query time range, ensuring timezone awareness
-                try:
-                    if time_min.endswith('Z'):
-                        check_start = datetime.fromisoformat(time_min.replace('Z', '+00:00'))
-                    else:
-                        check_start = datetime.fromisoformat(time_min)
-                    
-                    if time_max.endswith('Z'):
-                        check_end = datetime.fromisoformat(time_max.replace('Z', '+00:00'))
-                    else:
-                        check_end = datetime.fromisoformat(time_max)
-                except (ValueError, AttributeError):
-                    # If parsing fails, skip this calendar
-                    calendars_result[calendar_id] = {
-                        "errors": [{
-                            "domain": "global",
-                            "reason": "invalid"
-                        }],
-                        "busy": []
-                    }
-                    continue
 
-                for _, event in events_data.get(calendar_id_resolved, {}).items():
-                    event_start_str = event.get("start", {}).get("dateTime")
-                    event_end_str = event.get("end", {}).get("dateTime")
-
-                    if event_start_str and event_end_str:
-                        try:
-                            # Parse event times, handling various formats
-                            if event_start_str.endswith('Z'):
-                                event_start = datetime.fromisoformat(event_start_str.replace('Z', '+00:00'))
-                            elif '+' in event_start_str or event_start_str.count('-') > 2:
-                                # Has timezone info
-                                event_start = datetime.fromisoformat(event_start_str)
-                            else:
-                                # Naive datetime - make it aware using UTC
-                                event_start = datetime.fromisoformat(event_start_str).replace(tzinfo=check_start.tzinfo)
-                            
-                            if event_end_str.endswith('Z'):
-                                event_end = datetime.fromisoformat(event_end_str.replace('Z', '+00:00'))
-                            elif '+' in event_end_str or event_end_str.count('-') > 2:
-                                # Has timezone info
-                                event_end = datetime.fromisoformat(event_end_str)
-                            else:
-                                # Naive datetime - make it aware using UTC
-                                event_end = datetime.fromisoformat(event_end_str).replace(tzinfo=check_end.tzinfo)
-
-                            # Check for overlap
-                            if max(check_start, event_start) < min(check_end, event_end):
-                                busy_intervals.append({
-                                    "start": event_start_str,
-                                    "end": event_end_str
-                                })
-                        except (ValueError, AttributeError):
-                            # Skip events with invalid datetime formats
-                            continue
-                
+            if calendar_id_resolved not in calendars_data:
                 calendars_result[calendar_id] = {
-                    "busy": busy_intervals,
-                    "errors": []
+                    "errors": [{
+                        "domain": "global",
+                        "reason": "notFound"
+                    }],
+                    "busy": []
                 }
-            else:
+                continue
+
+            # Naive query bounds are read in the calendar's own time zone
+            calendar_time_zone = calendars_data[calendar_id_resolved].get("timeZone")
+            check_start = _to_epoch_seconds(time_min, calendar_time_zone)
+            check_end = _to_epoch_seconds(time_max, calendar_time_zone)
+            if check_start is None or check_end is None:
                 calendars_result[calendar_id] = {
                     "errors": [{
                         "domain": "global",
-                        "reason": "notFound"
+                        "reason": "invalid"
                     }],
                     "busy": []
                 }
+                continue
+
+            busy_intervals = self._busy_intervals(user_id, [calendar_id_resolved], check_start, check_end)
+            calendars_result[calendar_id] = {
+                "busy": [{"start": _format_epoch(start), "end": _format_epoch(end)} for start, end in busy_intervals],
+                "errors": []
+            }
 
         return {
             "kind": "calendar#freeBusy",
@@ -1918,6 +2646,168 @@ class GoogleCalendarApis:
             "calendars": calendars_result
         }
 
+    def find_meeting_slots(
+        self,
+        attendee_emails: List[str],
+        duration: int,
+        window: Dict[str, str],
+        working_hours: Optional[Dict[str, Any]] = None,
+        optional_attendee_emails: Optional[List[str]] = None,
+        step_minutes: int = 30,
+        max_results: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Finds time slots in which every attendee is free, across all of their calendars.
+        
+        Merges the busy periods of every required attendee in a single sweep over their
+        calendars' interval indexes (recurring events are expanded over the window only),
+        subtracts them from the working hours inside the window, and proposes candidate
+        slots inside the remaining free gaps. Candidates are ranked by how many optional
+        attendees can also attend, then by start time.
+
+        Args:
+            attendee_emails (List[str]): Emails of the required attendees.
+                Example: ["alice@example.com", "bob@example.com"]
+            duration (int): Meeting length in minutes.
+                Example: 30, 60
+            window (Dict[str, str]): Period to search, as {"start": str, "end": str}.
+                Format: ISO 8601; times without an offset are interpreted in the working
+                hours time zone.
+                Example: {"start": "2025-06-16T00:00:00Z", "end": "2025-06-21T00:00:00Z"}
+            working_hours (Optional[Dict[str, Any]]): Daily hours a meeting may fall in.
+                Structure:
+                    {
+                        "start": str,       # "HH:MM", e.g. "09:00"
+                        "end": str,         # "HH:MM", e.g. "17:00"
+                        "timeZone": str,    # IANA zone; default: primary calendar's zone
+                        "days": List[str]   # default: ["MO", "TU", "WE", "TH", "FR"]
+                    }
+                Default: None (any time in the window)
+            optional_attendee_emails (Optional[List[str]]): Attendees whose availability
+                only affects ranking.
+                Default: None
+            step_minutes (int): Spacing of candidate start times within a free gap.
+                Default: 30
+            max_results (int): Maximum number of slots to return.
+                Default: 10
+
+        Returns:
+            Dict[str, Any]: Ranked candidate slots:
+                {
+                    "timeMin": str,          # Echo of window start
+                    "timeMax": str,          # Echo of window end
+                    "duration": int,         # Meeting length in minutes
+                    "slots": [
+                        {
+                            "start": str,    # UTC, "YYYY-MM-DDTHH:MM:SSZ"
+                            "end": str,      # UTC, "YYYY-MM-DDTHH:MM:SSZ"
+                            "availableOptionalAttendees": List[str]
+                        },
+                        ...
+                    ]
+                }
+        
+        Raises:
+            Exception: With descriptive message if:
+                - No user is authenticated (via _ensure_authenticated)
+                - An attendee is unknown: "User not found: {email}"
+                - duration, step_minutes or max_results is not positive
+                - The window cannot be parsed: "Invalid window: {window}"
+                - Working hours cannot be parsed: "Invalid working_hours: {working_hours}"
+                
+        Note:
+            - Every calendar of each attendee counts toward their busy time
+            - Overlapping events, from any calendars or attendees, are merged before gaps are found
+            - Cost grows with the number of events inside the window, not with calendar size
+            - Slots never cross the end of a working-hours period
+            
+        Example:
+            >>> api = GoogleCalendarApis()
+            >>> api.authenticate("alice@example.com")
+            >>> result = api.find_meeting_slots(
+            ...     attendee_emails=["alice@example.com", "bob@example.com"],
+            ...     duration=45,
+            ...     window={"start": "2025-06-16T00:00:00", "end": "2025-06-21T00:00:00"},
+            ...     working_hours={"start": "09:00", "end": "17:00", "timeZone": "America/New_York"}
+            ... )
+            >>> for slot in result["slots"]:
+            ...     print(f"{slot['start']} - {slot['end']}")
+        """
+        self._ensure_authenticated()
+        if duration <= 0 or step_minutes <= 0 or max_results <= 0:
+            raise Exception("duration, step_minutes and max_results must be positive")
+
+        working_hours = working_hours or {}
+        primary_calendar = (self._get_user_calendars(self.current_user) or {}).get(self._resolve_calendar_id("primary"), {})
+        time_zone_name = working_hours.get("timeZone") or primary_calendar.get("timeZone")
+        if not isinstance(window, dict):
+            raise Exception(f"Invalid window: {window}")
+        time_min = _to_epoch_seconds(window.get("start"), time_zone_name)
+        time_max = _to_epoch_seconds(window.get("end"), time_zone_name)
+        if time_min is None or time_max is None:
+            raise Exception(f"Invalid window: {window}")
+
+        working_periods = [(time_min, time_max)]
+        if working_hours:
+            try:
+                day_start = datetime.strptime(working_hours.get("start", "00:00"), "%H:%M").time()
+                day_end = datetime.strptime(working_hours.get("end", "23:59"), "%H:%M").time()
+                days = {_WEEKDAYS[day] for day in working_hours.get("days", ["MO", "TU", "WE", "TH", "FR"])}
+            except (KeyError, TypeError, ValueError):
+                raise Exception(f"Invalid working_hours: {working_hours}")
+            if day_end <= day_start:
+                raise Exception(f"Invalid working_hours: {working_hours}")
+            local_zone = _time_zone(time_zone_name)
+            working_periods = []
+            day = datetime.fromtimestamp(time_min, local_zone).date()
+            last_day = datetime.fromtimestamp(time_max, local_zone).date()
+            while day <= last_day:
+                if day.weekday() in days:
+                    start = int(datetime.combine(day, day_start, local_zone).timestamp())
+                    end = int(datetime.combine(day, day_end, local_zone).timestamp())
+                    if start < time_max and end > time_min:
+                        working_periods.append((max(start, time_min), min(end, time_max)))
+                day += timedelta(days=1)
+
+        def busy_periods(email: str) -> List[List[Tuple[int, int]]]:
+            user_id = self._get_user_id_by_email(email)
+            if user_id is None:
+                raise Exception(f"User not found: {email}")
+            return [
+                self._get_event_index(user_id, calendar_id).busy_intervals(time_min, time_max)
+                for calendar_id in self._get_user_calendars(user_id) or {}
+            ]
+
+        # One sweep over every required attendee's calendars
+        busy = _merge_busy_intervals([periods for email in attendee_emails for periods in busy_periods(email)])
+        optional_busy = {
+            email: _merge_busy_intervals(busy_periods(email)) for email in optional_attendee_emails or []
+        }
+        optional_ends = {email: [end for _, end in periods] for email, periods in optional_busy.items()}
+
+        length, step = int(duration * 60), int(step_minutes * 60)
+        candidates = []
+        for gap_start, gap_end in _subtract_intervals(working_periods, busy):
+            for start in range(gap_start, gap_end - length + 1, step):
+                end = start + length
+                available = []
+                for email, periods in optional_busy.items():
+                    # First busy period ending after the slot starts; free if it starts after the slot ends
+                    position = bisect.bisect_right(optional_ends[email], start)
+                    if position == len(periods) or periods[position][0] >= end:
+                        available.append(email)
+                candidates.append((-len(available), start, end, available))
+
+        return {
+            "timeMin": window["start"],
+            "timeMax": window["end"],
+            "duration": duration,
+            "slots": [
+                {"start": _format_epoch(start), "end": _format_epoch(end), "availableOptionalAttendees": available}
+                for _, start, end, available in heapq.nsmallest(max_results, candidates, key=lambda slot: slot[:2])
+            ],
+        }
+
     def reset_data(self) -> Dict[str, bool]:
         """
         Resets all calendar data to the default initial state.
@@ -6,13 +6,415 @@ Inspired by https://developers.google.com/workspace/drive/api/reference/rest/v3
 insert_file is more descriptive than post_file))
 """
 import copy
+import re
 import uuid
-from typing import Dict, Union, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Union, Any, Optional, List, Set, Tuple
 from datetime import datetime
 from state_loader import load_default_state
 
 DEFAULT_STATE = load_default_state("GoogleDriveApis")
 
+_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+_QUERY_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<string>'(?:[^'\\]|\\.)*')|(?P<operator>!=|<=|>=|=|<|>|\(|\))|(?P<word>[A-Za-z_][A-Za-z0-9_]*|-?\d+(?:\.\d+)?))"
+)
+_QUERY_KEYWORDS = {"and", "or", "not", "in", "contains", "true", "false"}
+_COMPARISON_OPERATORS = {"=", "!=", "<", "<=", ">", ">=", "contains"}
+_QUERY_FIELDS = {
+    "name": {"=", "!=", "contains"},
+    "fullText": {"contains"},
+    "mimeType": {"=", "!=", "contains"},
+    "modifiedTime": {"=", "!=", "<", "<=", ">", ">="},
+    "createdTime": {"=", "!=", "<", "<=", ">", ">="},
+    "viewedByMeTime": {"=", "!=", "<", "<=", ">", ">="},
+    "trashed": {"=", "!="},
+    "starred": {"=", "!="},
+    "shared": {"=", "!="},
+}
+_COLLECTION_FIELDS = {"parents", "owners", "writers", "readers"}
+_TIME_FIELDS = {"modifiedTime", "createdTime", "viewedByMeTime"}
+_BOOLEAN_FIELDS = {"trashed", "starred", "shared"}
+# Owner entries without a "role" are owners; create_permission records the granted role.
+_COLLECTION_ROLES = {
+    "owners": {"owner"},
+    "writers": {"owner", "organizer", "fileOrganizer", "writer"},
+    "readers": {"owner", "organizer", "fileOrganizer", "writer", "commenter", "reader"},
+}
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    """
+    Convert a stored or queried time (epoch number or RFC 3339 string) to epoch seconds.
+    
+    Strings ending in "Z" are read the way _timestamp_to_rfc3339 writes them, so a value
+    copied out of a file listing compares equal to the stored time. Returns None if unparseable.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value).timestamp()
+    except ValueError:
+        return None
+
+
+def _tokenize_query(q: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    position = 0
+    text = q.rstrip()
+    while position < len(text):
+        match = _QUERY_TOKEN_PATTERN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"unexpected character at position {position}")
+        position = match.end()
+        if match.group("string") is not None:
+            tokens.append(("string", re.sub(r"\\(.)", r"\1", match.group("string")[1:-1])))
+        elif match.group("operator") is not None:
+            tokens.append(("operator", match.group("operator")))
+        else:
+            word = match.group("word")
+            lowered = word.lower()
+            if lowered in _QUERY_KEYWORDS:
+                tokens.append(("keyword", lowered))
+            elif word[0].isdigit() or word[0] == "-":
+                tokens.append(("number", float(word)))
+            else:
+                tokens.append(("field", word))
+    return tokens
+
+
+class _QueryParser:
+    """
+    Recursive-descent parser for the Drive query language.
+    
+    Produces a plan of nested tuples: ("and", children), ("or", children), ("not", child),
+    ("compare", field, operator, value) and ("in", field, value).
+    """
+
+    def __init__(self, q: str):
+        self.tokens = _tokenize_query(q)
+        self.position = 0
+
+    def _peek(self) -> Optional[Tuple[str, Any]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self) -> Tuple[str, Any]:
+        token = self._peek()
+        if token is None:
+            raise ValueError("unexpected end of query")
+        self.position += 1
+        return token
+
+    def _accept(self, kind: str, value: Any) -> bool:
+        if self._peek() == (kind, value):
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> Tuple:
+        plan = self._parse_or()
+        if self._peek() is not None:
+            raise ValueError(f"unexpected {self._peek()[1]!r}")
+        return plan
+
+    def _parse_or(self) -> Tuple:
+        children = [self._parse_and()]
+        while self._accept("keyword", "or"):
+            children.append(self._parse_and())
+        return children[0] if len(children) == 1 else ("or", tuple(children))
+
+    def _parse_and(self) -> Tuple:
+        children = [self._parse_unary()]
+        while self._accept("keyword", "and"):
+            children.append(self._parse_unary())
+        return children[0] if len(children) == 1 else ("and", tuple(children))
+
+    def _parse_unary(self) -> Tuple:
+        if self._accept("keyword", "not"):
+            return ("not", self._parse_unary())
+        if self._accept("operator", "("):
+            plan = self._parse_or()
+            if not self._accept("operator", ")"):
+                raise ValueError("missing closing parenthesis")
+            return plan
+        return self._parse_term()
+
+    def _parse_value(self) -> Any:
+        kind, value = self._take()
+        if kind in ("string", "number"):
+            return value
+        if kind == "keyword" and value in ("true", "false"):
+            return value == "true"
+        raise ValueError(f"expected a value, got {value!r}")
+
+    def _parse_term(self) -> Tuple:
+        kind, value = self._peek() or (None, None)
+        if kind == "string":
+            self._take()
+            if not self._accept("keyword", "in"):
+                raise ValueError(f"expected 'in' after {value!r}")
+            kind, field = self._take()
+            if kind != "field" or field not in _COLLECTION_FIELDS:
+                raise ValueError(f"cannot use 'in' with {field!r}")
+            return ("in", field, value)
+        if kind != "field":
+            raise ValueError(f"expected a field name, got {value!r}")
+        field = self._take()[1]
+        if field not in _QUERY_FIELDS:
+            raise ValueError(f"unknown field {field!r}")
+        if field in _BOOLEAN_FIELDS and (self._peek() or (None, None))[1] not in _COMPARISON_OPERATORS:
+            # A bare boolean field such as "not trashed" means "trashed = true"
+            return ("compare", field, "=", True)
+        kind, operator = self._take()
+        if kind not in ("operator", "keyword") or operator not in _COMPARISON_OPERATORS:
+            raise ValueError(f"expected an operator after {field!r}")
+        if operator not in _QUERY_FIELDS[field]:
+            raise ValueError(f"operator {operator!r} is not supported for {field!r}")
+        value = self._parse_value()
+        if field in _TIME_FIELDS:
+            value = _to_timestamp(value)
+            if value is None:
+                raise ValueError(f"invalid time for {field!r}")
+        elif field in _BOOLEAN_FIELDS and not isinstance(value, bool):
+            raise ValueError(f"{field!r} must be compared with true or false")
+        elif field not in _BOOLEAN_FIELDS and not isinstance(value, str):
+            raise ValueError(f"{field!r} must be compared with a string")
+        return ("compare", field, operator, value)
+
+
+@lru_cache(maxsize=256)
+def _compile_query(q: str) -> Tuple:
+    """Parse a Drive query into a plan; plans are cached so repeated queries skip parsing."""
+    return _QueryParser(q).parse()
+
+
+def _is_indexed(plan: Tuple) -> bool:
+    """Whether a plan can be answered from _FileIndex sets alone, without looking at files."""
+    kind = plan[0]
+    if kind in ("and", "or"):
+        return all(_is_indexed(child) for child in plan[1])
+    if kind == "not":
+        return _is_indexed(plan[1])
+    if kind == "in":
+        return plan[1] == "parents"
+    field, operator = plan[1], plan[2]
+    return (field == "mimeType" and operator in ("=", "!=")) or field in ("trashed", "starred")
+
+
+def _compare(left: Any, operator: str, right: Any) -> bool:
+    if operator == "=":
+        return left == right
+    if operator == "!=":
+        return left != right
+    if left is None:
+        return False
+    if operator == "<":
+        return left < right
+    if operator == "<=":
+        return left <= right
+    if operator == ">":
+        return left > right
+    return left >= right
+
+
+def _file_matches(plan: Tuple, file_data: Dict[str, Any], user_email: Optional[str]) -> bool:
+    """Evaluate a plan against a single file."""
+    kind = plan[0]
+    if kind == "and":
+        return all(_file_matches(child, file_data, user_email) for child in plan[1])
+    if kind == "or":
+        return any(_file_matches(child, file_data, user_email) for child in plan[1])
+    if kind == "not":
+        return not _file_matches(plan[1], file_data, user_email)
+    if kind == "in":
+        field, value = plan[1], plan[2]
+        if field == "parents":
+            return value in (file_data.get("parents") or [])
+        if value == "me":
+            value = user_email
+        roles = _COLLECTION_ROLES[field]
+        return any(
+            owner.get("emailAddress") == value and owner.get("role", "owner") in roles
+            for owner in file_data.get("owners") or []
+        )
+    field, operator, value = plan[1], plan[2], plan[3]
+    if field == "fullText":
+        text = f"{file_data.get('name', '')}\n{file_data.get('description', '')}".lower()
+        return value.lower() in text
+    if field in _TIME_FIELDS:
+        return _compare(_to_timestamp(file_data.get(field)), operator, value)
+    if field in _BOOLEAN_FIELDS:
+        return _compare(bool(file_data.get(field, False)), operator, value)
+    actual = file_data.get(field, "")
+    if operator == "contains":
+        return value.lower() in actual.lower()
+    return _compare(actual, operator, value)
+
+
+def _file_size(file_data: Dict[str, Any]) -> int:
+    """Size of a file in bytes; sizes are stored as strings by create_file and as ints in scenarios."""
+    size = file_data.get("size", 0)
+    return int(size) if isinstance(size, str) else (size or 0)
+
+
+class _FileIndex:
+    """
+    Secondary indexes over one user's files: by parent (the folder tree's children index), by
+    MIME type, and the sets of trashed and starred files. Each file's indexed values are
+    remembered so it can be re-indexed after an in-place update.
+    
+    subtree_bytes holds, for every folder ID (including "root"), the total size of the files
+    below it. Adding or removing a file adjusts each of its ancestors once, so re-indexing a
+    moved folder updates both ancestor chains by the folder's whole total without visiting its
+    contents. A file with several parents counts toward each of them.
+    """
+
+    __slots__ = (
+        "by_parent", "by_mime_type", "trashed", "starred", "order", "subtree_bytes", "_entries", "_sequence"
+    )
+
+    def __init__(self):
+        self.by_parent: Dict[str, Set[str]] = {}
+        self.by_mime_type: Dict[str, Set[str]] = {}
+        self.trashed: Set[str] = set()
+        self.starred: Set[str] = set()
+        self.order: Dict[str, int] = {}  # file ID -> insertion position, for stable listing order
+        self.subtree_bytes: Dict[str, int] = {}
+        self._entries: Dict[str, Tuple[Tuple[str, ...], Any, int]] = {}
+        self._sequence = 0
+
+    def parents_of(self, file_id: str) -> Tuple[str, ...]:
+        entry = self._entries.get(file_id)
+        return entry[0] if entry else ()
+
+    def ancestors(self, parents: Tuple[str, ...]) -> Set[str]:
+        """All folder IDs above a file with the given parents, each counted once."""
+        seen = set()
+        pending = list(parents)
+        while pending:
+            folder_id = pending.pop()
+            if folder_id not in seen:
+                seen.add(folder_id)
+                pending.extend(self.parents_of(folder_id))
+        return seen
+
+    def descendants(self, folder_id: str) -> List[str]:
+        """IDs below a folder, parents before their children; visits only the subtree."""
+        seen = {folder_id}
+        result = []
+        pending = [folder_id]
+        while pending:
+            for child_id in sorted(self.by_parent.get(pending.pop(), ()), key=self.order.__getitem__):
+                if child_id not in seen:
+                    seen.add(child_id)
+                    result.append(child_id)
+                    pending.append(child_id)
+        return result
+
+    def _adjust_ancestors(self, parents: Tuple[str, ...], delta: int) -> None:
+        if not delta:
+            return
+        for folder_id in self.ancestors(parents):
+            self.subtree_bytes[folder_id] = self.subtree_bytes.get(folder_id, 0) + delta
+
+    def add(self, file_id: str, file_data: Dict[str, Any]) -> None:
+        self.discard(file_id, keep_order=True)
+        parents = tuple(file_data.get("parents") or ())
+        mime_type = file_data.get("mimeType")
+        size = _file_size(file_data)
+        for parent in parents:
+            self.by_parent.setdefault(parent, set()).add(file_id)
+        self.by_mime_type.setdefault(mime_type, set()).add(file_id)
+        if file_data.get("trashed", False):
+            self.trashed.add(file_id)
+        if file_data.get("starred", False):
+            self.starred.add(file_id)
+        self._entries[file_id] = (parents, mime_type, size)
+        self._adjust_ancestors(parents, size + self.subtree_bytes.get(file_id, 0))
+        if file_id not in self.order:
+            self.order[file_id] = self._sequence
+            self._sequence += 1
+
+    def discard(self, file_id: str, keep_order: bool = False) -> None:
+        entry = self._entries.pop(file_id, None)
+        if entry is None:
+            return
+        parents, mime_type, size = entry
+        self._adjust_ancestors(parents, -(size + self.subtree_bytes.get(file_id, 0)))
+        for parent in parents:
+            children = self.by_parent.get(parent)
+            if children is not None:
+                children.discard(file_id)
+                if not children:
+                    del self.by_parent[parent]
+        same_type = self.by_mime_type.get(mime_type)
+        if same_type is not None:
+            same_type.discard(file_id)
+            if not same_type:
+                del self.by_mime_type[mime_type]
+        self.trashed.discard(file_id)
+        self.starred.discard(file_id)
+        if not keep_order:
+            self.order.pop(file_id, None)
+            if not self.subtree_bytes.get(file_id):
+                self.subtree_bytes.pop(file_id, None)
+
+    def lookup(self, plan: Tuple, universe: Any) -> Set[str]:
+        """Answer an indexed plan (see _is_indexed) as a set of file IDs."""
+        kind = plan[0]
+        if kind == "and":
+            sets = sorted((self.lookup(child, universe) for child in plan[1]), key=len)
+            return set.intersection(*sets)
+        if kind == "or":
+            return set().union(*(self.lookup(child, universe) for child in plan[1]))
+        if kind == "not":
+            return universe - self.lookup(plan[1], universe)
+        if kind == "in":
+            return set(self.by_parent.get(plan[2], ()))
+        field, operator, value = plan[1], plan[2], plan[3]
+        if field == "mimeType":
+            matches = set(self.by_mime_type.get(value, ()))
+        else:
+            flagged = self.trashed if field == "trashed" else self.starred
+            matches = set(flagged) if value else universe - flagged
+        return matches if operator == "=" else universe - matches
+
+
+def _run_query(plan: Tuple, index: _FileIndex, files: Dict[str, Dict[str, Any]], user_email: Optional[str]) -> Set[str]:
+    """
+    Evaluate a plan against a user's files.
+    
+    Indexed clauses are answered from the index; within an "and", their sets are intersected
+    smallest first and the remaining clauses only filter those candidates. Only clauses with
+    no usable index (name, fullText, times, owners, ...) look at file contents.
+    """
+    universe = files.keys()
+    if _is_indexed(plan):
+        return index.lookup(plan, universe)
+    kind = plan[0]
+    if kind == "and":
+        indexed = [child for child in plan[1] if _is_indexed(child)]
+        filters = [child for child in plan[1] if not _is_indexed(child)]
+        if indexed:
+            candidates = index.lookup(("and", tuple(indexed)), universe) if len(indexed) > 1 else index.lookup(indexed[0], universe)
+        else:
+            candidates = _run_query(filters.pop(0), index, files, user_email)
+        return {
+            file_id for file_id in candidates
+            if all(_file_matches(child, files[file_id], user_email) for child in filters)
+        }
+    if kind == "or":
+        return set().union(*(_run_query(child, index, files, user_email) for child in plan[1]))
+    if kind == "not":
+        return universe - _run_query(plan[1], index, files, user_email)
+    return {file_id for file_id, file_data in files.items() if _file_matches(plan, file_data, user_email)}
+
+
 class GoogleDriveApis:
     """
     A API class for simulating Google Drive operations.
@@ -101,6 +503,7 @@ class GoogleDriveApis:
         """
         DEFAULT_STATE_COPY = copy.deepcopy(scenario)
         self.users = DEFAULT_STATE_COPY.get("users", {})
+        self._file_indexes = {}  # user_id -> _FileIndex, built on first query
         # Set first user as authenticated user by default
         if self.users and not self.current_user:
             self.current_user = next(iter(self.users.keys()))
@@ -402,6 +805,62 @@ class GoogleDriveApis:
         drive_data = self._get_user_drive_data(user_id)
         return drive_data.get("files") if drive_data else None
 
+    def _get_file_index(self, user_id: str) -> _FileIndex:
+        """
+        Returns the query and folder-tree index for a user's files, building it on first use.
+        
+        Mutating methods keep the index in step through _reindex_file, so after the first
+        use it is never rebuilt.
+        """
+        index = self._file_indexes.get(user_id)
+        if index is None:
+            index = _FileIndex()
+            for file_id, file_data in (self._get_user_files(user_id) or {}).items():
+                index.add(file_id, file_data)
+            self._file_indexes[user_id] = index
+        return index
+
+    def _reindex_file(self, user_id: str, file_id: str) -> None:
+        """Refreshes a file's index entries after it was created, changed or deleted."""
+        index = self._file_indexes.get(user_id)
+        if index is None:
+            return
+        file_data = (self._get_user_files(user_id) or {}).get(file_id)
+        if file_data is None:
+            index.discard(file_id)
+        else:
+            index.add(file_id, file_data)
+
+    def _cascade_trash(self, user_id: str, folder_id: str, trashed: bool) -> None:
+        """
+        Applies a folder's trash or restore to everything below it.
+        
+        Items trashed along with a folder get explicitlyTrashed=False so that restoring the
+        folder brings back exactly those; items that were trashed on their own, and anything
+        below them, stay in the trash.
+        """
+        files = self._get_user_files(user_id)
+        index = self._get_file_index(user_id)
+        still_trashed = set()
+        for file_id in index.descendants(folder_id):
+            file_data = files[file_id]
+            if trashed:
+                if file_data.get("trashed", False):
+                    continue
+                file_data["trashed"] = True
+                file_data["explicitlyTrashed"] = False
+            else:
+                if (
+                    file_data.get("explicitlyTrashed", True)
+                    or any(parent in still_trashed for parent in index.parents_of(file_id))
+                ):
+                    if file_data.get("trashed", False):
+                        still_trashed.add(file_id)
+                    continue
+                file_data["trashed"] = False
+                del file_data["explicitlyTrashed"]
+            index.add(file_id, file_data)
+
     def _get_user_info(self, user_id: str) -> Optional[Dict]:
         """
         Retrieves a user's Drive profile information and storage quota.
@@ -562,15 +1021,20 @@ class GoogleDriveApis:
 
         Args:
             q (Optional[str]): Query string for filtering results using Google Drive query syntax.
-                Supported query formats:
-                - "name contains 'text'": Files with text in name (case-insensitive)
-                - "trashed = true": Only trashed files
-                - "trashed = false": Only non-trashed files (default behavior)
-                - "starred = true": Only starred files
-                - "shared = true" or "'me' in owners": Shared files
-                - "mimeType = 'type'": Files of specific MIME type
+                Terms can be combined with "and", "or", "not" and parentheses.
+                Supported terms:
+                - "name = 'text'", "name != 'text'", "name contains 'text'" (contains is case-insensitive)
+                - "fullText contains 'text'": Text in name or description
+                - "mimeType = 'type'", "mimeType != 'type'", "mimeType contains 'text'"
+                - "modifiedTime > '2024-01-01T00:00:00'": Also createdTime and viewedByMeTime,
+                  with =, !=, <, <=, > and >=
+                - "trashed = true", "starred = true", "shared = true" (or false, with = or !=);
+                  a bare "trashed", "starred" or "shared" means "= true", so "not trashed" works
                 - "'parent-id' in parents": Files in specific folder
-                Example: "name contains 'project' and trashed = false"
+                - "'user@example.com' in owners": Also writers and readers; 'me' is the
+                  authenticated user
+                String values use single quotes; escape a quote inside them as \\'.
+                Example: "(name contains 'project' or starred = true) and trashed = false"
                 Default: None (returns all non-trashed files)
             page_size (int): Maximum number of files to return per page.
                 Valid range: 1-1000
@@ -623,10 +1087,14 @@ class GoogleDriveApis:
                 
         Raises:
             Exception: If no user is authenticated (via _ensure_authenticated)
+            Exception: If q is not a valid query ("Invalid query: ...")
             
         Note:
             - Timestamps are automatically converted to RFC3339 format
             - Default behavior excludes trashed files unless explicitly requested
+            - Parsed queries are cached; parents, mimeType, trashed and starred terms are
+              answered from per-user indexes, other terms only filter the indexed candidates
+            - Without order_by, files are listed in the order they were added
             - Pagination tokens are simple string indices (not opaque tokens)
             - Files are deep copied to prevent accidental modifications
             - Query parsing supports subset of Google Drive query syntax
@@ -667,48 +1135,17 @@ class GoogleDriveApis:
                 "files": []
             }
 
-        all_files = list(files.values())
-        filtered_files = []
-
-        if q:
-            # Enhanced query parsing to support multiple Google Drive query formats
-            if "name contains '" in q and q.endswith("'"):
-                search_term = q.split("name contains '")[1][:-1].lower()
-                for file_data in all_files:
-                    if search_term in file_data.get("name", "").lower():
-                        filtered_files.append(file_data)
-            elif "trashed = true" in q.lower():
-                for file_data in all_files:
-                    if file_data.get("trashed", False):
-                        filtered_files.append(file_data)
-            elif "trashed = false" in q.lower():
-                for file_data in all_files:
-                    if not file_data.get("trashed", False):
-                        filtered_files.append(file_data)
-            elif "starred = true" in q.lower():
-                for file_data in all_files:
-                    if file_data.get("starred", False):
-                        filtered_files.append(file_data)
-            elif "shared = true" in q.lower() or "'me' in owners" in q.lower():
-                for file_data in all_files:
-                    if file_data.get("shared", False):
-                        filtered_files.append(file_data)
-            elif "mimeType = '" in q and q.endswith("'"):
-                mime_type = q.split("mimeType = '")[1][:-1]
-                for file_data in all_files:
-                    if file_data.get("mimeType") == mime_type:
-                        filtered_files.append(file_data)
-            elif "'" in q and "' in parents" in q:
-                parent_id = q.split("'")[1]
-                for file_data in all_files:
-                    if parent_id in file_data.get("parents", []):
-                        filtered_files.append(file_data)
-            else:
-                # If query format is not recognized, return all files
-                filtered_files = all_files
+        index = self._get_file_index(user_id)
+        if q and q.strip():
+            try:
+                plan = _compile_query(q)
+            except ValueError as e:
+                raise Exception(f"Invalid query: {e}")
         else:
             # Default: exclude trashed files unless specifically requested
-            filtered_files = [f for f in all_files if not f.get("trashed", False)]
+            plan = ("compare", "trashed", "=", False)
+        matched_ids = _run_query(plan, index, files, self._get_user_email_by_id(user_id))
+        filtered_files = [files[file_id] for file_id in sorted(matched_ids, key=index.order.__getitem__)]
 
         # Apply ordering
         if order_by:
@@ -1038,7 +1475,7 @@ class GoogleDriveApis:
                 "emailAddress": user_email,
                 "me": True
             }],
-            "parents": parents if parents is not None else ["root"],
+            "parents": list(parents) if parents is not None else ["root"],
             "size": "0",
             "starred": starred,
             "trashed": False,
@@ -1059,6 +1496,7 @@ class GoogleDriveApis:
             new_file["description"] = description
         
         files[new_file_id] = new_file
+        self._reindex_file(user_id, new_file_id)
         
         # Update storage quota
         if user_info and "storage_quota" in user_info:
@@ -1133,11 +1571,14 @@ class GoogleDriveApis:
                 - No user is authenticated (via _ensure_authenticated)
                 - User data not found: "User data not found"
                 - File not found: "File not found: {fileId}"
+                - addParents would put a folder inside itself or one of its subfolders
                 
         Side Effects:
             - Modifies specified file properties in backend storage
             - Updates file's modifiedTime to current timestamp
             - Updates file's viewedByMeTime to current timestamp
+            - Trashing a folder also trashes everything below it (marked explicitlyTrashed=False);
+              restoring it restores only those items, leaving ones trashed on their own in the trash
             - Ensures parents list always contains at least one parent (defaults to "root")
             - Converts parents to list if stored as single string
             - Prints confirmation message with file ID and user email
@@ -1187,6 +1628,12 @@ class GoogleDriveApis:
             raise Exception(f"File not found: {fileId}")
 
         file = files[fileId]
+
+        if addParents:
+            index = self._get_file_index(user_id)
+            for parent in addParents.split(','):
+                if fileId in index.ancestors((parent,)):
+                    raise Exception(f"Cannot move '{fileId}' into itself or one of its subfolders")
         
         file["modifiedTime"] = self._rfc3339_now()
         file["viewedByMeTime"] = self._rfc3339_now()
@@ -1201,6 +1648,10 @@ class GoogleDriveApis:
             file["starred"] = starred
         if trashed is not None:
             file["trashed"] = trashed
+            if trashed:
+                file["explicitlyTrashed"] = True
+            else:
+                file.pop("explicitlyTrashed", None)
 
         # Ensure parents is always a list
         if "parents" not in file:
@@ -1221,6 +1672,9 @@ class GoogleDriveApis:
             if not file["parents"]:
                 file["parents"] = ["root"]
 
+        self._reindex_file(user_id, fileId)
+        if trashed is not None:
+            self._cascade_trash(user_id, fileId, trashed)
         user_email_display = self._get_user_email_by_id(user_id)
         print(f"File '{fileId}' updated for {user_email_display}")
         
@@ -1252,7 +1706,8 @@ class GoogleDriveApis:
                 
         Side Effects:
             - Permanently removes file from backend storage
-            - Decreases user's storage quota (used bytes) by file size
+            - If the file is a folder, also removes every file and folder below it
+            - Decreases user's storage quota (used bytes) by the total size removed
             - All file data is lost (metadata, content references, permissions)
             - Cannot be undone or recovered
             - Prints confirmation message with file ID and user email
@@ -1289,14 +1744,22 @@ class GoogleDriveApis:
         if fileId not in files:
             raise Exception(f"File not found: {fileId}")
 
-        deleted_file_size = int(files[fileId].get("size", "0")) if isinstance(files[fileId].get("size"), str) else files[fileId].get("size", 0)
-        del files[fileId]
+        # Deleting a folder deletes everything below it; children go before their parents
+        index = self._get_file_index(user_id)
+        deleted_ids = [fileId] + index.descendants(fileId)
+        deleted_file_size = 0
+        for deleted_id in reversed(deleted_ids):
+            deleted_file_size += _file_size(files.pop(deleted_id))
+            index.discard(deleted_id)
 
         if user_info and "storage_quota" in user_info:
             user_info["storage_quota"]["used"] -= deleted_file_size
 
         user_email = self._get_user_email_by_id(user_id)
-        print(f"File '{fileId}' deleted for {user_email}")
+        if len(deleted_ids) > 1:
+            print(f"File '{fileId}' and {len(deleted_ids) - 1} items inside it deleted for {user_email}")
+        else:
+            print(f"File '{fileId}' deleted for {user_email}")
 
     def copy_file(
         self,
@@ -1418,13 +1881,14 @@ class GoogleDriveApis:
         copied_file["createdTime"] = current_time_rfc
         copied_file["modifiedTime"] = current_time_rfc
         copied_file["viewedByMeTime"] = current_time_rfc
-        copied_file["parents"] = parents if parents is not None else original_file.get("parents", ["root"])
+        copied_file["parents"] = list(parents if parents is not None else original_file.get("parents", ["root"]))
         copied_file["shared"] = False  # Reset sharing for copy
         
         if description is not None:
             copied_file["description"] = description
 
         files[new_file_id] = copied_file
+        self._reindex_file(user_id, new_file_id)
 
         # Update storage quota with proper error checking
         user_drive_data = self.users[user_id].get("drive_data")
@@ -1809,7 +2273,94 @@ class GoogleDriveApis:
         """
         return self.create_file(
             name=name,
-            mimeType="application/vnd.google-apps.folder",
+            mimeType=_FOLDER_MIME_TYPE,
             parents=parents,
             description=description
-        )
\ No newline at end of file
+        )
+
+    def resolve_path(self, path: str) -> Dict[str, Any]:
+        """
+        Finds a file or folder in the authenticated user's Drive by its path.
+        
+        Walks the folder tree from "My Drive" one path segment at a time, looking only at the
+        children of the folder reached so far. Trashed items are skipped; if a folder holds
+        several items with the same name, the one added first wins.
+
+        Args:
+            path (str): Slash-separated names starting from "My Drive".
+                Example: "/Projects/2025/Report.pdf", "Projects/2025"
+
+        Returns:
+            Dict[str, Any]: The file resource, as returned by get_file(). For "/" a minimal
+                resource for the root folder is returned: {"kind", "id": "root", "name", "mimeType"}.
+                
+        Raises:
+            Exception: With descriptive message if:
+                - No user is authenticated (via _ensure_authenticated)
+                - User data not found: "User data not found"
+                - A segment does not exist: "Path not found: {path}"
+            
+        Example:
+            >>> api = GoogleDriveApis()
+            >>> api.authenticate("alice@example.com")
+            >>> report = api.resolve_path("/Projects/2025/Report.pdf")
+            >>> print(report['id'])
+        """
+        user_id = self._ensure_authenticated()
+        files = self._get_user_files(user_id)
+
+        if files is None:
+            raise Exception("User data not found")
+
+        index = self._get_file_index(user_id)
+        current_id = "root"
+        for name in [segment for segment in path.split("/") if segment]:
+            matches = [
+                child_id for child_id in index.by_parent.get(current_id, ())
+                if files[child_id].get("name") == name and not files[child_id].get("trashed", False)
+            ]
+            if not matches:
+                raise Exception(f"Path not found: {path}")
+            current_id = min(matches, key=index.order.__getitem__)
+
+        if current_id == "root":
+            return {"kind": "drive#file", "id": "root", "name": "My Drive", "mimeType": _FOLDER_MIME_TYPE}
+        return self.get_file(current_id)
+
+    def get_folder_size(self, folderId: str) -> Dict[str, Any]:
+        """
+        Returns the total size of everything inside a folder, including nested folders.
+        
+        Totals are kept up to date as files are created, copied, moved and deleted, so this
+        does not walk the folder. Trashed items still count, as they do toward storage quota;
+        for "root" the total matches storage_quota.used when every file lives under My Drive.
+
+        Args:
+            folderId (str): The folder ID, or "root" for My Drive.
+
+        Returns:
+            Dict[str, Any]: {"id": str, "size": str}, with size in bytes as a string like file sizes.
+                
+        Raises:
+            Exception: With descriptive message if:
+                - No user is authenticated (via _ensure_authenticated)
+                - User data not found: "User data not found"
+                - folderId is not a folder: "Folder not found: {folderId}"
+            
+        Example:
+            >>> api = GoogleDriveApis()
+            >>> api.authenticate("alice@example.com")
+            >>> api.get_folder_size("root")
+            {'id': 'root', 'size': '52428800'}
+        """
+        user_id = self._ensure_authenticated()
+        files = self._get_user_files(user_id)
+
+        if files is None:
+            raise Exception("User data not found")
+
+        if folderId != "root" and files.get(folderId, {}).get("mimeType") != _FOLDER_MIME_TYPE:
+            raise Exception(f"Folder not found: {folderId}")
+
+        index = self._get_file_index(user_id)
+        return {"id": folderId, "size": str(index.subtree_bytes.get(folderId, 0))}
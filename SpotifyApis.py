@@ -1,10 +1,393 @@
+import bisect
 import datetime
 import copy
+import difflib
+import heapq
+import itertools
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from state_loader import load_default_state
 
 DEFAULT_STATE = load_default_state("SpotifyApis")
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict used for cached enriched entities. Behaves like a normal dict for reads,
+    equality and JSON serialization, but rejects in-place mutation so a shared cached object
+    cannot be corrupted by a caller. copy.deepcopy() returns an ordinary, mutable dict.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Enriched Spotify objects are read-only; use copy.deepcopy() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list counterpart of _FrozenDict for list values inside cached entities."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Enriched Spotify objects are read-only; use copy.deepcopy() for a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively converts dicts and lists into their read-only counterparts."""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+class _TrackChunkBranch:
+    """Internal node of _PlaylistTracks: child nodes plus their cumulative item counts."""
+
+    __slots__ = ("children", "ends")
+
+    def __init__(self, children: Tuple[Any, ...]):
+        self.children = children
+        ends = []
+        total = 0
+        for child in children:
+            total += len(child) if isinstance(child, tuple) else child.ends[-1]
+            ends.append(total)
+        self.ends = tuple(ends)
+
+
+class _TrackLocator:
+    """
+    Lookup side-table for one _PlaylistTracks version: the leaves holding each track ID, and
+    each node's parent with its index there. A track's position is the sum of the left
+    siblings' counts up its parent chain, so finding it costs O(log n) per leaf holding it.
+    """
+
+    __slots__ = ("leaves_by_track", "parents")
+
+    def __init__(self, root: Any):
+        self.leaves_by_track: Dict[str, Dict[int, Tuple[str, ...]]] = {}
+        self.parents: Dict[int, Tuple[_TrackChunkBranch, int]] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self._add(node)
+            if not isinstance(node, tuple):
+                stack.extend(node.children)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self.leaves_by_track
+
+    def _add(self, node: Any) -> None:
+        if isinstance(node, tuple):
+            for track_id in node:
+                self.leaves_by_track.setdefault(track_id, {})[id(node)] = node
+        else:
+            for i, child in enumerate(node.children):
+                self.parents[id(child)] = (node, i)
+
+    def _remove(self, node: Any) -> None:
+        self.parents.pop(id(node), None)
+        if isinstance(node, tuple):
+            for track_id in set(node):
+                leaves = self.leaves_by_track[track_id]
+                del leaves[id(node)]
+                if not leaves:
+                    del self.leaves_by_track[track_id]
+
+    def update(self, removed: List[Any], created: List[Any], root: Any) -> None:
+        """Applies an edit: nodes that left the tree and nodes that joined it (transient ones cancel out)."""
+        removed_ids = {id(node) for node in removed}
+        created_ids = {id(node) for node in created}
+        for node in removed:
+            if id(node) not in created_ids:
+                self._remove(node)
+        for node in created:
+            if id(node) not in removed_ids:
+                self._add(node)
+        self.parents.pop(id(root), None)
+
+    def first(self, track_id: object) -> int:
+        leaves = self.leaves_by_track.get(track_id)
+        if not leaves:
+            return -1
+        positions = []
+        for leaf in leaves.values():
+            position = leaf.index(track_id)
+            node = leaf
+            while id(node) in self.parents:
+                node, i = self.parents[id(node)]
+                if i:
+                    position += node.ends[i - 1]
+            positions.append(position)
+        return min(positions)
+
+
+class _PlaylistTracks:
+    """
+    Immutable, structurally shared sequence of track IDs used for playlist contents.
+
+    Track IDs live in leaf chunks (tuples of up to LEAF_SIZE IDs) under a B-tree of branch
+    nodes holding up to FANOUT children and their cumulative counts. Positional insert and
+    delete return a new _PlaylistTracks that copies only the O(log n) nodes on the path to the
+    edit; every other chunk is shared with the previous version. That makes it cheap to keep
+    each playlist snapshot and to diff two of them (shared chunks are skipped by identity).
+    Deletes merge a leaf or branch left less than half full into a neighbour, so the tree
+    stays O(log n) deep under churn.
+
+    Membership and index() go through a _TrackLocator built on first use. An edit hands the
+    locator on to the new version, updated for just the nodes it replaced; the old version
+    rebuilds its own if it is searched again.
+    """
+
+    LEAF_SIZE = 64
+    FANOUT = 32
+
+    __slots__ = ("_root", "_locator")
+
+    def __init__(self, track_ids: Iterable[str] = ()):
+        items = tuple(track_ids)
+        nodes: List[Any] = [items[i:i + self.LEAF_SIZE] for i in range(0, len(items), self.LEAF_SIZE)]
+        self._root = self._build_root(nodes)
+        self._locator: Optional[_TrackLocator] = None
+
+    @classmethod
+    def _from_root(cls, root: Any, locator: Optional[_TrackLocator] = None) -> "_PlaylistTracks":
+        tracks = cls.__new__(cls)
+        tracks._root = root
+        tracks._locator = locator
+        return tracks
+
+    def _with_root(self, root: Any, removed: List[Any], created: List[Any]) -> "_PlaylistTracks":
+        """Returns the edited version, moving this version's locator (if built) over to it."""
+        locator, self._locator = self._locator, None
+        if locator is not None:
+            locator.update(removed, created, root)
+        return self._from_root(root, locator)
+
+    def _locate(self) -> _TrackLocator:
+        if self._locator is None:
+            self._locator = _TrackLocator(self._root)
+        return self._locator
+
+    @classmethod
+    def _build_root(cls, nodes: List[Any], created: Optional[List[Any]] = None) -> Any:
+        """Stacks sibling nodes into branches until a single root remains."""
+        if not nodes:
+            return ()
+        while len(nodes) > 1:
+            nodes = [_TrackChunkBranch(tuple(nodes[i:i + cls.FANOUT])) for i in range(0, len(nodes), cls.FANOUT)]
+            if created is not None:
+                created.extend(nodes)
+        return nodes[0]
+
+    def __len__(self) -> int:
+        return len(self._root) if isinstance(self._root, tuple) else self._root.ends[-1]
+
+    def __iter__(self) -> Iterator[str]:
+        for leaf in self.leaves():
+            yield from leaf
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._locate()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _PlaylistTracks):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"_PlaylistTracks({list(self)!r})"
+
+    def __copy__(self) -> "_PlaylistTracks":
+        return self
+
+    def __deepcopy__(self, memo) -> "_PlaylistTracks":
+        return self
+
+    def __reduce__(self):
+        return (_PlaylistTracks, (list(self),))
+
+    def leaves(self) -> Iterator[Tuple[str, ...]]:
+        """Yields the leaf chunks in order."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, tuple):
+                if node:
+                    yield node
+            else:
+                stack.extend(reversed(node.children))
+
+    def slice(self, start: int, stop: int) -> List[str]:
+        """Returns the track IDs in [start, stop), touching only the chunks that overlap it."""
+        start = max(0, start)
+        stop = min(len(self), stop)
+        result: List[str] = []
+        if start < stop:
+            self._collect(self._root, start, stop, result)
+        return result
+
+    @classmethod
+    def _collect(cls, node: Any, start: int, stop: int, result: List[str]) -> None:
+        if isinstance(node, tuple):
+            result.extend(node[start:stop])
+            return
+        first = bisect.bisect_right(node.ends, start)
+        for i in range(first, len(node.children)):
+            child_start = node.ends[i - 1] if i else 0
+            if child_start >= stop:
+                break
+            cls._collect(node.children[i], max(0, start - child_start), stop - child_start, result)
+
+    def index(self, track_id: object) -> int:
+        """Returns the position of the first occurrence of track_id, or -1 if absent."""
+        return self._locate().first(track_id)
+
+    def insert(self, position: int, track_ids: Iterable[str]) -> "_PlaylistTracks":
+        """Returns a new sequence with track_ids inserted before position (clamped to the ends)."""
+        items = tuple(track_ids)
+        if not items:
+            return self
+        position = min(max(0, position), len(self))
+        removed: List[Any] = []
+        created: List[Any] = []
+        root = self._build_root(self._insert(self._root, position, items, removed, created), created)
+        return self._with_root(root, removed, created)
+
+    def append(self, track_ids: Iterable[str]) -> "_PlaylistTracks":
+        """Returns a new sequence with track_ids added at the end."""
+        return self.insert(len(self), track_ids)
+
+    @classmethod
+    def _insert(cls, node: Any, position: int, items: Tuple[str, ...], removed: List[Any], created: List[Any]) -> List[Any]:
+        removed.append(node)
+        if isinstance(node, tuple):
+            merged = node[:position] + items + node[position:]
+            leaves = [merged[i:i + cls.LEAF_SIZE] for i in range(0, len(merged), cls.LEAF_SIZE)]
+            created.extend(leaves)
+            return leaves
+        i = min(bisect.bisect_right(node.ends, position), len(node.children) - 1)
+        child_start = node.ends[i - 1] if i else 0
+        replaced = cls._insert(node.children[i], position - child_start, items, removed, created)
+        children = node.children[:i] + tuple(replaced) + node.children[i + 1:]
+        branches = [_TrackChunkBranch(children[j:j + cls.FANOUT]) for j in range(0, len(children), cls.FANOUT)]
+        created.extend(branches)
+        return branches
+
+    def delete(self, position: int) -> "_PlaylistTracks":
+        """Returns a new sequence without the track at position."""
+        if not 0 <= position < len(self):
+            raise IndexError("Playlist position out of range")
+        removed: List[Any] = []
+        created: List[Any] = []
+        root = self._delete(self._root, position, removed, created)
+        while isinstance(root, _TrackChunkBranch) and len(root.children) == 1:
+            removed.append(root)
+            root = root.children[0]
+        return self._with_root(root if root is not None else (), removed, created)
+
+    @classmethod
+    def _underfull(cls, node: Any) -> bool:
+        if isinstance(node, tuple):
+            return len(node) < cls.LEAF_SIZE // 2
+        return len(node.children) < cls.FANOUT // 2
+
+    @classmethod
+    def _merge(cls, left: Any, right: Any, removed: List[Any], created: List[Any]) -> List[Any]:
+        """Joins two sibling nodes, splitting the result in half again if it overflows."""
+        removed.extend((left, right))
+        if isinstance(left, tuple):
+            items = left + right
+            half = len(items) // 2
+            merged = [items] if len(items) <= cls.LEAF_SIZE else [items[:half], items[half:]]
+        else:
+            children = left.children + right.children
+            half = len(children) // 2
+            merged = (
+                [_TrackChunkBranch(children)] if len(children) <= cls.FANOUT
+                else [_TrackChunkBranch(children[:half]), _TrackChunkBranch(children[half:])]
+            )
+        created.extend(merged)
+        return merged
+
+    @classmethod
+    def _delete(cls, node: Any, position: int, removed: List[Any], created: List[Any]) -> Any:
+        removed.append(node)
+        if isinstance(node, tuple):
+            remaining = node[:position] + node[position + 1:]
+            if remaining:
+                created.append(remaining)
+            return remaining or None
+        i = bisect.bisect_right(node.ends, position)
+        child_start = node.ends[i - 1] if i else 0
+        replaced = cls._delete(node.children[i], position - child_start, removed, created)
+        children = list(node.children[:i]) + ([replaced] if replaced is not None else []) + list(node.children[i + 1:])
+        if replaced is not None and len(children) > 1 and cls._underfull(replaced):
+            left = i if i + 1 < len(children) else i - 1
+            children[left:left + 2] = cls._merge(children[left], children[left + 1], removed, created)
+        if not children:
+            return None
+        branch = _TrackChunkBranch(tuple(children))
+        created.append(branch)
+        return branch
+
+    def diff(self, other: "_PlaylistTracks") -> List[Dict[str, Any]]:
+        """
+        Lists the edits that turn this sequence into other. Chunks are first aligned by identity,
+        so chunks shared between the two versions are skipped and only the items of edited
+        chunks are compared.
+        """
+        old_leaves = list(self.leaves())
+        new_leaves = list(other.leaves())
+        old_offsets = list(itertools.accumulate((len(leaf) for leaf in old_leaves), initial=0))
+        new_offsets = list(itertools.accumulate((len(leaf) for leaf in new_leaves), initial=0))
+        chunk_matcher = difflib.SequenceMatcher(
+            None, [id(leaf) for leaf in old_leaves], [id(leaf) for leaf in new_leaves], autojunk=False
+        )
+        changes = []
+        for op, old_first, old_last, new_first, new_last in chunk_matcher.get_opcodes():
+            if op == "equal":
+                continue
+            old_items = [t for leaf in old_leaves[old_first:old_last] for t in leaf]
+            new_items = [t for leaf in new_leaves[new_first:new_last] for t in leaf]
+            item_matcher = difflib.SequenceMatcher(None, old_items, new_items, autojunk=False)
+            for item_op, old_start, old_end, new_start, new_end in item_matcher.get_opcodes():
+                if item_op == "equal":
+                    continue
+                changes.append({
+                    "op": item_op,
+                    "from_position": old_offsets[old_first] + old_start,
+                    "to_position": new_offsets[new_first] + new_start,
+                    "removed": old_items[old_start:old_end],
+                    "added": new_items[new_start:new_end],
+                })
+        return changes
+
+
 class SpotifyApis:
     """
     An API class for simulating Spotify Web API operations.
@@ -12,6 +395,8 @@ class SpotifyApis:
     Matches the real Spotify Web API structure and authentication.
     """
 
+    MAX_PLAYLIST_SNAPSHOTS = 100  # Retained snapshot versions per playlist
+
     def __init__(self):
         """
         Initializes the SpotifyApis instance with in-memory data stores for simulating Spotify Web API operations.
@@ -38,6 +423,13 @@ class SpotifyApis:
         self.artists: Dict[str, Any] = {}
         self.access_token: Optional[str] = None  # OAuth token instead of username
         self.current_user_id: Optional[str] = None  # User ID for authenticated user
+        self._name_index: Dict[str, Dict[str, str]] = {}  # Search type -> {entity ID: lowercased name}
+        self._entity_versions: Dict[tuple, int] = {}  # (entity type, ID) -> version counter
+        self._enrichment_cache: Dict[tuple, tuple] = {}  # (entity type, ID) -> (version, source id(), frozen entity)
+        self._playlist_snapshots: Dict[str, Dict[str, _PlaylistTracks]] = {}  # Playlist ID -> {snapshot_id: tracks}
+        self._basket_tracks: Optional[Dict[tuple, set]] = None  # ("playlist" | "liked", ID) -> track IDs; built lazily
+        self._track_baskets: Dict[str, set] = {}  # Track ID -> baskets containing it
+        self._artist_tracks: Dict[str, List[str]] = {}  # Artist ID -> track IDs
 
         self._load_scenario(DEFAULT_STATE)
 
@@ -59,6 +451,10 @@ class SpotifyApis:
                 
         Side Effects:
             - Completely replaces all entity stores with scenario data
+            - Converts each user's liked_songs, liked_albums and following_artists lists into
+              ordered {id: added_at} libraries (see _get_library)
+            - Converts each playlist's track list into a _PlaylistTracks sequence and records
+              its snapshot_id (generating one if missing) as the first retained snapshot
             - Prints confirmation message to console
             - Does NOT reset authentication state (access_token, current_user_id)
             
@@ -74,8 +470,77 @@ class SpotifyApis:
         self.albums = scenario_copy.get("albums", {})
         self.playlists = scenario_copy.get("playlists", {})
         self.artists = scenario_copy.get("artists", {})
+        for user_data in self.users.values():
+            for field in ("liked_songs", "liked_albums", "following_artists"):
+                self._get_library(user_data, field)
+        self._basket_tracks = None
+        self._track_baskets = {}
+        self._artist_tracks = {}
+        self._playlist_snapshots = {}
+        for playlist_id, playlist in self.playlists.items():
+            self._get_playlist_tracks(playlist)
+            playlist.setdefault("snapshot_id", self._generate_unique_id())
+            self._record_playlist_snapshot(playlist_id, playlist)
+        self._rebuild_name_index()
+        self._entity_versions = {}
+        self._enrichment_cache = {}
         print("SpotifyApis: Loaded scenario with UUIDs for all entities.")
 
+    def _entity_store(self, entity_type: str) -> Dict[str, Any]:
+        """
+        Internal helper that maps a search type to the dictionary holding those entities.
+
+        Args:
+            entity_type (str): One of "track", "album", "artist" or "playlist"
+
+        Returns:
+            Dict[str, Any]: The matching entity store (self.tracks, self.albums, ...)
+        """
+        return {
+            "track": self.tracks,
+            "album": self.albums,
+            "artist": self.artists,
+            "playlist": self.playlists,
+        }[entity_type]
+
+    def _rebuild_name_index(self) -> None:
+        """
+        Rebuilds the search name index from the current entity stores.
+        
+        The index maps each search type ("track", "album", "artist", "playlist") to an
+        insertion-ordered dictionary of entity ID -> lowercased display name, so search can
+        match names without touching or copying the entity objects themselves.
+        
+        Side Effects:
+            - Replaces self._name_index
+            
+        Note:
+            Tracks and albums are named by "name" or, in older scenarios, "title".
+        """
+        self._name_index = {}
+        for entity_type in ("track", "album", "artist", "playlist"):
+            for entity_id, entity in self._entity_store(entity_type).items():
+                self._index_entity_name(entity_type, entity_id, entity)
+
+    def _index_entity_name(self, entity_type: str, entity_id: str, entity: Dict[str, Any]) -> None:
+        """
+        Adds or refreshes a single entity in the search name index.
+
+        Args:
+            entity_type (str): One of "track", "album", "artist" or "playlist"
+            entity_id (str): The entity's UUID
+            entity (Dict[str, Any]): The raw entity data
+
+        Side Effects:
+            - Updates self._name_index[entity_type][entity_id]
+            
+        Note:
+            Must be called whenever an entity is created or renamed (create_playlist,
+            change_playlist_details) so search results stay current.
+        """
+        name = entity.get("name", entity.get("title", "")) or ""
+        self._name_index.setdefault(entity_type, {})[entity_id] = name.lower()
+
     def _generate_unique_id(self) -> str:
         """
         Generates a unique UUID string for creating new entities (playlists, payment cards, etc.).
@@ -289,9 +754,9 @@ class SpotifyApis:
                 - "id": User UUID
                 - "email": User email address
                 - "first_name", "last_name": Name components
-                - "liked_songs": List of saved track IDs
-                - "liked_albums": List of saved album IDs
-                - "following_artists": List of followed artist IDs
+                - "liked_songs": Ordered {track ID: added_at} library of saved tracks
+                - "liked_albums": Ordered {album ID: added_at} library of saved albums
+                - "following_artists": Ordered {artist ID: followed_at} library of followed artists
                 - "liked_playlists": List of owned/saved playlist IDs
                 - "country": Country code
                 - "premium": Premium subscription status
@@ -305,6 +770,113 @@ class SpotifyApis:
             return None
         return self.users.get(self.current_user_id)
 
+    def _get_library(self, user_data: Dict[str, Any], field: str) -> Dict[str, str]:
+        """
+        Internal helper returning one of a user's libraries as an insertion-ordered set.
+        
+        Saved tracks ("liked_songs"), saved albums ("liked_albums") and followed artists
+        ("following_artists") are stored as dicts mapping item ID -> ISO 8601 added_at timestamp.
+        Dict keys give O(1) membership, add and remove while preserving insertion order, which
+        is also added-time order since items are only ever appended.
+
+        Args:
+            user_data (Dict[str, Any]): The user's data dictionary
+            field (str): "liked_songs", "liked_albums" or "following_artists"
+
+        Returns:
+            Dict[str, str]: The library dict stored in user_data[field] (created if missing)
+            
+        Note:
+            Scenario data stores these libraries as plain ID lists with no save times. Such lists
+            are converted in place, using the user's last_active_date as added_at for the
+            pre-existing items.
+        """
+        library = user_data.get(field)
+        if isinstance(library, dict):
+            return library
+        seed_added_at = user_data.get("last_active_date") or datetime.datetime.now().isoformat() + "Z"
+        library = dict.fromkeys(library or [], seed_added_at)
+        user_data[field] = library
+        return library
+
+    def _get_playlist_tracks(self, playlist: Dict[str, Any]) -> _PlaylistTracks:
+        """
+        Internal helper returning a playlist's track IDs as a _PlaylistTracks sequence.
+        
+        Playlist contents are stored in playlist["tracks"] as an immutable chunked sequence so
+        positional inserts and removals cost O(log n) and every snapshot shares unchanged chunks
+        with its neighbours. Plain lists (from scenario data) are converted in place.
+
+        Args:
+            playlist (Dict[str, Any]): The raw playlist data
+
+        Returns:
+            _PlaylistTracks: The playlist's current track sequence
+        """
+        tracks = playlist.get("tracks")
+        if not isinstance(tracks, _PlaylistTracks):
+            tracks = _PlaylistTracks(tracks or [])
+            playlist["tracks"] = tracks
+        return tracks
+
+    def _record_playlist_snapshot(self, playlist_id: str, playlist: Dict[str, Any]) -> None:
+        """
+        Retains the playlist's current tracks under its current snapshot_id.
+        
+        Keeps at most MAX_PLAYLIST_SNAPSHOTS versions per playlist, dropping the oldest first.
+        Versions share structure, so each retained snapshot only costs the chunks its edit touched.
+
+        Args:
+            playlist_id (str): The playlist UUID
+            playlist (Dict[str, Any]): The raw playlist data (snapshot_id and tracks already updated)
+
+        Side Effects:
+            - Adds an entry to self._playlist_snapshots[playlist_id]
+        """
+        snapshots = self._playlist_snapshots.setdefault(playlist_id, {})
+        snapshots[playlist["snapshot_id"]] = self._get_playlist_tracks(playlist)
+        while len(snapshots) > self.MAX_PLAYLIST_SNAPSHOTS:
+            del snapshots[next(iter(snapshots))]
+
+    def _get_playlist_snapshot(self, playlist_id: str, snapshot_id: Optional[str]) -> _PlaylistTracks:
+        """
+        Returns a playlist's tracks at a retained snapshot (or the current tracks if snapshot_id is None).
+
+        Raises:
+            Exception: If the snapshot is unknown or no longer retained
+                Error message: "Snapshot {snapshot_id} not found for playlist {playlist_id}"
+        """
+        if snapshot_id is None:
+            return self._get_playlist_tracks(self.playlists[playlist_id])
+        tracks = self._playlist_snapshots.get(playlist_id, {}).get(snapshot_id)
+        if tracks is None:
+            raise Exception(f"Snapshot {snapshot_id} not found for playlist {playlist_id}")
+        return tracks
+
+    def _get_readable_playlist(self, playlist_id: str) -> Dict[str, Any]:
+        """
+        Returns a playlist's raw data after checking the caller may read it.
+
+        Raises:
+            Exception: If playlist_id doesn't exist ("Playlist {playlist_id} not found")
+            Exception: If the playlist is private and no user is authenticated
+            Exception: If the playlist is private and not owned by the authenticated user
+                Error message: "Access denied to private playlist"
+        """
+        if playlist_id not in self.playlists:
+            raise Exception(f"Playlist {playlist_id} not found")
+        
+        playlist = self.playlists[playlist_id]
+        
+        # Check if user has access (public or owned by current user)
+        if not playlist.get("public"):
+            self._ensure_authenticated()
+            user_data = self._get_current_user_data()
+            if not user_data or playlist.get("user_id") != user_data["id"]:
+                raise Exception("Access denied to private playlist")
+        
+        return playlist
+
     def _get_user_payment_cards(self, user_id: str) -> Dict[str, Any]:
         """
         Internal helper to retrieve all payment cards belonging to a specific user.
@@ -366,9 +938,12 @@ class SpotifyApis:
                 "message": f"User with ID {user_id} not found."
             }
         
-        # Return complete user data including the user_id itself
+        # Return complete user data including the user_id itself, with libraries as ID lists
         result = {"user_id": user_id}
         result.update(user_data)
+        for field in ("liked_songs", "liked_albums", "following_artists"):
+            if field in result:
+                result[field] = list(result[field])
         return result
 
     def get_current_user_profile(self) -> Dict[str, Any]:
@@ -662,6 +1237,61 @@ class SpotifyApis:
 
         self.payment_cards[payment_method_id]["is_default"] = True
 
+    def _bump_entity_version(self, entity_type: str, entity_id: str) -> None:
+        """
+        Marks an entity as changed so its cached enriched form is rebuilt on the next read.
+
+        Args:
+            entity_type (str): One of "track", "album", "artist" or "playlist"
+            entity_id (str): The entity's UUID
+
+        Side Effects:
+            - Increments self._entity_versions[(entity_type, entity_id)]
+            
+        Note:
+            Every endpoint that mutates a stored entity must call this after the change.
+        """
+        key = (entity_type, entity_id)
+        self._entity_versions[key] = self._entity_versions.get(key, 0) + 1
+
+    def _get_cached_enrichment(self, entity_type: str, entity_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Looks up the cached enriched form of an entity.
+
+        Args:
+            entity_type (str): One of "track", "album", "artist" or "playlist"
+            entity_data (Dict[str, Any]): The raw entity data being enriched
+
+        Returns:
+            Optional[Dict[str, Any]]: The frozen enriched entity if the cache entry was built from
+                this same raw object at its current version, otherwise None
+        """
+        key = (entity_type, entity_data["id"])
+        cached = self._enrichment_cache.get(key)
+        if cached is None:
+            return None
+        version, source_id, enriched = cached
+        if version != self._entity_versions.get(key, 0) or source_id != id(entity_data):
+            return None
+        return enriched
+
+    def _store_enrichment(self, entity_type: str, entity_data: Dict[str, Any], enriched: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Freezes a freshly enriched entity and caches it under the entity's current version.
+
+        Args:
+            entity_type (str): One of "track", "album", "artist" or "playlist"
+            entity_data (Dict[str, Any]): The raw entity data that was enriched
+            enriched (Dict[str, Any]): The enriched (mutable) copy
+
+        Returns:
+            Dict[str, Any]: The read-only enriched entity that was cached
+        """
+        key = (entity_type, entity_data["id"])
+        frozen = _freeze(enriched)
+        self._enrichment_cache[key] = (self._entity_versions.get(key, 0), id(entity_data), frozen)
+        return frozen
+
     def _enrich_track(self, track_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enriches a raw track data object with Spotify Web API standard fields and URIs.
@@ -701,7 +1331,8 @@ class SpotifyApis:
             - Renames "title" field to "name" to match Spotify API conventions
             - Converts "duration" (seconds) to "duration_ms" (milliseconds) if needed
             - Adds default values for missing optional fields
-            - Returns a deep copy to prevent unintended mutations
+            - Memoized per entity ID and version; the returned object is a shared read-only
+              view (copy.deepcopy() it for a mutable copy)
             
         Example:
             >>> raw_track = {"id": "abc-123", "title": "Song Name", "duration": 180}
@@ -709,6 +1340,10 @@ class SpotifyApis:
             >>> print(enriched["uri"])  # "spotify:track:abc-123"
             >>> print(enriched["name"])  # "Song Name" (renamed from title)
         """
+        cached = self._get_cached_enrichment("track", track_data)
+        if cached is not None:
+            return cached
+        
         track_id = track_data["id"]
         enriched = copy.deepcopy(track_data)
         
@@ -736,7 +1371,7 @@ class SpotifyApis:
         if "title" in enriched and "name" not in enriched:
             enriched["name"] = enriched["title"]
         
-        return enriched
+        return self._store_enrichment("track", track_data, enriched)
     
     def _enrich_album(self, album_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -778,7 +1413,8 @@ class SpotifyApis:
             - Renames "title" field to "name" to match Spotify API conventions
             - Calculates total_tracks from tracks array length if present
             - Adds default values for missing optional fields
-            - Returns a deep copy to prevent unintended mutations
+            - Memoized per entity ID and version; the returned object is a shared read-only
+              view (copy.deepcopy() it for a mutable copy)
             
         Example:
             >>> raw_album = {"id": "album-456", "title": "Album Name", "tracks": ["t1", "t2"]}
@@ -786,6 +1422,10 @@ class SpotifyApis:
             >>> print(enriched["uri"])  # "spotify:album:album-456"
             >>> print(enriched["total_tracks"])  # 2
         """
+        cached = self._get_cached_enrichment("album", album_data)
+        if cached is not None:
+            return cached
+        
         album_id = album_data["id"]
         enriched = copy.deepcopy(album_data)
         
@@ -808,7 +1448,7 @@ class SpotifyApis:
         if "title" in enriched and "name" not in enriched:
             enriched["name"] = enriched["title"]
         
-        return enriched
+        return self._store_enrichment("album", album_data, enriched)
     
     def _enrich_playlist(self, playlist_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -856,7 +1496,8 @@ class SpotifyApis:
             - Converts simple track ID list to Spotify-standard tracks object structure
             - Generates unique snapshot_id for playlist version tracking
             - Adds default values for missing optional fields
-            - Returns a deep copy to prevent unintended mutations
+            - Memoized per entity ID and version; the returned object is a shared read-only
+              view (copy.deepcopy() it for a mutable copy)
             - In real Spotify API, tracks.items would contain full track objects with added_at timestamps
             
         Example:
@@ -865,6 +1506,10 @@ class SpotifyApis:
             >>> print(enriched["uri"])  # "spotify:playlist:pl-789"
             >>> print(enriched["tracks"]["total"])  # 3
         """
+        cached = self._get_cached_enrichment("playlist", playlist_data)
+        if cached is not None:
+            return cached
+        
         playlist_id = playlist_data["id"]
         enriched = copy.deepcopy(playlist_data)
         
@@ -882,7 +1527,9 @@ class SpotifyApis:
         
         # Handle tracks field
         track_ids = enriched.get("tracks", [])
-        if isinstance(track_ids, list) and track_ids and isinstance(track_ids[0], str):
+        if isinstance(track_ids, _PlaylistTracks) or (
+            isinstance(track_ids, list) and track_ids and isinstance(track_ids[0], str)
+        ):
             # Convert track IDs to track objects
             enriched["tracks"] = {
                 "href": f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks",
@@ -890,7 +1537,7 @@ class SpotifyApis:
                 "items": []  # Simplified - would contain track objects in real API
             }
         
-        return enriched
+        return self._store_enrichment("playlist", playlist_data, enriched)
     
     def _enrich_artist(self, artist_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -929,7 +1576,8 @@ class SpotifyApis:
                 
         Note:
             - Adds default values for missing optional fields
-            - Returns a deep copy to prevent unintended mutations
+            - Memoized per entity ID and version; the returned object is a shared read-only
+              view (copy.deepcopy() it for a mutable copy)
             - Real Spotify API includes additional fields like external_ids (ISNI)
             
         Example:
@@ -938,6 +1586,10 @@ class SpotifyApis:
             >>> print(enriched["uri"])  # "spotify:artist:artist-999"
             >>> print(enriched["genres"])  # []
         """
+        cached = self._get_cached_enrichment("artist", artist_data)
+        if cached is not None:
+            return cached
+        
         artist_id = artist_data["id"]
         enriched = copy.deepcopy(artist_data)
         
@@ -953,7 +1605,7 @@ class SpotifyApis:
         enriched.setdefault("followers", {"href": None, "total": 0})
         enriched.setdefault("images", [])
         
-        return enriched
+        return self._store_enrichment("artist", artist_data, enriched)
 
     def get_saved_tracks(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """
@@ -1001,8 +1653,9 @@ class SpotifyApis:
                 
         Note:
             - Only returns tracks that exist in self.tracks (orphaned IDs are skipped)
-            - Uses user's last_active_date as added_at fallback timestamp
-            - Real Spotify API tracks actual save timestamps per track
+            - Items are ordered by the time they were saved, oldest first
+            - added_at is the real save time for tracks saved through save_tracks; tracks that
+              came with the scenario use the user's last_active_date
             
         Example:
             >>> api = SpotifyApis()
@@ -1018,18 +1671,18 @@ class SpotifyApis:
         if not user_data:
             raise Exception("User not found")
         
-        saved_track_ids = user_data.get("liked_songs", [])
-        total = len(saved_track_ids)
+        saved_tracks = self._get_library(user_data, "liked_songs")
+        total = len(saved_tracks)
         
-        # Apply pagination
-        paginated_ids = saved_track_ids[offset:offset + limit]
+        # Apply pagination (library is ordered by added time)
+        paginated = itertools.islice(saved_tracks.items(), offset, offset + limit)
         
         items = []
-        for track_id in paginated_ids:
+        for track_id, added_at in paginated:
             if track_id in self.tracks:
                 track_data = self._enrich_track(self.tracks[track_id])
                 items.append({
-                    "added_at": user_data.get("last_active_date", datetime.datetime.now().isoformat() + "Z"),
+                    "added_at": added_at,
                     "track": track_data
                 })
         
@@ -1069,8 +1722,9 @@ class SpotifyApis:
                 Error message: "Track {track_id} not found"
                 
         Side Effects:
-            - Adds each track_id to user's liked_songs list (if not already present)
-            - Creates liked_songs list if it doesn't exist
+            - Adds each track_id to user's liked_songs library with the current time as added_at
+              (if not already present; re-saving keeps the original added_at)
+            - Creates liked_songs library if it doesn't exist
             - Duplicate track IDs are silently ignored (idempotent operation)
             
         Note:
@@ -1092,12 +1746,16 @@ class SpotifyApis:
         if len(track_ids) > 50:
             raise Exception("Maximum 50 tracks can be saved at once")
         
+        # Validate every ID first so a bad one leaves the library and recommendation index untouched
         for track_id in track_ids:
             if track_id not in self.tracks:
                 raise Exception(f"Track {track_id} not found")
-            
-            if track_id not in user_data.get("liked_songs", []):
-                user_data.setdefault("liked_songs", []).append(track_id)
+        
+        saved_tracks = self._get_library(user_data, "liked_songs")
+        added_at = datetime.datetime.now().isoformat() + "Z"
+        for track_id in track_ids:
+            saved_tracks.setdefault(track_id, added_at)
+        self._update_recommendation_basket(("liked", self.current_user_id), added=track_ids)
 
     def remove_saved_tracks(self, track_ids: List[str]) -> None:
         """
@@ -1120,7 +1778,7 @@ class SpotifyApis:
                 Error message: "Maximum 50 tracks can be removed at once"
                 
         Side Effects:
-            - Removes each track_id from user's liked_songs list (if present)
+            - Removes each track_id from user's liked_songs library (if present)
             - Track IDs not in liked_songs are silently ignored (idempotent operation)
             
         Note:
@@ -1142,9 +1800,10 @@ class SpotifyApis:
         if len(track_ids) > 50:
             raise Exception("Maximum 50 tracks can be removed at once")
         
+        saved_tracks = self._get_library(user_data, "liked_songs")
         for track_id in track_ids:
-            if track_id in user_data.get("liked_songs", []):
-                user_data["liked_songs"].remove(track_id)
+            saved_tracks.pop(track_id, None)
+        self._update_recommendation_basket(("liked", self.current_user_id), removed=track_ids)
 
     def check_saved_tracks(self, track_ids: List[str]) -> List[bool]:
         """
@@ -1173,7 +1832,7 @@ class SpotifyApis:
                 
         Note:
             - Does NOT validate whether track IDs exist in self.tracks
-            - Checks against user's liked_songs list
+            - Checks against user's liked_songs library (O(1) per track)
             - Non-existent track IDs return False (not saved)
             
         Example:
@@ -1192,8 +1851,8 @@ class SpotifyApis:
         if len(track_ids) > 50:
             raise Exception("Maximum 50 tracks can be checked at once")
         
-        saved_track_ids = user_data.get("liked_songs", [])
-        return [track_id in saved_track_ids for track_id in track_ids]
+        saved_tracks = self._get_library(user_data, "liked_songs")
+        return [track_id in saved_tracks for track_id in track_ids]
 
     def get_saved_albums(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """
@@ -1241,8 +1900,9 @@ class SpotifyApis:
                 
         Note:
             - Only returns albums that exist in self.albums (orphaned IDs are skipped)
-            - Uses user's last_active_date as added_at fallback timestamp
-            - Real Spotify API tracks actual save timestamps per album
+            - Items are ordered by the time they were saved, oldest first
+            - added_at is the real save time for albums saved through save_albums; albums that
+              came with the scenario use the user's last_active_date
             
         Example:
             >>> api = SpotifyApis()
@@ -1258,18 +1918,18 @@ class SpotifyApis:
         if not user_data:
             raise Exception("User not found")
         
-        saved_album_ids = user_data.get("liked_albums", [])
-        total = len(saved_album_ids)
+        saved_albums = self._get_library(user_data, "liked_albums")
+        total = len(saved_albums)
         
-        # Apply pagination
-        paginated_ids = saved_album_ids[offset:offset + limit]
+        # Apply pagination (library is ordered by added time)
+        paginated = itertools.islice(saved_albums.items(), offset, offset + limit)
         
         items = []
-        for album_id in paginated_ids:
+        for album_id, added_at in paginated:
             if album_id in self.albums:
                 album_data = self._enrich_album(self.albums[album_id])
                 items.append({
-                    "added_at": user_data.get("last_active_date", datetime.datetime.now().isoformat() + "Z"),
+                    "added_at": added_at,
                     "album": album_data
                 })
         
@@ -1309,8 +1969,9 @@ class SpotifyApis:
                 Error message: "Album {album_id} not found"
                 
         Side Effects:
-            - Adds each album_id to user's liked_albums list (if not already present)
-            - Creates liked_albums list if it doesn't exist
+            - Adds each album_id to user's liked_albums library with the current time as added_at
+              (if not already present; re-saving keeps the original added_at)
+            - Creates liked_albums library if it doesn't exist
             - Duplicate album IDs are silently ignored (idempotent operation)
             
         Note:
@@ -1333,12 +1994,13 @@ class SpotifyApis:
         if len(album_ids) > 50:
             raise Exception("Maximum 50 albums can be saved at once")
         
+        saved_albums = self._get_library(user_data, "liked_albums")
+        added_at = datetime.datetime.now().isoformat() + "Z"
         for album_id in album_ids:
             if album_id not in self.albums:
                 raise Exception(f"Album {album_id} not found")
             
-            if album_id not in user_data.get("liked_albums", []):
-                user_data.setdefault("liked_albums", []).append(album_id)
+            saved_albums.setdefault(album_id, added_at)
 
     def remove_saved_albums(self, album_ids: List[str]) -> None:
         """
@@ -1361,7 +2023,7 @@ class SpotifyApis:
                 Error message: "Maximum 50 albums can be removed at once"
                 
         Side Effects:
-            - Removes each album_id from user's liked_albums list (if present)
+            - Removes each album_id from user's liked_albums library (if present)
             - Album IDs not in liked_albums are silently ignored (idempotent operation)
             
         Note:
@@ -1383,9 +2045,9 @@ class SpotifyApis:
         if len(album_ids) > 50:
             raise Exception("Maximum 50 albums can be removed at once")
         
+        saved_albums = self._get_library(user_data, "liked_albums")
         for album_id in album_ids:
-            if album_id in user_data.get("liked_albums", []):
-                user_data["liked_albums"].remove(album_id)
+            saved_albums.pop(album_id, None)
 
     def follow_artists(self, artist_ids: List[str]) -> None:
         """
@@ -1410,8 +2072,9 @@ class SpotifyApis:
                 Error message: "Artist {artist_id} not found"
                 
         Side Effects:
-            - Adds each artist_id to user's following_artists list (if not already present)
-            - Creates following_artists list if it doesn't exist
+            - Adds each artist_id to user's following_artists library with the current time
+              (if not already present)
+            - Creates following_artists library if it doesn't exist
             - Duplicate artist IDs are silently ignored (idempotent operation)
             
         Note:
@@ -1434,12 +2097,13 @@ class SpotifyApis:
         if len(artist_ids) > 50:
             raise Exception("Maximum 50 artists can be followed at once")
         
+        followed_artists = self._get_library(user_data, "following_artists")
+        followed_at = datetime.datetime.now().isoformat() + "Z"
         for artist_id in artist_ids:
             if artist_id not in self.artists:
                 raise Exception(f"Artist {artist_id} not found")
             
-            if artist_id not in user_data.get("following_artists", []):
-                user_data.setdefault("following_artists", []).append(artist_id)
+            followed_artists.setdefault(artist_id, followed_at)
 
     def unfollow_artists(self, artist_ids: List[str]) -> None:
         """
@@ -1462,7 +2126,7 @@ class SpotifyApis:
                 Error message: "Maximum 50 artists can be unfollowed at once"
                 
         Side Effects:
-            - Removes each artist_id from user's following_artists list (if present)
+            - Removes each artist_id from user's following_artists library (if present)
             - Artist IDs not in following_artists are silently ignored (idempotent operation)
             
         Note:
@@ -1484,9 +2148,9 @@ class SpotifyApis:
         if len(artist_ids) > 50:
             raise Exception("Maximum 50 artists can be unfollowed at once")
         
+        followed_artists = self._get_library(user_data, "following_artists")
         for artist_id in artist_ids:
-            if artist_id in user_data.get("following_artists", []):
-                user_data["following_artists"].remove(artist_id)
+            followed_artists.pop(artist_id, None)
 
     def get_followed_artists(self, limit: int = 20) -> Dict[str, Any]:
         """
@@ -1553,11 +2217,11 @@ class SpotifyApis:
         if not user_data:
             raise Exception("User not found")
         
-        following_artist_ids = user_data.get("following_artists", [])
-        total = len(following_artist_ids)
+        followed_artists = self._get_library(user_data, "following_artists")
+        total = len(followed_artists)
         
-        # Apply limit
-        paginated_ids = following_artist_ids[:limit]
+        # Apply limit (library is ordered by follow time)
+        paginated_ids = itertools.islice(followed_artists, limit)
         
         items = []
         for artist_id in paginated_ids:
@@ -1677,11 +2341,14 @@ class SpotifyApis:
             "user_id": current_user_data["id"],
             "description": description,
             "public": public,
-            "tracks": [],
+            "tracks": _PlaylistTracks(),
+            "snapshot_id": self._generate_unique_id(),
             "created_at": current_time_iso,
             "updated_at": current_time_iso,
         }
         self.playlists[new_playlist_id] = new_playlist
+        self._record_playlist_snapshot(new_playlist_id, new_playlist)
+        self._index_entity_name("playlist", new_playlist_id, new_playlist)
         
         current_user_data.setdefault("liked_playlists", []).append(new_playlist_id)
 
@@ -1724,18 +2391,7 @@ class SpotifyApis:
             >>> private_pl = api.get_playlist("private-playlist-id")
             >>> print(f"{private_pl['name']}: {private_pl['tracks']['total']} tracks")
         """
-        if playlist_id not in self.playlists:
-            raise Exception(f"Playlist {playlist_id} not found")
-        
-        playlist = self.playlists[playlist_id]
-        
-        # Check if user has access (public or owned by current user)
-        if not playlist.get("public"):
-            self._ensure_authenticated()
-            user_data = self._get_current_user_data()
-            if not user_data or playlist.get("user_id") != user_data["id"]:
-                raise Exception("Access denied to private playlist")
-        
+        playlist = self._get_readable_playlist(playlist_id)
         return self._enrich_playlist(playlist)
 
     def change_playlist_details(
@@ -1805,12 +2461,14 @@ class SpotifyApis:
         playlist = self.playlists[playlist_id]
         if name is not None:
             playlist["name"] = name
+            self._index_entity_name("playlist", playlist_id, playlist)
         if description is not None:
             playlist["description"] = description
         if public is not None:
             playlist["public"] = public
         
         playlist["updated_at"] = datetime.datetime.now().isoformat() + "Z"
+        self._bump_entity_version("playlist", playlist_id)
 
     def add_items_to_playlist(self, playlist_id: str, track_uris: List[str], position: Optional[int] = None) -> Dict[str, str]:
         """
@@ -1853,9 +2511,10 @@ class SpotifyApis:
                 
         Side Effects:
             - Adds track IDs to playlist's tracks list
-            - If position provided, inserts at that index; otherwise appends
+            - If position provided, inserts at that index (clamped to the list bounds); otherwise appends
             - Updates playlist's updated_at timestamp
-            - Generates and updates playlist's snapshot_id
+            - Generates and updates playlist's snapshot_id; the previous version stays retrievable
+              through get_playlist_items and get_playlist_snapshot_diff
             - Changes persist for subsequent API calls
             
         Note:
@@ -1902,18 +2561,20 @@ class SpotifyApis:
             else:
                 raise Exception(f"Invalid track URI format: {uri}")
         
-        # Add tracks
-        current_tracks = playlist.get("tracks", [])
+        # Add tracks (one positional insert for the whole batch)
+        current_tracks = self._get_playlist_tracks(playlist)
         if position is not None:
-            for i, track_id in enumerate(track_ids):
-                current_tracks.insert(position + i, track_id)
+            current_tracks = current_tracks.insert(position, track_ids)
         else:
-            current_tracks.extend(track_ids)
+            current_tracks = current_tracks.append(track_ids)
         
         playlist["tracks"] = current_tracks
         playlist["updated_at"] = datetime.datetime.now().isoformat() + "Z"
         new_snapshot_id = self._generate_unique_id()
         playlist["snapshot_id"] = new_snapshot_id
+        self._record_playlist_snapshot(playlist_id, playlist)
+        self._bump_entity_version("playlist", playlist_id)
+        self._update_recommendation_basket(("playlist", playlist_id), added=track_ids)
         
         return {"snapshot_id": new_snapshot_id}
 
@@ -1955,7 +2616,7 @@ class SpotifyApis:
             - Removes first occurrence of each track ID from playlist's tracks list
             - Track URIs not in playlist are silently ignored (idempotent)
             - Updates playlist's updated_at timestamp
-            - Generates and updates playlist's snapshot_id
+            - Generates and updates playlist's snapshot_id; the previous version stays retrievable
             - Changes persist for subsequent API calls
             
         Note:
@@ -2001,18 +2662,181 @@ class SpotifyApis:
                 raise Exception(f"Invalid track URI format: {uri}")
         
         # Remove tracks
-        current_tracks = playlist.get("tracks", [])
+        current_tracks = self._get_playlist_tracks(playlist)
         for track_id in track_ids:
-            if track_id in current_tracks:
-                current_tracks.remove(track_id)
+            position = current_tracks.index(track_id)
+            if position >= 0:
+                current_tracks = current_tracks.delete(position)
         
         playlist["tracks"] = current_tracks
         playlist["updated_at"] = datetime.datetime.now().isoformat() + "Z"
         new_snapshot_id = self._generate_unique_id()
         playlist["snapshot_id"] = new_snapshot_id
+        self._record_playlist_snapshot(playlist_id, playlist)
+        self._bump_entity_version("playlist", playlist_id)
+        # A track stays in the basket while another copy of it remains in the playlist
+        self._update_recommendation_basket(
+            ("playlist", playlist_id), removed=[t for t in set(track_ids) if t not in current_tracks]
+        )
         
         return {"snapshot_id": new_snapshot_id}
 
+    def get_playlist_items(
+        self,
+        playlist_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        snapshot_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a page of the tracks in a playlist, optionally as they were at an earlier snapshot.
+        
+        Corresponds to Spotify's GET /v1/playlists/{playlist_id}/tracks endpoint. Passing the
+        snapshot_id returned by add_items_to_playlist or remove_items_from_playlist (or read
+        from get_playlist) returns the playlist contents at that version.
+
+        Args:
+            playlist_id (str): The Spotify playlist ID (UUID)
+            limit (int): Maximum number of items to return. Valid range: 1-100. Default: 100
+            offset (int): Index of the first item to return. Default: 0
+            snapshot_id (Optional[str]): Playlist version to read. Default: None (current version)
+        
+        Returns:
+            Dict[str, Any]: Paging object with structure:
+                {
+                    "href": str,                    # Current request URL
+                    "limit": int,
+                    "offset": int,
+                    "total": int,                   # Number of tracks at this snapshot
+                    "snapshot_id": str,             # Version the items were read from
+                    "items": [
+                        {
+                            "is_local": bool,       # Always False
+                            "track": {...} | None   # Enriched track (None if no longer in catalog)
+                        },
+                        # ... more items
+                    ],
+                    "previous": str | None,
+                    "next": str | None
+                }
+        
+        Raises:
+            Exception: If limit > 100
+                Error message: "Maximum limit is 100"
+            Exception: If playlist_id doesn't exist ("Playlist {playlist_id} not found")
+            Exception: If the playlist is private and the caller is not its authenticated owner
+            Exception: If snapshot_id is unknown or no longer retained
+                Error message: "Snapshot {snapshot_id} not found for playlist {playlist_id}"
+                
+        Note:
+            - Access rules match get_playlist (public playlists need no authentication)
+            - The last MAX_PLAYLIST_SNAPSHOTS versions of each playlist are retained
+            - Only the requested page is located and enriched (O(log n + limit))
+            
+        Example:
+            >>> api = SpotifyApis()
+            >>> api.authenticate("token_alice@example.com")
+            >>> old = api.get_playlist("my-playlist-id")["snapshot_id"]
+            >>> api.add_items_to_playlist("my-playlist-id", ["spotify:track:t1"], position=0)
+            >>> before = api.get_playlist_items("my-playlist-id", snapshot_id=old)
+        """
+        if limit > 100:
+            raise Exception("Maximum limit is 100")
+        
+        playlist = self._get_readable_playlist(playlist_id)
+        tracks = self._get_playlist_snapshot(playlist_id, snapshot_id)
+        total = len(tracks)
+        
+        items = []
+        for track_id in tracks.slice(offset, offset + limit):
+            track = self.tracks.get(track_id)
+            items.append({
+                "is_local": False,
+                "track": self._enrich_track(track) if track is not None else None
+            })
+        
+        base_url = f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
+        return {
+            "href": f"{base_url}?offset={offset}&limit={limit}",
+            "limit": limit,
+            "offset": offset,
+            "total": total,
+            "snapshot_id": snapshot_id or playlist["snapshot_id"],
+            "items": items,
+            "previous": f"{base_url}?offset={max(0, offset - limit)}&limit={limit}" if offset > 0 else None,
+            "next": f"{base_url}?offset={offset + limit}&limit={limit}" if offset + limit < total else None
+        }
+
+    def get_playlist_snapshot_diff(
+        self,
+        playlist_id: str,
+        from_snapshot_id: str,
+        to_snapshot_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Describes how a playlist's tracks changed between two snapshots.
+        
+        This is a simulation utility, not a standard Spotify endpoint. Snapshots share unchanged
+        track chunks, so the comparison only examines the chunks that differ between versions.
+
+        Args:
+            playlist_id (str): The Spotify playlist ID (UUID)
+            from_snapshot_id (str): The older snapshot to compare from
+            to_snapshot_id (Optional[str]): The snapshot to compare to. Default: None (current version)
+        
+        Returns:
+            Dict[str, Any]: Diff object with structure:
+                {
+                    "playlist_id": str,
+                    "from_snapshot_id": str,
+                    "to_snapshot_id": str,
+                    "changes": [
+                        {
+                            "op": str,              # "insert", "delete" or "replace"
+                            "from_position": int,   # Position in the from_snapshot version
+                            "to_position": int,     # Position in the to_snapshot version
+                            "removed": List[str],   # Track URIs removed at that position
+                            "added": List[str]      # Track URIs added at that position
+                        },
+                        # ... more changes, in playlist order
+                    ]
+                }
+        
+        Raises:
+            Exception: If playlist_id doesn't exist ("Playlist {playlist_id} not found")
+            Exception: If the playlist is private and the caller is not its authenticated owner
+            Exception: If either snapshot is unknown or no longer retained
+                Error message: "Snapshot {snapshot_id} not found for playlist {playlist_id}"
+                
+        Example:
+            >>> api = SpotifyApis()
+            >>> api.authenticate("token_alice@example.com")
+            >>> old = api.get_playlist("my-playlist-id")["snapshot_id"]
+            >>> api.remove_items_from_playlist("my-playlist-id", ["spotify:track:t1"])
+            >>> api.get_playlist_snapshot_diff("my-playlist-id", old)["changes"]
+            [{"op": "delete", "from_position": 3, "to_position": 3, "removed": ["spotify:track:t1"], "added": []}]
+        """
+        playlist = self._get_readable_playlist(playlist_id)
+        old_tracks = self._get_playlist_snapshot(playlist_id, from_snapshot_id)
+        new_tracks = self._get_playlist_snapshot(playlist_id, to_snapshot_id)
+        
+        changes = []
+        for change in old_tracks.diff(new_tracks):
+            changes.append({
+                "op": change["op"],
+                "from_position": change["from_position"],
+                "to_position": change["to_position"],
+                "removed": [self._generate_spotify_uri("track", track_id) for track_id in change["removed"]],
+                "added": [self._generate_spotify_uri("track", track_id) for track_id in change["added"]],
+            })
+        
+        return {
+            "playlist_id": playlist_id,
+            "from_snapshot_id": from_snapshot_id,
+            "to_snapshot_id": to_snapshot_id or playlist["snapshot_id"],
+            "changes": changes
+        }
+
     def get_track(self, track_id: str) -> Dict[str, Any]:
         """
         Retrieves Spotify catalog information for a single track.
@@ -2318,6 +3142,8 @@ class SpotifyApis:
         Note:
             - Does not require authentication (public catalog search)
             - Performs case-insensitive substring match on name/title fields
+            - Matches are found through a name index first; only the requested page
+              of results is enriched, so broad queries stay cheap
             - Playlist search only includes public playlists
             - Real Spotify API supports advanced query syntax (field filters, operators, etc.)
             - This simplified version only searches names, not other fields like artist or album
@@ -2339,89 +3165,259 @@ class SpotifyApis:
         if offset > 1000:
             raise Exception("Maximum offset is 1000")
         
+        q_lower = q.lower()
+        enrichers = {
+            "track": self._enrich_track,
+            "album": self._enrich_album,
+            "artist": self._enrich_artist,
+            "playlist": self._enrich_playlist,
+        }
         results = {}
 
-        if "track" in type:
-            matched_tracks = []
-            for track in self.tracks.values():
-                track_name = track.get("name", track.get("title", ""))
-                if q.lower() in track_name.lower():
-                    matched_tracks.append(self._enrich_track(track))
-            
-            total = len(matched_tracks)
-            paginated = matched_tracks[offset:offset + limit]
-            
-            results["tracks"] = {
-                "href": f"https://api.spotify.com/v1/search?q={q}&type=track&offset={offset}&limit={limit}",
+        for entity_type in ("track", "album", "artist", "playlist"):
+            if entity_type not in type:
+                continue
+            
+            # Phase 1: match IDs against the name index (no entity copies)
+            store = self._entity_store(entity_type)
+            matched_ids = [
+                entity_id
+                for entity_id, name in self._name_index.get(entity_type, {}).items()
+                if q_lower in name and entity_id in store
+            ]
+            if entity_type == "playlist":
+                # Only include public playlists in search
+                matched_ids = [playlist_id for playlist_id in matched_ids if store[playlist_id].get("public")]
+            
+            # Phase 2: enrich only the requested page
+            total = len(matched_ids)
+            enrich = enrichers[entity_type]
+            paginated = [enrich(store[entity_id]) for entity_id in matched_ids[offset:offset + limit]]
+            
+            results[f"{entity_type}s"] = {
+                "href": f"https://api.spotify.com/v1/search?q={q}&type={entity_type}&offset={offset}&limit={limit}",
                 "limit": limit,
                 "offset": offset,
                 "total": total,
                 "items": paginated,
-                "previous": f"https://api.spotify.com/v1/search?q={q}&type=track&offset={max(0, offset - limit)}&limit={limit}" if offset > 0 else None,
-                "next": f"https://api.spotify.com/v1/search?q={q}&type=track&offset={offset + limit}&limit={limit}" if offset + limit < total else None
+                "previous": f"https://api.spotify.com/v1/search?q={q}&type={entity_type}&offset={max(0, offset - limit)}&limit={limit}" if offset > 0 else None,
+                "next": f"https://api.spotify.com/v1/search?q={q}&type={entity_type}&offset={offset + limit}&limit={limit}" if offset + limit < total else None
             }
+
+        return results
+
+    def _build_recommendation_index(self) -> None:
+        """
+        Builds the track co-occurrence index used by get_recommendations.
         
-        if "album" in type:
-            matched_albums = []
-            for album in self.albums.values():
-                album_name = album.get("name", album.get("title", ""))
-                if q.lower() in album_name.lower():
-                    matched_albums.append(self._enrich_album(album))
-            
-            total = len(matched_albums)
-            paginated = matched_albums[offset:offset + limit]
-            
-            results["albums"] = {
-                "href": f"https://api.spotify.com/v1/search?q={q}&type=album&offset={offset}&limit={limit}",
-                "limit": limit,
-                "offset": offset,
-                "total": total,
-                "items": paginated,
-                "previous": f"https://api.spotify.com/v1/search?q={q}&type=album&offset={max(0, offset - limit)}&limit={limit}" if offset > 0 else None,
-                "next": f"https://api.spotify.com/v1/search?q={q}&type=album&offset={offset + limit}&limit={limit}" if offset + limit < total else None
-            }
+        Every playlist and every user's liked songs form a "basket" of tracks. The index keeps the
+        sparse basket <-> track incidence in both directions; the co-occurrence of two tracks is
+        the (size-weighted) number of baskets they share, so a seed's co-occurrence row is read
+        straight from the baskets containing it instead of materializing a track x track matrix.
         
-        if "artist" in type:
-            matched_artists = []
-            for artist in self.artists.values():
-                if q.lower() in artist.get("name", "").lower():
-                    matched_artists.append(self._enrich_artist(artist))
+        Side Effects:
+            - Sets self._basket_tracks, self._track_baskets and self._artist_tracks
             
-            total = len(matched_artists)
-            paginated = matched_artists[offset:offset + limit]
+        Note:
+            Built on the first recommendation request; afterwards playlist and library edits keep
+            it current through _update_recommendation_basket in O(changed tracks).
+        """
+        self._basket_tracks = {}
+        self._track_baskets = {}
+        for playlist_id, playlist in self.playlists.items():
+            self._update_recommendation_basket(("playlist", playlist_id), added=self._get_playlist_tracks(playlist))
+        for user_id, user_data in self.users.items():
+            self._update_recommendation_basket(("liked", user_id), added=self._get_library(user_data, "liked_songs"))
+        self._artist_tracks = {}
+        for track_id, track in self.tracks.items():
+            if track.get("artist_id"):
+                self._artist_tracks.setdefault(track["artist_id"], []).append(track_id)
+
+    def _update_recommendation_basket(
+        self, basket: tuple, added: Iterable[str] = (), removed: Iterable[str] = ()
+    ) -> None:
+        """
+        Applies one edit of a basket to the co-occurrence index.
+
+        Args:
+            basket (tuple): ("playlist", playlist ID) or ("liked", user ID)
+            added (Iterable[str]): Track IDs now in the basket (already-present IDs are ignored)
+            removed (Iterable[str]): Track IDs no longer anywhere in the basket
+
+        Side Effects:
+            - Updates self._basket_tracks and self._track_baskets for the given tracks only
             
-            results["artists"] = {
-                "href": f"https://api.spotify.com/v1/search?q={q}&type=artist&offset={offset}&limit={limit}",
-                "limit": limit,
-                "offset": offset,
-                "total": total,
-                "items": paginated,
-                "previous": f"https://api.spotify.com/v1/search?q={q}&type=artist&offset={max(0, offset - limit)}&limit={limit}" if offset > 0 else None,
-                "next": f"https://api.spotify.com/v1/search?q={q}&type=artist&offset={offset + limit}&limit={limit}" if offset + limit < total else None
-            }
+        Note:
+            No-op until the index has been built by _build_recommendation_index. Callers pass
+            only the tracks an edit touched, so the cost is O(changed tracks), not O(basket).
+        """
+        if self._basket_tracks is None:
+            return
+        tracks = self._basket_tracks.setdefault(basket, set())
+        for track_id in removed:
+            if track_id in tracks:
+                tracks.discard(track_id)
+                baskets = self._track_baskets.get(track_id)
+                if baskets is not None:
+                    baskets.discard(basket)
+        for track_id in added:
+            if track_id not in tracks:
+                tracks.add(track_id)
+                self._track_baskets.setdefault(track_id, set()).add(basket)
+        if not tracks:
+            del self._basket_tracks[basket]
+
+    def _track_features(self, track: Dict[str, Any]) -> Tuple[float, float, float]:
+        """
+        Returns a track's (popularity, duration, explicit) attributes scaled to the 0-1 range.
+        
+        Popularity is read from "popularity" or "popularity_score" (default 50); duration is
+        capped at 10 minutes.
+        """
+        popularity = track.get("popularity", track.get("popularity_score", 50)) or 0
+        duration_ms = track.get("duration_ms", track.get("duration", 180) * 1000) or 0
+        return (
+            min(max(popularity / 100.0, 0.0), 1.0),
+            min(max(duration_ms / 600000.0, 0.0), 1.0),
+            1.0 if track.get("explicit") else 0.0,
+        )
+
+    def get_recommendations(
+        self,
+        seed_tracks: Optional[List[str]] = None,
+        seed_artists: Optional[List[str]] = None,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Recommends tracks similar to a set of seed tracks and/or artists.
         
-        if "playlist" in type:
-            matched_playlists = []
-            for playlist in self.playlists.values():
-                if q.lower() in playlist.get("name", "").lower():
-                    # Only include public playlists in search or user's own playlists
-                    if playlist.get("public"):
-                        matched_playlists.append(self._enrich_playlist(playlist))
-            
-            total = len(matched_playlists)
-            paginated = matched_playlists[offset:offset + limit]
-            
-            results["playlists"] = {
-                "href": f"https://api.spotify.com/v1/search?q={q}&type=playlist&offset={offset}&limit={limit}",
-                "limit": limit,
-                "offset": offset,
-                "total": total,
-                "items": paginated,
-                "previous": f"https://api.spotify.com/v1/search?q={q}&type=playlist&offset={max(0, offset - limit)}&limit={limit}" if offset > 0 else None,
-                "next": f"https://api.spotify.com/v1/search?q={q}&type=playlist&offset={offset + limit}&limit={limit}" if offset + limit < total else None
-            }
+        Candidates come from track co-occurrence across all playlists and users' liked songs
+        ("people who put these tracks together also added..."), plus the seed artists' own
+        tracks. Candidates are ranked by co-occurrence strength, closeness to the seeds'
+        popularity, duration and explicit attributes, and whether they are by a seed artist.
+        Corresponds to Spotify's GET /v1/recommendations endpoint.
 
-        return results
+        Args:
+            seed_tracks (Optional[List[str]]): Track IDs to base recommendations on.
+                Example: ["track-uuid-1", "track-uuid-2"]
+            seed_artists (Optional[List[str]]): Artist IDs to base recommendations on.
+                Example: ["artist-uuid-1"]
+            limit (int): Number of tracks to return. Valid range: 1-100. Default: 20
+        
+        Returns:
+            Dict[str, Any]: Recommendations object with structure:
+                {
+                    "seeds": [                      # One entry per seed
+                        {
+                            "id": str,
+                            "type": str,            # "TRACK" or "ARTIST"
+                            "href": str,            # API endpoint URL of the seed
+                            "initialPoolSize": int  # Candidates contributed by this seed
+                        },
+                        # ... more seeds
+                    ],
+                    "tracks": [...]                 # Enriched track objects, best match first
+                }
+        
+        Raises:
+            Exception: If no seeds are provided
+                Error message: "At least one seed track or artist is required"
+            Exception: If more than 5 seeds are provided in total
+                Error message: "Maximum 5 seeds can be provided"
+            Exception: If limit is outside 1-100
+                Error message: "Limit must be between 1 and 100"
+            Exception: If a seed track or artist doesn't exist
+                Error message: "Track {track_id} not found" / "Artist {artist_id} not found"
+                
+        Note:
+            - Does not require authentication (public catalog access)
+            - Seed tracks are never recommended back
+            - The co-occurrence index is built on first use and then kept in sync with playlist
+              and liked-song changes, so each request only reads the seeds' baskets
+            - When the seeds share no baskets with other tracks, falls back to same-genre tracks
+            
+        Example:
+            >>> api = SpotifyApis()
+            >>> result = api.get_recommendations(seed_tracks=["track-id-1"], limit=10)
+            >>> for track in result["tracks"]:
+            ...     print(track["name"])
+        """
+        seed_tracks = list(seed_tracks or [])
+        seed_artists = list(seed_artists or [])
+        if not seed_tracks and not seed_artists:
+            raise Exception("At least one seed track or artist is required")
+        if len(seed_tracks) + len(seed_artists) > 5:
+            raise Exception("Maximum 5 seeds can be provided")
+        if not 1 <= limit <= 100:
+            raise Exception("Limit must be between 1 and 100")
+        for track_id in seed_tracks:
+            if track_id not in self.tracks:
+                raise Exception(f"Track {track_id} not found")
+        for artist_id in seed_artists:
+            if artist_id not in self.artists:
+                raise Exception(f"Artist {artist_id} not found")
+        
+        if self._basket_tracks is None:
+            self._build_recommendation_index()
+        
+        # Weighted seed tracks: explicit seeds count fully, a seed artist's most popular tracks half
+        weighted_seeds: Dict[str, float] = {track_id: 1.0 for track_id in seed_tracks}
+        seeds = []
+        for track_id in seed_tracks:
+            pool = set()
+            for basket in self._track_baskets.get(track_id, ()):
+                pool.update(self._basket_tracks[basket])
+            pool.discard(track_id)
+            seeds.append({"id": track_id, "type": "TRACK", "href": self._generate_api_href("tracks", track_id),
+                          "initialPoolSize": len(pool)})
+        for artist_id in seed_artists:
+            artist_tracks = self._artist_tracks.get(artist_id, [])
+            top_tracks = heapq.nlargest(5, artist_tracks, key=lambda t: self._track_features(self.tracks[t])[0])
+            for track_id in top_tracks:
+                weighted_seeds[track_id] = max(weighted_seeds.get(track_id, 0.0), 0.5)
+            seeds.append({"id": artist_id, "type": "ARTIST", "href": self._generate_api_href("artists", artist_id),
+                          "initialPoolSize": len(artist_tracks)})
+        
+        # Co-occurrence scores: sum of the seeds' sparse co-occurrence rows
+        cooccurrence: Dict[str, float] = {}
+        for track_id, weight in weighted_seeds.items():
+            for basket in self._track_baskets.get(track_id, ()):
+                members = self._basket_tracks[basket]
+                contribution = weight / len(members)
+                for other_id in members:
+                    cooccurrence[other_id] = cooccurrence.get(other_id, 0.0) + contribution
+        
+        seed_artist_set = set(seed_artists)
+        candidates = set(cooccurrence)
+        for artist_id in seed_artists:
+            candidates.update(self._artist_tracks.get(artist_id, []))
+        candidates.difference_update(seed_tracks)
+        candidates.intersection_update(self.tracks)
+        if not candidates:
+            seed_genres = {self.tracks[t].get("genre") for t in weighted_seeds if t in self.tracks}
+            candidates = {t for t, track in self.tracks.items() if track.get("genre") in seed_genres}
+            candidates.difference_update(seed_tracks)
+        
+        # Seed attribute centroid
+        seed_features = [self._track_features(self.tracks[t]) for t in weighted_seeds if t in self.tracks]
+        centroid = tuple(sum(values) / len(seed_features) for values in zip(*seed_features)) if seed_features else None
+        max_cooccurrence = max(cooccurrence.values(), default=0.0) or 1.0
+        
+        def score(track_id: str) -> float:
+            track = self.tracks[track_id]
+            total = 0.7 * cooccurrence.get(track_id, 0.0) / max_cooccurrence
+            if centroid is not None:
+                features = self._track_features(track)
+                total += 0.2 * (1.0 - sum(abs(a - b) for a, b in zip(features, centroid)) / 3.0)
+            if track.get("artist_id") in seed_artist_set:
+                total += 0.1
+            return total
+        
+        ranked = heapq.nlargest(limit, candidates, key=lambda t: (score(t), t))
+        return {
+            "seeds": seeds,
+            "tracks": [self._enrich_track(self.tracks[track_id]) for track_id in ranked]
+        }
 
     def reset_data(self) -> None:
         """
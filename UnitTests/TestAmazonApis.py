@@ -143,6 +143,40 @@ class TestAmazonApis(unittest.TestCase):
         self.assertTrue(result["search_status"])
         self.assertIn("products", result)
 
+    def test_fuzzy_search_products_misspelled_name(self):
+        """Test fuzzy search finds a product from a misspelled name."""
+        words = [w for w in self.REAL_PRODUCT_NAME_1.split() if len(w) > 5 and w.isalpha()]
+        if not words:
+            self.skipTest("No suitable word in product name")
+        word = words[0]
+        misspelled = word[:2] + word[3] + word[2] + word[4:]
+        result = self.amazon_api.fuzzy_search_products(misspelled, max_results=50)
+        self.assertTrue(result["search_status"])
+        product_ids = [p["product_id"] for p in result["products"]]
+        self.assertIn(self.REAL_PRODUCT_ID_1, product_ids)
+        scores = [p["match_score"] for p in result["products"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_fuzzy_search_products_joins_split_words(self):
+        """Test fuzzy search matches a product word transcribed as two words."""
+        self.amazon_api.state["products"]["spoken_test_product"] = {
+            "name": "Zyntrex Smartwatch", "description": "", "seller": "Test",
+            "price": 10.0, "stock": 1, "category": "Electronics",
+        }
+        result = self.amazon_api.fuzzy_search_products("zintrex smart watch", max_results=1)
+        self.assertEqual(result["products"][0]["product_id"], "spoken_test_product")
+
+    def test_search_products_falls_back_to_fuzzy(self):
+        """Test search_products returns fuzzy candidates when nothing matches exactly."""
+        self.amazon_api.state["products"]["spoken_test_product"] = {
+            "name": "Zyntrex Smartwatch", "description": "", "seller": "Test",
+            "price": 10.0, "stock": 1, "category": "Electronics",
+        }
+        result = self.amazon_api.search_products("zintrex")
+        self.assertTrue(result["search_status"])
+        self.assertTrue(result.get("fuzzy_match"))
+        self.assertEqual(result["products"][0]["product_id"], "spoken_test_product")
+
     def test_show_product_details_success(self):
         """Test showing product details."""
         result = self.amazon_api.show_product_details(self.REAL_PRODUCT_ID_1)
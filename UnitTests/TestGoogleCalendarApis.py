@@ -81,6 +81,27 @@ class TestGoogleCalendarApis(unittest.TestCase):
         result = self.calendar_api.list_calendar_list()
         self.assertEqual(result["kind"], "calendar#calendarList")
 
+    def test_list_calendar_list_if_none_match(self):
+        """Test that the calendar list etag only changes when a calendar does."""
+        first = self.calendar_api.list_calendar_list()
+        self.assertEqual(self.calendar_api.list_calendar_list()["etag"], first["etag"])
+        self.assertEqual(
+            self.calendar_api.list_calendar_list(if_none_match=first["etag"]),
+            {"kind": "calendar#calendarList", "etag": first["etag"], "notModified": True},
+        )
+
+        created = self.calendar_api.insert_calendar("Etag Calendar", self.TIME_ZONE)
+        created_etag = created["etag"]
+        second = self.calendar_api.list_calendar_list(if_none_match=first["etag"])
+        self.assertNotEqual(second["etag"], first["etag"])
+        entry = next(item for item in second["items"] if item["id"] == created["id"])
+        self.assertEqual(entry["etag"], created_etag)
+
+        updated = self.calendar_api.update_calendar(created["id"], summary="Renamed")
+        self.assertNotEqual(updated["etag"], created_etag)
+        self.assertEqual(self.calendar_api.get_calendar(created["id"])["etag"], updated["etag"])
+        self.assertNotEqual(self.calendar_api.list_calendar_list()["etag"], second["etag"])
+
     # --- Create Calendar Tests ---
     
     def test_insert_calendar_success(self):
@@ -254,6 +275,213 @@ class TestGoogleCalendarApis(unittest.TestCase):
         result = self.calendar_api.list_events(calendar_id, q="Unique")
         self.assertGreater(len(result["items"]), 0)
 
+    def test_list_events_time_window_across_time_zones(self):
+        """Test that time windows compare instants, not dateTime strings."""
+        created_cal = self.calendar_api.insert_calendar("Zones Calendar", "UTC")
+        calendar_id = created_cal["id"]
+        # 09:00 in Tokyo is 00:00 UTC; 09:00 in New York is 14:00 UTC
+        tokyo = self.calendar_api.insert_event(
+            calendar_id, "Tokyo Standup", "2025-06-02T09:00:00", "2025-06-02T09:30:00", "Asia/Tokyo"
+        )
+        new_york = self.calendar_api.insert_event(
+            calendar_id, "New York Standup", "2025-06-02T09:00:00", "2025-06-02T09:30:00", "America/New_York"
+        )
+        offset = self.calendar_api.insert_event(
+            calendar_id, "Offset Review", "2025-06-02T12:00:00+02:00", "2025-06-02T13:00:00+02:00"
+        )
+
+        result = self.calendar_api.list_events(
+            calendar_id, time_min="2025-06-02T09:00:00Z", time_max="2025-06-02T15:00:00Z"
+        )
+        self.assertEqual([event["id"] for event in result["items"]], [offset["id"], new_york["id"]])
+
+        result = self.calendar_api.list_events(calendar_id, time_max="2025-06-02T01:00:00+00:00")
+        self.assertEqual([event["id"] for event in result["items"]], [tokyo["id"]])
+
+        self.calendar_api.update_event(calendar_id, tokyo["id"], time_zone="Europe/London")
+        result = self.calendar_api.list_events(
+            calendar_id, time_min="2025-06-02T07:00:00Z", time_max="2025-06-02T09:00:00Z"
+        )
+        self.assertEqual([event["id"] for event in result["items"]], [tokyo["id"]])
+
+    def test_list_events_window_follows_interleaved_changes(self):
+        """Test windowed listings stay exact while events are added and removed between queries."""
+        calendar_id = self.calendar_api.insert_calendar("Churn Calendar", "UTC")["id"]
+        window = {"time_min": "2025-06-02T10:00:00Z", "time_max": "2025-06-02T12:00:00Z"}
+        expected = []
+        for hour in range(6, 16):
+            # Each event lasts three hours; those starting 07:00-11:00 reach the window (ends are inclusive)
+            event = self.calendar_api.insert_event(
+                calendar_id, f"Shift {hour}", f"2025-06-02T{hour:02d}:00:00", f"2025-06-02T{hour + 3:02d}:00:00", "UTC"
+            )
+            if 7 <= hour <= 11:
+                expected.append(event["id"])
+            listed = self.calendar_api.list_events(calendar_id, **window)["items"]
+            self.assertEqual([item["id"] for item in listed], expected)
+
+        self.calendar_api.delete_event(calendar_id, expected.pop(1))
+        moved = expected.pop(0)
+        self.calendar_api.update_event(
+            calendar_id, moved, start_time="2025-06-02T11:30:00", end_time="2025-06-02T11:45:00"
+        )
+        expected.append(moved)
+        listed = self.calendar_api.list_events(calendar_id, **window)["items"]
+        self.assertEqual([item["id"] for item in listed], expected)
+
+    def test_list_events_read_only_and_invalid_window(self):
+        """Test read-only listings share stored events and bad bounds are rejected."""
+        created_cal = self.calendar_api.insert_calendar("Read Only Calendar", self.TIME_ZONE)
+        calendar_id = created_cal["id"]
+        event = self.calendar_api.insert_event(
+            calendar_id, "Shared Event", self.START_TIME, self.END_TIME, self.TIME_ZONE
+        )
+
+        first = self.calendar_api.list_events(calendar_id, read_only=True)["items"][0]
+        second = self.calendar_api.list_events(calendar_id, read_only=True)["items"][0]
+        self.assertIs(first, second)
+        self.assertEqual(first["etag"], event["etag"])
+        self.assertIsNot(self.calendar_api.list_events(calendar_id)["items"][0], first)
+
+        with self.assertRaises(Exception) as context:
+            self.calendar_api.list_events(calendar_id, time_min="next tuesday")
+        self.assertIn("Invalid time_min", str(context.exception))
+
+    def test_list_events_expands_recurring_event_in_window(self):
+        """Test that recurring events are expanded per window and exception dates are skipped."""
+        calendar_id = self.calendar_api.insert_calendar("Recurring Calendar", self.TIME_ZONE)["id"]
+        # Mondays and Wednesdays at 10:00 New York time, across the March DST change
+        standup = self.calendar_api.insert_event(
+            calendar_id, "Standup", "2025-03-03T10:00:00", "2025-03-03T10:15:00", self.TIME_ZONE,
+            recurrence=["RRULE:FREQ=WEEKLY;BYDAY=MO,WE", "EXDATE;TZID=America/New_York:20250305T100000"],
+        )
+        single = self.calendar_api.insert_event(
+            calendar_id, "Planning", "2025-03-10T15:00:00Z", "2025-03-10T16:00:00Z"
+        )
+
+        result = self.calendar_api.list_events(
+            calendar_id, time_min="2025-03-03T00:00:00Z", time_max="2025-03-13T00:00:00Z", single_events=True
+        )
+        self.assertEqual([event["id"] for event in result["items"]], [
+            standup["id"] + "_20250303T150000Z",
+            standup["id"] + "_20250310T140000Z",
+            single["id"],
+            standup["id"] + "_20250312T140000Z",
+        ])
+        self.assertEqual(result["items"][1]["recurringEventId"], standup["id"])
+        self.assertEqual(result["items"][1]["start"]["dateTime"], "2025-03-10T10:00:00-04:00")
+
+        # Without single_events the recurring event is listed once
+        result = self.calendar_api.list_events(
+            calendar_id, time_min="2025-03-03T00:00:00Z", time_max="2025-03-13T00:00:00Z"
+        )
+        self.assertEqual([event["id"] for event in result["items"]], [standup["id"], single["id"]])
+
+        with self.assertRaises(Exception) as context:
+            self.calendar_api.list_events(calendar_id, single_events=True)
+        self.assertIn("time_max is required", str(context.exception))
+
+        with self.assertRaises(Exception) as context:
+            self.calendar_api.insert_event(
+                calendar_id, "Bad", self.START_TIME, self.END_TIME, recurrence=["RRULE:FREQ=HOURLY"]
+            )
+        self.assertIn("Invalid recurrence", str(context.exception))
+
+    def test_list_events_keeps_several_recurring_series_apart(self):
+        """Test that occurrences of different recurring events keep their own event's details."""
+        calendar_id = self.calendar_api.insert_calendar("Two Series Calendar", "UTC")["id"]
+        standup = self.calendar_api.insert_event(
+            calendar_id, "Standup", "2025-06-02T09:00:00Z", "2025-06-02T09:15:00Z",
+            recurrence=["RRULE:FREQ=DAILY;COUNT=3"],
+        )
+        review = self.calendar_api.insert_event(
+            calendar_id, "Review", "2025-06-02T14:00:00Z", "2025-06-02T15:00:00Z",
+            recurrence=["RRULE:FREQ=DAILY;COUNT=2"],
+        )
+
+        result = self.calendar_api.list_events(
+            calendar_id, time_min="2025-06-01T00:00:00Z", time_max="2025-06-10T00:00:00Z", single_events=True
+        )
+        self.assertEqual(
+            [(event["recurringEventId"], event["summary"]) for event in result["items"]],
+            [
+                (standup["id"], "Standup"), (review["id"], "Review"),
+                (standup["id"], "Standup"), (review["id"], "Review"),
+                (standup["id"], "Standup"),
+            ],
+        )
+        self.assertEqual(result["items"][1]["id"], review["id"] + "_20250602T140000Z")
+
+        result = self.calendar_api.list_events(
+            calendar_id, time_min="2025-06-01T00:00:00Z", time_max="2025-06-10T00:00:00Z",
+            single_events=True, q="review",
+        )
+        self.assertEqual([event["recurringEventId"] for event in result["items"]], [review["id"]] * 2)
+
+    def test_recurring_event_instances_and_free_busy(self):
+        """Test getting and deleting single occurrences, and their effect on free/busy."""
+        calendar_id = self.calendar_api.insert_calendar("Daily Calendar", "UTC")["id"]
+        daily = self.calendar_api.insert_event(
+            calendar_id, "Daily Sync", "2025-06-02T09:00:00Z", "2025-06-02T09:30:00Z",
+            recurrence=["RRULE:FREQ=DAILY;COUNT=5"],
+        )
+        instance_id = daily["id"] + "_20250603T090000Z"
+
+        instance = self.calendar_api.get_event(calendar_id, instance_id)
+        self.assertEqual(instance["summary"], "Daily Sync")
+        self.assertNotIn("recurrence", instance)
+
+        self.calendar_api.delete_event(calendar_id, instance_id)
+        self.assertIn("EXDATE:20250603T090000Z", self.calendar_api.get_event(calendar_id, daily["id"])["recurrence"])
+        with self.assertRaises(Exception):
+            self.calendar_api.get_event(calendar_id, instance_id)
+
+        result = self.calendar_api.check_free_busy(
+            "2025-06-02T00:00:00Z", "2025-06-10T00:00:00Z", [{"id": calendar_id}]
+        )
+        self.assertEqual([busy["start"] for busy in result["calendars"][calendar_id]["busy"]], [
+            "2025-06-02T09:00:00Z", "2025-06-04T09:00:00Z", "2025-06-05T09:00:00Z", "2025-06-06T09:00:00Z",
+        ])
+
+    def test_list_events_and_get_event_if_none_match(self):
+        """Test that etags are stable until a change and unchanged reads return not-modified."""
+        calendar_id = self.calendar_api.insert_calendar("Etag Calendar", self.TIME_ZONE)["id"]
+        event = self.calendar_api.insert_event(
+            calendar_id, "Etag Event", self.START_TIME, self.END_TIME, self.TIME_ZONE
+        )
+        event_etag = event["etag"]
+
+        listing = self.calendar_api.list_events(calendar_id)
+        self.assertEqual(self.calendar_api.list_events(calendar_id)["etag"], listing["etag"])
+        self.assertEqual(listing["items"][0]["etag"], event_etag)
+        not_modified = self.calendar_api.list_events(calendar_id, if_none_match=listing["etag"])
+        self.assertTrue(not_modified["notModified"])
+        self.assertNotIn("items", not_modified)
+
+        fetched = self.calendar_api.get_event(calendar_id, event["id"])
+        self.assertEqual(fetched["etag"], event_etag)
+        self.assertTrue(self.calendar_api.get_event(calendar_id, event["id"], if_none_match=event_etag)["notModified"])
+
+        updated = self.calendar_api.update_event(calendar_id, event["id"], summary="Renamed")
+        self.assertNotEqual(updated["etag"], event_etag)
+        self.assertEqual(self.calendar_api.get_event(calendar_id, event["id"], if_none_match=event_etag)["summary"], "Renamed")
+        relisted = self.calendar_api.list_events(calendar_id, if_none_match=listing["etag"])
+        self.assertNotEqual(relisted["etag"], listing["etag"])
+        self.assertEqual(relisted["items"][0]["summary"], "Renamed")
+
+    def test_update_calendar_time_zone_changes_event_list_etag(self):
+        """Test that moving a calendar to another time zone invalidates its event list etag."""
+        calendar_id = self.calendar_api.insert_calendar("Zone Calendar", self.TIME_ZONE)["id"]
+        self.calendar_api.insert_event(calendar_id, "Zone Event", self.START_TIME, self.END_TIME, self.TIME_ZONE)
+        listing = self.calendar_api.list_events(calendar_id)
+
+        self.calendar_api.update_calendar(calendar_id, summary="Renamed Zone Calendar")
+        self.assertTrue(self.calendar_api.list_events(calendar_id, if_none_match=listing["etag"])["notModified"])
+
+        self.calendar_api.update_calendar(calendar_id, time_zone="Asia/Tokyo")
+        relisted = self.calendar_api.list_events(calendar_id, if_none_match=listing["etag"])
+        self.assertNotIn("notModified", relisted)
+        self.assertNotEqual(relisted["etag"], listing["etag"])
+
     # --- Delete Event Tests ---
     
     def test_delete_event_success(self):
@@ -372,6 +600,100 @@ class TestGoogleCalendarApis(unittest.TestCase):
         self.assertEqual(result["kind"], "calendar#freeBusy")
         # Non-existent calendars are just not included in response
 
+    def test_check_free_busy_merges_overlapping_events(self):
+        """Test that overlapping and adjacent events collapse into clipped busy periods."""
+        created_cal = self.calendar_api.insert_calendar("Busy Calendar", "UTC")
+        calendar_id = created_cal["id"]
+        self.calendar_api.insert_event(calendar_id, "Early", "2025-06-02T08:00:00Z", "2025-06-02T09:30:00Z")
+        self.calendar_api.insert_event(calendar_id, "Overlap", "2025-06-02T09:00:00Z", "2025-06-02T10:00:00Z")
+        self.calendar_api.insert_event(calendar_id, "Adjacent", "2025-06-02T10:00:00Z", "2025-06-02T10:30:00Z")
+        self.calendar_api.insert_event(calendar_id, "Later", "2025-06-02T13:00:00Z", "2025-06-02T14:00:00Z")
+        self.calendar_api.insert_event(calendar_id, "Outside", "2025-06-02T18:00:00Z", "2025-06-02T19:00:00Z")
+
+        result = self.calendar_api.check_free_busy(
+            "2025-06-02T08:30:00Z", "2025-06-02T13:30:00Z", [{"id": calendar_id}]
+        )
+        self.assertEqual(result["calendars"][calendar_id]["busy"], [
+            {"start": "2025-06-02T08:30:00Z", "end": "2025-06-02T10:30:00Z"},
+            {"start": "2025-06-02T13:00:00Z", "end": "2025-06-02T13:30:00Z"},
+        ])
+        self.assertEqual(result["calendars"][calendar_id]["errors"], [])
+
+    def test_check_free_busy_multiple_calendars_and_time_zones(self):
+        """Test one call covering several calendars whose events use different time zones."""
+        utc_cal = self.calendar_api.insert_calendar("UTC Calendar", "UTC")["id"]
+        tokyo_cal = self.calendar_api.insert_calendar("Tokyo Calendar", "Asia/Tokyo")["id"]
+        self.calendar_api.insert_event(utc_cal, "UTC Sync", "2025-06-02T00:00:00", "2025-06-02T01:00:00")
+        # 09:00 in Tokyo is 00:00 UTC
+        self.calendar_api.insert_event(tokyo_cal, "Tokyo Sync", "2025-06-02T09:00:00", "2025-06-02T09:30:00", "Asia/Tokyo")
+
+        result = self.calendar_api.check_free_busy(
+            "2025-06-01T23:00:00Z", "2025-06-02T02:00:00Z", [utc_cal, {"id": tokyo_cal}, {"id": "missing"}]
+        )
+        calendars = result["calendars"]
+        self.assertEqual(calendars[utc_cal]["busy"], [{"start": "2025-06-02T00:00:00Z", "end": "2025-06-02T01:00:00Z"}])
+        self.assertEqual(calendars[tokyo_cal]["busy"], [{"start": "2025-06-02T00:00:00Z", "end": "2025-06-02T00:30:00Z"}])
+        self.assertEqual(calendars["missing"]["errors"][0]["reason"], "notFound")
+
+        result = self.calendar_api.check_free_busy("not a time", "2025-06-02T02:00:00Z", [{"id": utc_cal}])
+        self.assertEqual(result["calendars"][utc_cal]["errors"][0]["reason"], "invalid")
+
+    # --- Find Meeting Slots Tests ---
+
+    def test_find_meeting_slots_across_attendees(self):
+        """Test that slots avoid every attendee's events and stay inside working hours."""
+        alice_cal = self.calendar_api.insert_calendar("Alice Slots", "UTC")["id"]
+        self.calendar_api.insert_event(alice_cal, "Alice Busy", "2031-03-03T09:00:00Z", "2031-03-03T10:30:00Z")
+        self.calendar_api.authenticate(self.EMAIL_BOB)
+        bob_cal = self.calendar_api.insert_calendar("Bob Slots", "UTC")["id"]
+        self.calendar_api.insert_event(bob_cal, "Bob Busy", "2031-03-03T10:00:00Z", "2031-03-03T11:00:00Z")
+
+        result = self.calendar_api.find_meeting_slots(
+            [self.EMAIL_ALICE, self.EMAIL_BOB],
+            60,
+            {"start": "2031-03-03T00:00:00Z", "end": "2031-03-04T00:00:00Z"},
+            {"start": "09:00", "end": "13:00", "timeZone": "UTC"},
+        )
+        self.assertEqual(
+            [(slot["start"], slot["end"]) for slot in result["slots"]],
+            [
+                ("2031-03-03T11:00:00Z", "2031-03-03T12:00:00Z"),
+                ("2031-03-03T11:30:00Z", "2031-03-03T12:30:00Z"),
+                ("2031-03-03T12:00:00Z", "2031-03-03T13:00:00Z"),
+            ],
+        )
+
+        # Saturday is outside the default working days
+        result = self.calendar_api.find_meeting_slots(
+            [self.EMAIL_BOB], 30,
+            {"start": "2031-03-08T00:00:00Z", "end": "2031-03-09T00:00:00Z"},
+            {"start": "09:00", "end": "17:00", "timeZone": "UTC"},
+        )
+        self.assertEqual(result["slots"], [])
+
+    def test_find_meeting_slots_ranks_optional_attendees(self):
+        """Test that slots where optional attendees are free rank first."""
+        self.calendar_api.authenticate(self.EMAIL_BOB)
+        bob_cal = self.calendar_api.insert_calendar("Bob Optional", "UTC")["id"]
+        self.calendar_api.insert_event(bob_cal, "Bob Morning", "2031-03-04T09:00:00Z", "2031-03-04T10:00:00Z")
+        self.calendar_api.authenticate(self.EMAIL_ALICE)
+
+        result = self.calendar_api.find_meeting_slots(
+            [self.EMAIL_ALICE], 60,
+            {"start": "2031-03-04T09:00:00Z", "end": "2031-03-04T11:00:00Z"},
+            optional_attendee_emails=[self.EMAIL_BOB], step_minutes=60, max_results=1,
+        )
+        self.assertEqual(result["slots"], [{
+            "start": "2031-03-04T10:00:00Z", "end": "2031-03-04T11:00:00Z",
+            "availableOptionalAttendees": [self.EMAIL_BOB],
+        }])
+
+        with self.assertRaises(Exception) as context:
+            self.calendar_api.find_meeting_slots(
+                ["nobody@example.com"], 30, {"start": "2031-03-04T09:00:00Z", "end": "2031-03-04T11:00:00Z"}
+            )
+        self.assertIn("User not found", str(context.exception))
+
     # --- Multi-user Tests ---
     
     def test_calendar_isolation_between_users(self):
@@ -184,6 +184,45 @@ class TestGoogleDriveApis(unittest.TestCase):
         file_names = [f["name"] for f in result["files"]]
         self.assertIn(unique_name, file_names)
 
+    def test_list_files_compound_query(self):
+        """Test combining query terms with and/or/not and parentheses."""
+        folder = self.drive_api.create_folder(name="query_test_folder")
+        report = self.drive_api.create_file(name="query_report.pdf", mimeType="application/pdf", parents=[folder["id"]])
+        notes = self.drive_api.create_file(name="query_notes.txt", mimeType="text/plain", parents=[folder["id"]], starred=True)
+        draft = self.drive_api.create_file(name="query_draft.txt", mimeType="text/plain", parents=[folder["id"]])
+        self.drive_api.update_file(draft["id"], trashed=True)
+
+        result = self.drive_api.list_files(
+            q=f"'{folder['id']}' in parents and (mimeType = 'application/pdf' or starred = true) and not trashed = true"
+        )
+        self.assertEqual([f["id"] for f in result["files"]], [report["id"], notes["id"]])
+
+        result = self.drive_api.list_files(q=f"'{folder['id']}' in parents and name contains 'DRAFT'")
+        self.assertEqual([f["id"] for f in result["files"]], [draft["id"]])
+
+        result = self.drive_api.list_files(
+            q=f"name contains 'query_' and mimeType = 'text/plain' and not trashed and '{folder['id']}' in parents"
+        )
+        self.assertEqual([f["id"] for f in result["files"]], [notes["id"]])
+
+        # The index follows later updates
+        self.drive_api.update_file(report["id"], removeParents=folder["id"])
+        result = self.drive_api.list_files(q=f"'{folder['id']}' in parents and trashed = false")
+        self.assertEqual([f["id"] for f in result["files"]], [notes["id"]])
+
+    def test_list_files_query_by_modified_time(self):
+        """Test comparing modifiedTime and rejecting malformed queries."""
+        created = self.drive_api.create_file(name="query_time_file.txt", mimeType="text/plain")
+        result = self.drive_api.list_files(q=f"modifiedTime >= '{created['modifiedTime']}' and name = 'query_time_file.txt'")
+        self.assertEqual([f["id"] for f in result["files"]], [created["id"]])
+        result = self.drive_api.list_files(q=f"modifiedTime < '{created['modifiedTime']}' and name = 'query_time_file.txt'")
+        self.assertEqual(result["files"], [])
+
+        for bad_query in ["name contains", "(trashed = true", "size > 10", "trashed = 'yes'"]:
+            with self.assertRaises(Exception) as context:
+                self.drive_api.list_files(q=bad_query)
+            self.assertIn("Invalid query", str(context.exception))
+
     # --- File Update Tests ---
     
     def test_update_file_name(self):
@@ -266,6 +305,21 @@ class TestGoogleDriveApis(unittest.TestCase):
         copied = self.drive_api.copy_file(original_id)
         self.assertTrue(copied["name"].startswith("Copy of"))
 
+    def test_copy_file_parents_are_independent(self):
+        """Test re-parenting a copy leaves the original and the caller's parents list alone."""
+        source = self.drive_api.create_folder("Copy Source")
+        target = self.drive_api.create_folder("Copy Target")
+        parents = [source["id"]]
+        original = self.drive_api.create_file(name="shared_parents.txt", mimeType="text/plain", parents=parents)
+        copied = self.drive_api.copy_file(original["id"])
+
+        self.drive_api.update_file(copied["id"], addParents=target["id"])
+        self.assertEqual(parents, [source["id"]])
+        self.assertEqual(self.drive_api.get_file(original["id"])["parents"], [source["id"]])
+        self.assertEqual(self.drive_api.get_file(copied["id"])["parents"], [source["id"], target["id"]])
+        in_target = [f["id"] for f in self.drive_api.list_files(q=f"'{target['id']}' in parents")["files"]]
+        self.assertEqual(in_target, [copied["id"]])
+
     def test_copy_file_not_found(self):
         """Test copying non-existent file."""
         with self.assertRaises(Exception) as context:
@@ -291,6 +345,56 @@ class TestGoogleDriveApis(unittest.TestCase):
         child = self.drive_api.create_folder("Child Folder", parents=[parent_id])
         self.assertIn(parent_id, child["parents"])
 
+    def test_folder_paths_moves_and_sizes(self):
+        """Test resolving paths, moving folders and keeping folder sizes current."""
+        projects = self.drive_api.create_folder("Tree Projects")
+        archive = self.drive_api.create_folder("Tree Archive")
+        inner = self.drive_api.create_folder("Inner", parents=[projects["id"]])
+        copied = self.drive_api.copy_file(self.REAL_FILE_ID, name="sized.bin", parents=[inner["id"]])
+        size = int(copied["size"])
+
+        self.assertEqual(self.drive_api.resolve_path("/Tree Projects/Inner/sized.bin")["id"], copied["id"])
+        self.assertEqual(self.drive_api.resolve_path("/")["id"], "root")
+        with self.assertRaises(Exception) as context:
+            self.drive_api.resolve_path("/Tree Projects/Missing")
+        self.assertIn("Path not found", str(context.exception))
+
+        self.assertEqual(self.drive_api.get_folder_size(projects["id"])["size"], str(size))
+        self.drive_api.update_file(inner["id"], addParents=archive["id"], removeParents=projects["id"])
+        self.assertEqual(self.drive_api.get_folder_size(projects["id"])["size"], "0")
+        self.assertEqual(self.drive_api.get_folder_size(archive["id"])["size"], str(size))
+        self.assertEqual(self.drive_api.resolve_path("Tree Archive/Inner/sized.bin")["id"], copied["id"])
+
+        with self.assertRaises(Exception) as context:
+            self.drive_api.update_file(archive["id"], addParents=inner["id"])
+        self.assertIn("subfolders", str(context.exception))
+
+    def test_folder_trash_and_delete_are_recursive(self):
+        """Test that trashing, restoring and deleting a folder apply to its contents."""
+        user_info = self.drive_api.users[self.user_id_alice]["drive_data"]["user_info"]
+        used_before = user_info["storage_quota"]["used"]
+        folder = self.drive_api.create_folder("Recursive Folder")
+        sub = self.drive_api.create_folder("Sub", parents=[folder["id"]])
+        kept_trashed = self.drive_api.create_file("already_trashed.txt", parents=[sub["id"]])
+        copied = self.drive_api.copy_file(self.REAL_FILE_ID, name="nested.bin", parents=[sub["id"]])
+        self.drive_api.update_file(kept_trashed["id"], trashed=True)
+
+        self.drive_api.update_file(folder["id"], trashed=True)
+        self.assertTrue(self.drive_api.get_file(copied["id"])["trashed"])
+        self.assertFalse(self.drive_api.get_file(copied["id"])["explicitlyTrashed"])
+
+        self.drive_api.update_file(folder["id"], trashed=False)
+        self.assertFalse(self.drive_api.get_file(sub["id"])["trashed"])
+        self.assertFalse(self.drive_api.get_file(copied["id"])["trashed"])
+        self.assertTrue(self.drive_api.get_file(kept_trashed["id"])["trashed"])
+
+        self.drive_api.delete_file(folder["id"])
+        for file_id in (sub["id"], kept_trashed["id"], copied["id"]):
+            with self.assertRaises(Exception):
+                self.drive_api.get_file(file_id)
+        self.assertEqual(user_info["storage_quota"]["used"], used_before)
+        self.assertEqual(self.drive_api.list_files(q=f"'{sub['id']}' in parents")["files"], [])
+
     # --- Permission/Sharing Tests ---
     
     def test_create_permission_user(self):
@@ -1,4 +1,5 @@
 import unittest
+import copy
 import sys
 from pathlib import Path
 
@@ -153,6 +154,33 @@ class TestSpotifyApis(unittest.TestCase):
         self.assertIn("uri", track)
         self.assertIn("href", track)
 
+    def test_get_track_is_cached_and_read_only(self):
+        """Test repeated track reads share one read-only enriched object."""
+        first = self.spotify_api.get_track(self.REAL_TRACK_ID)
+        second = self.spotify_api.get_track(self.REAL_TRACK_ID)
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first["name"] = "Changed"
+        mutable = copy.deepcopy(first)
+        mutable["name"] = "Changed"
+        self.assertEqual(type(mutable), dict)
+        self.assertNotEqual(self.spotify_api.get_track(self.REAL_TRACK_ID)["name"], "Changed")
+
+    def test_playlist_cache_invalidated_on_change(self):
+        """Test playlist mutations bump the version and refresh the enriched object."""
+        created = self.spotify_api.create_playlist(
+            user_id=self.REAL_USER_ID,
+            name="Cache Test",
+            public=True
+        )
+        before = self.spotify_api.get_playlist(created["id"])
+        self.assertIs(before, self.spotify_api.get_playlist(created["id"]))
+        self.spotify_api.change_playlist_details(playlist_id=created["id"], name="Cache Test Renamed")
+        after = self.spotify_api.get_playlist(created["id"])
+        self.assertEqual(after["name"], "Cache Test Renamed")
+        self.spotify_api.add_items_to_playlist(created["id"], [f"spotify:track:{self.REAL_TRACK_ID}"])
+        self.assertEqual(self.spotify_api.get_playlist(created["id"])["tracks"]["total"], 1)
+
     def test_get_track_not_found(self):
         """Test getting non-existent track."""
         with self.assertRaises(Exception) as context:
@@ -185,6 +213,47 @@ class TestSpotifyApis(unittest.TestCase):
         # Should not raise exception
         self.spotify_api.save_tracks([self.REAL_TRACK_ID])
 
+    def test_saved_tracks_record_added_at_in_save_order(self):
+        """Test newly saved tracks get their own added_at and are paged in save order."""
+        track_ids = [t for t in self.spotify_api.tracks if t != self.REAL_TRACK_ID][:2]
+        self.spotify_api.remove_saved_tracks(track_ids + [self.REAL_TRACK_ID])
+        before = self.spotify_api.get_saved_tracks(limit=1)["total"]
+        self.spotify_api.save_tracks([self.REAL_TRACK_ID] + track_ids)
+        self.spotify_api.save_tracks([self.REAL_TRACK_ID])  # Re-saving is a no-op
+
+        result = self.spotify_api.get_saved_tracks(limit=3, offset=before)
+        self.assertEqual(result["total"], before + 3)
+        self.assertEqual([item["track"]["id"] for item in result["items"]], [self.REAL_TRACK_ID] + track_ids)
+        user_data = self.spotify_api.users[self.REAL_USER_ID]
+        for item in result["items"]:
+            self.assertNotEqual(item["added_at"], user_data.get("last_active_date"))
+        self.assertEqual(self.spotify_api.check_saved_tracks(track_ids), [True, True])
+
+    def test_save_tracks_with_unknown_id_saves_nothing(self):
+        """Test an unknown track ID rejects the whole request before any track is saved."""
+        track_id = next(t for t in self.spotify_api.tracks if t != self.REAL_TRACK_ID)
+        self.spotify_api.remove_saved_tracks([track_id])
+        before = self.spotify_api.get_saved_tracks(limit=1)["total"]
+        with self.assertRaises(Exception) as context:
+            self.spotify_api.save_tracks([track_id, "nonexistent_track"])
+        self.assertIn("not found", str(context.exception))
+        self.assertEqual(self.spotify_api.check_saved_tracks([track_id]), [False])
+        self.assertEqual(self.spotify_api.get_saved_tracks(limit=1)["total"], before)
+
+    def test_get_user_by_id_returns_library_lists(self):
+        """Test the user lookup returns saved tracks, albums and followed artists as ID lists."""
+        self.spotify_api.save_tracks([self.REAL_TRACK_ID])
+        self.spotify_api.save_albums([self.REAL_ALBUM_ID])
+        self.spotify_api.follow_artists([self.REAL_ARTIST_ID])
+        user = self.spotify_api.get_user_by_id(self.REAL_USER_ID)
+        self.assertEqual(user["user_id"], self.REAL_USER_ID)
+        self.assertIsInstance(user["liked_songs"], list)
+        self.assertIsInstance(user["liked_albums"], list)
+        self.assertIsInstance(user["following_artists"], list)
+        self.assertIn(self.REAL_TRACK_ID, user["liked_songs"])
+        self.assertIn(self.REAL_ALBUM_ID, user["liked_albums"])
+        self.assertIn(self.REAL_ARTIST_ID, user["following_artists"])
+
     def test_save_tracks_too_many(self):
         """Test saving too many tracks at once."""
         track_ids = [f"track_{i}" for i in range(51)]
@@ -456,6 +525,104 @@ class TestSpotifyApis(unittest.TestCase):
         )
         self.assertIn("snapshot_id", result)
 
+    def test_add_items_to_playlist_at_position(self):
+        """Test positional inserts keep the batch together at the requested index."""
+        created = self.spotify_api.create_playlist(
+            user_id=self.REAL_USER_ID,
+            name="Position Test",
+            public=True
+        )
+        uris = [f"spotify:track:{t}" for t in list(self.spotify_api.tracks)[:4]]
+        self.spotify_api.add_items_to_playlist(created["id"], [uris[0], uris[3]])
+        self.spotify_api.add_items_to_playlist(created["id"], uris[1:3], position=1)
+        items = self.spotify_api.get_playlist_items(created["id"])["items"]
+        self.assertEqual([item["track"]["uri"] for item in items], uris)
+
+    def test_remove_items_from_large_playlist_under_churn(self):
+        """Test removals find the first occurrence after many inserts and deletes across chunks."""
+        created = self.spotify_api.create_playlist(
+            user_id=self.REAL_USER_ID,
+            name="Churn Test",
+            public=True
+        )
+        track_ids = list(self.spotify_api.tracks)[:10]
+        expected = []
+        for round_number in range(30):
+            batch = [track_ids[(round_number + i) % len(track_ids)] for i in range(10)]
+            self.spotify_api.add_items_to_playlist(created["id"], [f"spotify:track:{t}" for t in batch], position=0)
+            expected[0:0] = batch
+        for track_id in track_ids[:5] * 25:
+            self.spotify_api.remove_items_from_playlist(created["id"], [f"spotify:track:{track_id}"])
+            expected.remove(track_id)
+        items = self.spotify_api.get_playlist_items(created["id"], limit=100, offset=0)
+        self.assertEqual(items["total"], len(expected))
+        self.assertEqual([item["track"]["id"] for item in items["items"]], expected[:100])
+
+    def test_playlist_snapshots_are_retained_and_diffable(self):
+        """Test earlier snapshots can be read back and diffed against the current version."""
+        created = self.spotify_api.create_playlist(
+            user_id=self.REAL_USER_ID,
+            name="Snapshot Test",
+            public=True
+        )
+        uris = [f"spotify:track:{t}" for t in list(self.spotify_api.tracks)[:3]]
+        first = self.spotify_api.add_items_to_playlist(created["id"], uris[:2])["snapshot_id"]
+        self.spotify_api.add_items_to_playlist(created["id"], [uris[2]], position=0)
+        self.spotify_api.remove_items_from_playlist(created["id"], [uris[1]])
+
+        old_items = self.spotify_api.get_playlist_items(created["id"], snapshot_id=first)
+        self.assertEqual(old_items["total"], 2)
+        self.assertEqual([item["track"]["uri"] for item in old_items["items"]], uris[:2])
+
+        diff = self.spotify_api.get_playlist_snapshot_diff(created["id"], first)
+        added = [uri for change in diff["changes"] for uri in change["added"]]
+        removed = [uri for change in diff["changes"] for uri in change["removed"]]
+        self.assertEqual(added, [uris[2]])
+        self.assertEqual(removed, [uris[1]])
+
+        with self.assertRaises(Exception):
+            self.spotify_api.get_playlist_items(created["id"], snapshot_id="unknown-snapshot")
+
+    # --- Recommendation Tests ---
+
+    def test_get_recommendations_follows_playlist_changes(self):
+        """Test recommendations reflect tracks added to playlists after the index is built."""
+        seed_id, paired_id = list(self.spotify_api.tracks)[-2:]
+        before = self.spotify_api.get_recommendations(seed_tracks=[seed_id], limit=5)
+        self.assertEqual(before["seeds"][0]["id"], seed_id)
+        self.assertNotIn(seed_id, [track["id"] for track in before["tracks"]])
+
+        created = self.spotify_api.create_playlist(
+            user_id=self.REAL_USER_ID,
+            name="Recommendation Test",
+            public=True
+        )
+        self.spotify_api.add_items_to_playlist(
+            created["id"], [f"spotify:track:{seed_id}", f"spotify:track:{paired_id}"]
+        )
+        after = self.spotify_api.get_recommendations(seed_tracks=[seed_id], limit=5)
+        self.assertEqual(after["tracks"][0]["id"], paired_id)
+
+        # Removing one of two copies keeps the pair; removing the last copy drops it
+        self.spotify_api.add_items_to_playlist(created["id"], [f"spotify:track:{paired_id}"])
+        self.spotify_api.remove_items_from_playlist(created["id"], [f"spotify:track:{paired_id}"])
+        after = self.spotify_api.get_recommendations(seed_tracks=[seed_id], limit=5)
+        self.assertEqual(after["tracks"][0]["id"], paired_id)
+        self.spotify_api.remove_items_from_playlist(created["id"], [f"spotify:track:{paired_id}"])
+        after = self.spotify_api.get_recommendations(seed_tracks=[seed_id], limit=5)
+        self.assertEqual(after["seeds"][0]["initialPoolSize"], before["seeds"][0]["initialPoolSize"])
+
+    def test_get_recommendations_validates_seeds(self):
+        """Test recommendation seed and limit validation."""
+        with self.assertRaises(Exception):
+            self.spotify_api.get_recommendations()
+        with self.assertRaises(Exception):
+            self.spotify_api.get_recommendations(seed_tracks=list(self.spotify_api.tracks)[:6])
+        with self.assertRaises(Exception):
+            self.spotify_api.get_recommendations(seed_tracks=["nonexistent-track"])
+        with self.assertRaises(Exception):
+            self.spotify_api.get_recommendations(seed_artists=[self.REAL_ARTIST_ID], limit=0)
+
     # --- Search Tests ---
 
     def test_search_tracks(self):
@@ -504,6 +671,28 @@ class TestSpotifyApis(unittest.TestCase):
         self.assertEqual(result["tracks"]["limit"], 5)
         self.assertEqual(result["tracks"]["offset"], 10)
 
+    def test_search_total_counts_all_matches(self):
+        """Test search total covers every match while items hold only the page."""
+        result = self.spotify_api.search(q="", type=["track"], limit=5)
+        self.assertEqual(result["tracks"]["total"], len(self.spotify_api.tracks))
+        self.assertLessEqual(len(result["tracks"]["items"]), 5)
+
+    def test_search_finds_renamed_playlist(self):
+        """Test search reflects playlist creation and renames."""
+        created = self.spotify_api.create_playlist(
+            user_id=self.REAL_USER_ID,
+            name="Zebra Crossing Mix",
+            public=True
+        )
+        result = self.spotify_api.search(q="zebra crossing", type=["playlist"])
+        self.assertIn(created["id"], [p["id"] for p in result["playlists"]["items"]])
+
+        self.spotify_api.change_playlist_details(playlist_id=created["id"], name="Quokka Beats")
+        result = self.spotify_api.search(q="zebra crossing", type=["playlist"])
+        self.assertNotIn(created["id"], [p["id"] for p in result["playlists"]["items"]])
+        result = self.spotify_api.search(q="quokka", type=["playlist"])
+        self.assertIn(created["id"], [p["id"] for p in result["playlists"]["items"]])
+
     # --- Workflow Tests ---
 
     def test_workflow_create_and_populate_playlist(self):
@@ -133,6 +133,91 @@ class TestXApis(unittest.TestCase):
         self.assertIn("pagination", result)
         self.assertEqual(result["pagination"]["limit"], 3)
 
+    def test_follow_and_unfollow_user(self):
+        """Test following and unfollowing update both users' lists and counts."""
+        self.x_api.authenticate(self.alice_token)
+        target_id = next(
+            user_id for user_id in self.x_api.users
+            if user_id != self.REAL_USER_ID_ALICE
+            and user_id not in self.x_api.users[self.REAL_USER_ID_ALICE]["following"]
+        )
+        following_before = self.x_api.get_following(limit=1)["pagination"]["total"]
+
+        self.x_api.follow_user(target_id)
+        self.assertEqual(self.x_api.get_following(limit=1)["pagination"]["total"], following_before + 1)
+        self.assertIn(self.REAL_USER_ID_ALICE, self.x_api.users[target_id]["followers"])
+        with self.assertRaises(Exception):
+            self.x_api.follow_user(target_id)
+
+        self.x_api.unfollow_user(target_id)
+        self.assertNotIn(self.REAL_USER_ID_ALICE, self.x_api.users[target_id]["followers"])
+        with self.assertRaises(Exception):
+            self.x_api.unfollow_user(target_id)
+        with self.assertRaises(Exception):
+            self.x_api.follow_user(self.REAL_USER_ID_ALICE)
+
+    def test_get_user_by_id_returns_follow_lists(self):
+        """Test the user lookup returns followers and following as ID lists."""
+        self.x_api.authenticate(self.alice_token)
+        target_id = next(
+            user_id for user_id in self.x_api.users
+            if user_id != self.REAL_USER_ID_ALICE
+            and user_id not in self.x_api.users[self.REAL_USER_ID_ALICE]["following"]
+        )
+        self.x_api.follow_user(target_id)
+        alice = self.x_api.get_user_by_id(self.REAL_USER_ID_ALICE)
+        target = self.x_api.get_user_by_id(target_id)
+        self.assertIsInstance(alice["following"], list)
+        self.assertIsInstance(target["followers"], list)
+        self.assertEqual(alice["following"][-1], target_id)
+        self.assertIn(self.REAL_USER_ID_ALICE, target["followers"])
+
+    def test_get_verified_users_follows_follow_changes(self):
+        """Test verified users stay sorted by follower count as follows come and go."""
+        def verified_counts():
+            users = self.x_api.get_verified_users(limit=1000)["data"]
+            return {user["id"]: user["public_metrics"]["followers_count"] for user in users}, users
+
+        counts, users = verified_counts()
+        targets = [user_id for user_id in counts if user_id != self.REAL_USER_ID_ALICE
+                   and user_id not in self.x_api.users[self.REAL_USER_ID_ALICE]["following"]][:3]
+        self.x_api.authenticate(self.alice_token)
+        for target_id in targets:
+            self.x_api.follow_user(target_id)
+        self.x_api.unfollow_user(targets[0])
+
+        new_counts, users = verified_counts()
+        for target_id in targets[1:]:
+            self.assertEqual(new_counts[target_id], counts[target_id] + 1)
+        self.assertEqual(new_counts[targets[0]], counts[targets[0]])
+        order = [user["public_metrics"]["followers_count"] for user in users]
+        self.assertEqual(order, sorted(order, reverse=True))
+        self.assertEqual(list(self.x_api.users[self.REAL_USER_ID_ALICE]["following"])[-2:], targets[1:])
+
+    def test_get_mutual_followers(self):
+        """Test mutual followers are the accounts following both users."""
+        self.x_api.authenticate(self.alice_token)
+        result = self.x_api.get_mutual_followers(self.REAL_USER_ID_BOB, limit=100)
+        expected = (
+            set(self.x_api.users[self.REAL_USER_ID_ALICE]["followers"])
+            & set(self.x_api.users[self.REAL_USER_ID_BOB]["followers"])
+        )
+        self.assertEqual({user["id"] for user in result["data"]}, expected)
+        self.assertEqual(result["pagination"]["total"], len(expected))
+
+    def test_suggest_follows_ranks_friends_of_friends(self):
+        """Test suggestions exclude followed accounts and are ranked by shared connections."""
+        self.x_api.authenticate(self.alice_token)
+        following = set(self.x_api.users[self.REAL_USER_ID_ALICE]["following"])
+        suggestions = self.x_api.suggest_follows(limit=5)["data"]
+        self.assertTrue(suggestions)
+        counts = [user["followed_by_count"] for user in suggestions]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+        for user in suggestions:
+            self.assertNotIn(user["id"], following | {self.REAL_USER_ID_ALICE})
+            via = [f for f in following if user["id"] in self.x_api.users[f]["following"]]
+            self.assertEqual(len(via), user["followed_by_count"])
+
     # --- Tweet Management Tests ---
     def test_create_tweet(self):
         """Test creating a tweet."""
@@ -361,6 +446,33 @@ class TestXApis(unittest.TestCase):
                     self.assertIn("not a participant", str(context.exception).lower())
                     break
 
+    def test_get_dm_conversations_ordered_by_last_activity(self):
+        """Test the conversation with the newest message is listed first with its snippet."""
+        conv_id, conv_data = next(iter(self.x_api.direct_messages.items()))
+        sender_id, recipient_id = conv_data["participants"][:2]
+        self.x_api.authenticate(f"token_{self.x_api.users[sender_id]['email']}")
+        self.x_api.send_dm(recipient_id, "Bumping this thread")
+
+        result = self.x_api.get_dm_conversations(limit=1)
+        self.assertEqual(result["data"][0]["conversation_id"], conv_id)
+        self.assertEqual(result["data"][0]["last_message_snippet"], "Bumping this thread")
+
+        self.x_api.delete_dm_conversation(conv_id)
+        remaining = self.x_api.get_dm_conversations(limit=100)
+        self.assertNotIn(conv_id, [conv["conversation_id"] for conv in remaining["data"]])
+
+    def test_get_dm_conversation_pages_latest_messages(self):
+        """Test paging a conversation returns the newest messages first page, oldest first within it."""
+        conv_id, conv_data = next(iter(self.x_api.direct_messages.items()))
+        self.x_api.authenticate(f"token_{self.x_api.users[conv_data['participants'][0]]['email']}")
+        full = self.x_api.get_dm_conversation(conv_id)["messages"]
+
+        latest = self.x_api.get_dm_conversation(conv_id, limit=2)
+        self.assertEqual(latest["messages"], full[-2:])
+        self.assertEqual(latest["pagination"]["total"], len(full))
+        earlier = self.x_api.get_dm_conversation(conv_id, limit=2, offset=2)
+        self.assertEqual(earlier["messages"], full[-4:-2])
+
     # --- Analytics Tests ---
     def test_get_api_usage(self):
         """Test getting API usage for authenticated user."""
@@ -378,6 +490,57 @@ class TestXApis(unittest.TestCase):
         self.assertIn("total_likes_received", result)
         self.assertIn("engagement_ratio", result)
 
+    def test_get_user_analytics_tracks_likes_received(self):
+        """Test likes received and tweet counts follow likes, unlikes and new tweets."""
+        post = self.x_api.posts[self.REAL_POST_ID]
+        author = self.x_api.users[post["author_id"]]
+        liker = next(
+            user for user_id, user in self.x_api.users.items()
+            if user_id != post["author_id"] and user_id not in post["likes"]
+        )
+        self.x_api.authenticate(f"token_{author['email']}")
+        before = self.x_api.get_user_analytics()
+
+        self.x_api.authenticate(f"token_{liker['email']}")
+        self.x_api.like_tweet(self.REAL_POST_ID)
+        self.x_api.authenticate(f"token_{author['email']}")
+        self.x_api.create_tweet("Another one for the analytics")
+        after = self.x_api.get_user_analytics()
+
+        self.assertEqual(after["total_likes_received"], before["total_likes_received"] + 1)
+        self.assertEqual(after["public_metrics"]["tweet_count"], before["public_metrics"]["tweet_count"] + 1)
+
+        self.x_api.authenticate(f"token_{liker['email']}")
+        self.x_api.unlike_tweet(self.REAL_POST_ID)
+        self.x_api.authenticate(f"token_{author['email']}")
+        self.assertEqual(
+            self.x_api.get_user_analytics()["total_likes_received"], before["total_likes_received"]
+        )
+
+    def test_get_user_by_id_returns_post_and_like_lists(self):
+        """Test the user lookup returns authored and liked posts as ID lists."""
+        self.x_api.authenticate(self.alice_token)
+        tweet_id = self.x_api.create_tweet(text="Listed in the user lookup")["id"]
+        self.x_api.authenticate(self.bob_token)
+        self.x_api.like_tweet(tweet_id)
+        alice = self.x_api.get_user_by_id(self.REAL_USER_ID_ALICE)
+        bob = self.x_api.get_user_by_id(self.REAL_USER_ID_BOB)
+        self.assertIsInstance(alice["posts"], list)
+        self.assertIsInstance(bob["liked_posts"], list)
+        self.assertIn(tweet_id, alice["posts"])
+        self.assertIn(tweet_id, bob["liked_posts"])
+
+    def test_like_counts_agree_across_endpoints(self):
+        """Test search results and tweet metrics report the same like count."""
+        post = self.x_api.posts[self.REAL_POST_ID]
+        metrics = self.x_api.get_tweet_metrics([self.REAL_POST_ID])[0]["public_metrics"]
+        searched = next(
+            item for item in self.x_api.search_tweets(post["text"], maxResults=100)["items"]
+            if item["id"] == self.REAL_POST_ID
+        )
+        self.assertEqual(searched["public_metrics"]["like_count"], metrics["like_count"])
+        self.assertEqual(metrics["like_count"], len(post["likes"]))
+
     def test_get_tweet_metrics(self):
         """Test getting tweet metrics (public endpoint)."""
         result = self.x_api.get_tweet_metrics(tweet_ids=[self.REAL_POST_ID])
@@ -416,6 +579,135 @@ class TestXApis(unittest.TestCase):
         self.assertIn("pagination", result)
         self.assertEqual(result["pagination"]["limit"], 5)
 
+    def test_search_users_matches_substrings_by_followers(self):
+        """Test user search matches inside names and ranks the most followed first."""
+        query = self.REAL_USERNAME_ALICE[1:5].lower()
+        expected = {
+            user_id for user_id, user in self.x_api.users.items()
+            if query in user["name"].lower() or query in user["username"].lower()
+        }
+        result = self.x_api.search_users(query, maxResults=100)
+        self.assertEqual({item["id"] for item in result["items"]}, expected)
+        counts = [item["public_metrics"]["followers_count"] for item in result["items"]]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+
+    def test_search_users_short_query_matches_substrings(self):
+        """Test one- and two-character queries still match anywhere in a name or username."""
+        for query in (self.REAL_USERNAME_ALICE[1:3].lower(), self.REAL_USERNAME_ALICE[-1].upper()):
+            expected = {
+                user_id for user_id, user in self.x_api.users.items()
+                if query.lower() in user["name"].lower() or query.lower() in user["username"].lower()
+            }
+            result = self.x_api.search_users(query, maxResults=1000)
+            self.assertEqual({item["id"] for item in result["items"]}, expected)
+            self.assertIn(self.REAL_USER_ID_ALICE, expected)
+
+    def test_search_users_reflects_profile_updates(self):
+        """Test name and bio changes are searchable immediately."""
+        self.x_api.authenticate(self.alice_token)
+        self.x_api.update_profile(name="Quorra Vantablack", bio="Restoring antique xylophones")
+        self.assertEqual(
+            [item["id"] for item in self.x_api.search_users("vantablack")["items"]], [self.REAL_USER_ID_ALICE]
+        )
+        self.assertEqual(
+            [user["id"] for user in self.x_api.search_users_by_bio("xylophone")["data"]], [self.REAL_USER_ID_ALICE]
+        )
+
+    def test_search_tweets_matches_substrings_newest_first(self):
+        """Test tweet search matches partial words and returns the newest tweets first."""
+        expected = [
+            post_id for post_id, post in self.x_api.posts.items() if "the" in post["text"].lower()
+        ]
+        result = self.x_api.search_tweets("THE", maxResults=5)
+        self.assertEqual(result["pageInfo"]["totalResults"], len(expected))
+        created = [item["created_at"] for item in result["items"]]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_search_tweets_reflects_create_and_delete(self):
+        """Test new tweets are searchable and deleted tweets are not."""
+        self.x_api.authenticate(self.alice_token)
+        tweet = self.x_api.create_tweet("Searching for quetzalcoatl sightings")
+        result = self.x_api.search_tweets("quetzal")
+        self.assertEqual([item["id"] for item in result["items"]], [tweet["id"]])
+        result = self.x_api.search_tweets("zalcoatl SIGH")
+        self.assertEqual([item["id"] for item in result["items"]], [tweet["id"]])
+
+        self.x_api.delete_tweet(tweet["id"])
+        result = self.x_api.search_tweets("quetzal")
+        self.assertEqual(result["pageInfo"]["totalResults"], 0)
+
+    # --- Home Timeline Tests ---
+    def test_get_home_timeline_pages_newest_first(self):
+        """Test the home timeline covers followed accounts' tweets across cursor pages."""
+        self.x_api.authenticate(self.alice_token)
+        sources = set(self.x_api.users[self.REAL_USER_ID_ALICE]["following"]) | {self.REAL_USER_ID_ALICE}
+        expected = sorted(
+            (post["created_at"], post_id) for post_id, post in self.x_api.posts.items()
+            if post["author_id"] in sources
+        )[::-1]
+
+        seen = []
+        cursor = None
+        while True:
+            page = self.x_api.get_home_timeline(limit=2, cursor=cursor)
+            seen.extend((tweet["created_at"], tweet["id"]) for tweet in page["data"])
+            cursor = page["pagination"]["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(seen, expected)
+
+    def test_get_home_timeline_pages_past_the_buffer(self):
+        """Test paging continues past HOME_TIMELINE_SIZE instead of dropping older tweets."""
+        self.x_api.HOME_TIMELINE_SIZE = 3
+        self.x_api.authenticate(self.alice_token)
+        for number in range(6):
+            self.x_api.create_tweet(f"Buffer overflow check {number}")
+        sources = set(self.x_api.users[self.REAL_USER_ID_ALICE]["following"]) | {self.REAL_USER_ID_ALICE}
+        expected = sorted(
+            (post["created_at"], post_id) for post_id, post in self.x_api.posts.items()
+            if post["author_id"] in sources
+        )[::-1]
+
+        seen = []
+        cursor = None
+        while True:
+            page = self.x_api.get_home_timeline(limit=2, cursor=cursor)
+            seen.extend((tweet["created_at"], tweet["id"]) for tweet in page["data"])
+            cursor = page["pagination"]["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(seen, expected)
+
+    def test_get_home_timeline_receives_followed_tweets(self):
+        """Test a followed account's new tweet is fanned out to the follower's timeline."""
+        follower = next(
+            user for user in self.x_api.users.values()
+            if self.REAL_USER_ID_BOB in user.get("following", [])
+        )
+        self.x_api.authenticate(f"token_{follower['email']}")
+        self.x_api.get_home_timeline()
+
+        self.x_api.authenticate(self.bob_token)
+        tweet = self.x_api.create_tweet("Fan-out timeline check")
+        self.assertEqual(self.x_api.get_home_timeline(limit=1)["data"][0]["id"], tweet["id"])
+
+        self.x_api.authenticate(f"token_{follower['email']}")
+        self.assertEqual(self.x_api.get_home_timeline(limit=1)["data"][0]["id"], tweet["id"])
+
+    def test_get_home_timeline_invalid_cursor(self):
+        """Test a malformed cursor is rejected."""
+        self.x_api.authenticate(self.alice_token)
+        with self.assertRaises(Exception):
+            self.x_api.get_home_timeline(cursor="not-a-cursor")
+
+    def test_get_home_timeline_invalid_limit(self):
+        """Test a limit below 1 is rejected instead of producing an empty page."""
+        self.x_api.authenticate(self.alice_token)
+        for limit in (0, -3):
+            with self.assertRaises(Exception) as context:
+                self.x_api.get_home_timeline(limit=limit)
+            self.assertIn("Limit", str(context.exception))
+
     # --- Workflow Tests ---
     def test_tweet_creation_workflow(self):
         """Test complete tweet creation and interaction workflow."""
@@ -431,13 +723,22 @@ class TestXApis(unittest.TestCase):
         # Get tweet details
         tweet_details = self.x_api.get_tweet(tweet_id)
         self.assertIn("public_metrics", tweet_details)
+        self.assertEqual(tweet_details["likes"], [self.REAL_USER_ID_BOB])
+        self.assertEqual(self.x_api.get_liked_tweets(limit=1)["data"][0]["id"], tweet_id)
         
         # Bob unlikes the tweet
         self.x_api.unlike_tweet(tweet_id)
+        self.assertEqual(self.x_api.get_tweet(tweet_id)["likes"], [])
+        with self.assertRaises(Exception):
+            self.x_api.unlike_tweet(tweet_id)
         
-        # Alice deletes the tweet
+        # Alice deletes the tweet after Bob likes it again
+        self.x_api.like_tweet(tweet_id)
+        liked_total = self.x_api.get_liked_tweets()["pagination"]["total"]
         self.x_api.authenticate(self.alice_token)
         self.x_api.delete_tweet(tweet_id)
+        self.x_api.authenticate(self.bob_token)
+        self.assertEqual(self.x_api.get_liked_tweets()["pagination"]["total"], liked_total - 1)
 
     def test_dm_workflow(self):
         """Test direct message workflow."""
@@ -1,5 +1,6 @@
 import unittest
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add parent directory to path
@@ -233,6 +234,27 @@ class TestYouTubeApis(unittest.TestCase):
             self.youtube_api.rate_video(self.REAL_VIDEO_ID, "dislike")
         self.assertIn("Invalid rating", str(context.exception))
 
+    def test_rate_video_like_is_idempotent_and_mirrored(self):
+        """Test that repeated likes count once and update both the video and the user."""
+        self.youtube_api.authenticate(self.alice_token)
+        video_id = next(
+            vid for vid, data in self.youtube_api.videos.items()
+            if self.REAL_USER_ID_ALICE not in data["liked_by"]
+        )
+        likes = self.youtube_api.videos[video_id]["likes"]
+        self.youtube_api.rate_video(video_id, "like")
+        self.youtube_api.rate_video(video_id, "like")
+        self.assertEqual(self.youtube_api.videos[video_id]["likes"], likes + 1)
+        self.assertIn(self.REAL_USER_ID_ALICE, self.youtube_api.videos[video_id]["liked_by"])
+        liked_videos = self.youtube_api.get_user_by_email(self.REAL_EMAIL_ALICE)["data"]["liked_videos"]
+        self.assertEqual(liked_videos.count(video_id), 1)
+        self.assertEqual(liked_videos[-1], video_id)
+
+        self.youtube_api.rate_video(video_id, "none")
+        self.assertEqual(self.youtube_api.videos[video_id]["likes"], likes)
+        self.assertNotIn(self.REAL_USER_ID_ALICE, self.youtube_api.videos[video_id]["liked_by"])
+        self.assertNotIn(video_id, self.youtube_api.users[self.REAL_USER_ID_ALICE]["liked_videos"])
+
     # --- Subscription Tests ---
     def test_list_my_subscriptions(self):
         """Test listing authenticated user's subscriptions."""
@@ -294,6 +316,37 @@ class TestYouTubeApis(unittest.TestCase):
             self.youtube_api.search_videos(query="")
         self.assertIn("Query parameter is required", str(context.exception))
 
+    def test_search_videos_finds_uploaded_and_forgets_deleted(self):
+        """Test that uploaded videos are searchable by tag substring until deleted."""
+        self.youtube_api.authenticate(self.alice_token)
+        video_id = self.youtube_api.upload_video(
+            title="Quokka Diaries", description="Island life", tags=["Marsupialcam"]
+        )["id"]
+
+        result = self.youtube_api.search_videos(query="SUPIALC")
+        self.assertEqual([item["id"]["videoId"] for item in result["items"]], [video_id])
+        self.assertEqual(result["pageInfo"]["totalResults"], 1)
+
+        self.youtube_api.delete_video(video_id)
+        result = self.youtube_api.search_videos(query="supialc")
+        self.assertEqual(result["items"], [])
+        self.assertEqual(result["pageInfo"]["totalResults"], 0)
+
+    def test_search_videos_sorted_by_views_across_pages(self):
+        """Test that search pages continue in descending view order."""
+        query = "a"
+        total = self.youtube_api.search_videos(query=query)["pageInfo"]["totalResults"]
+        first_page = self.youtube_api.search_videos(query=query, maxResults=5)
+        second_page = self.youtube_api.search_videos(
+            query=query, maxResults=5, pageToken=first_page["nextPageToken"]
+        )
+        views = [
+            self.youtube_api.videos[item["id"]["videoId"]]["views"]
+            for item in first_page["items"] + second_page["items"]
+        ]
+        self.assertEqual(len(views), min(10, total))
+        self.assertEqual(views, sorted(views, reverse=True))
+
     # --- Playlist Tests ---
     def test_list_playlists_in_channel(self):
         """Test listing playlists in a channel."""
@@ -415,6 +468,39 @@ class TestYouTubeApis(unittest.TestCase):
         # Delete it (should not raise exception)
         self.youtube_api.delete_comment(comment_id)
 
+    def test_list_comments_ids_stable_across_pages(self):
+        """Test that scenario comments keep their IDs between calls and pages do not overlap."""
+        video_id = next(
+            vid for vid, data in self.youtube_api.videos.items() if len(data["comments"]) >= 3
+        )
+        total = len(self.youtube_api.videos[video_id]["comments"])
+        full = self.youtube_api.list_comments_for_video(video_id, maxResults=total)
+        first = self.youtube_api.list_comments_for_video(video_id, maxResults=2)
+        rest = self.youtube_api.list_comments_for_video(
+            video_id, maxResults=total, pageToken=first["nextPageToken"]
+        )
+        full_ids = [item["id"] for item in full["items"]]
+        self.assertEqual(len(set(full_ids)), total)
+        self.assertEqual([item["id"] for item in first["items"] + rest["items"]], full_ids)
+
+    def test_list_comments_newest_first_and_replacement(self):
+        """Test that a new comment is listed first and replaces the author's earlier comment."""
+        self.youtube_api.authenticate(self.alice_token)
+        total = self.youtube_api.list_comments_for_video(self.REAL_VIDEO_ID)["pageInfo"]["totalResults"]
+        first_id = self.youtube_api.add_comment_to_video(self.REAL_VIDEO_ID, "First take")["id"]
+        second_id = self.youtube_api.add_comment_to_video(self.REAL_VIDEO_ID, "Second take")["id"]
+
+        result = self.youtube_api.list_comments_for_video(self.REAL_VIDEO_ID)
+        self.assertEqual(result["items"][0]["id"], second_id)
+        self.assertEqual(result["pageInfo"]["totalResults"], total + 1)
+        self.assertNotIn(first_id, [item["id"] for item in result["items"]])
+
+        self.youtube_api.delete_comment(second_id)
+        result = self.youtube_api.list_comments_for_video(self.REAL_VIDEO_ID)
+        self.assertEqual(result["pageInfo"]["totalResults"], total)
+        with self.assertRaises(Exception):
+            self.youtube_api.delete_comment(second_id)
+
     # --- Helper Method Tests (Legacy endpoints) ---
     def test_get_user_by_email(self):
         """Test getting user by email (legacy helper method)."""
@@ -422,11 +508,37 @@ class TestYouTubeApis(unittest.TestCase):
         self.assertIn("data", result)
         self.assertIsNotNone(result["data"])
 
+    def test_get_user_by_id_returns_member_lists(self):
+        """Test the user lookup returns subscriptions and liked videos as ID lists."""
+        self.youtube_api.authenticate(self.alice_token)
+        video_id = next(
+            vid for vid, data in self.youtube_api.videos.items()
+            if self.REAL_USER_ID_ALICE not in data["liked_by"]
+        )
+        self.youtube_api.rate_video(video_id, "like")
+        result = self.youtube_api.get_user_by_id(self.REAL_USER_ID_ALICE)
+        self.assertEqual(result["user_id"], self.REAL_USER_ID_ALICE)
+        self.assertIsInstance(result["subscriptions"], list)
+        self.assertIsInstance(result["liked_videos"], list)
+        self.assertEqual(result["liked_videos"][-1], video_id)
+
     def test_get_user_by_display_name(self):
         """Test getting user by display name (legacy helper method)."""
         result = self.youtube_api.get_user_by_display_name("Alice")
         self.assertIn("data", result)
 
+    def test_user_identifier_resolution(self):
+        """Test resolving a user by UUID, email and display name."""
+        display_name = self.user_data_alice["display_name"]
+        for identifier in (self.REAL_USER_ID_ALICE, self.REAL_EMAIL_ALICE, display_name):
+            self.assertEqual(
+                self.youtube_api._get_user_id_from_identifier(identifier), self.REAL_USER_ID_ALICE
+            )
+        self.assertIsNone(self.youtube_api._get_user_id_from_identifier("nobody@example.com"))
+        self.assertEqual(
+            self.youtube_api.get_user_by_display_name(display_name)["data"]["email"], self.REAL_EMAIL_ALICE
+        )
+
     def test_get_watch_later_playlist(self):
         """Test getting watch later playlist (legacy helper method)."""
         result = self.youtube_api.get_watch_later_playlist(self.REAL_USER_ID_ALICE)
@@ -454,6 +566,115 @@ class TestYouTubeApis(unittest.TestCase):
         )
         self.assertTrue(result.get("status", False))
 
+    def test_search_users_by_language_follows_updates(self):
+        """Test language search pagination and that preference updates move the user."""
+        language = self.user_data_alice["language_preference"]
+        everyone = self.youtube_api.search_users_by_language(language)
+        self.assertIn(self.REAL_USER_ID_ALICE, [user["id"] for user in everyone["data"]])
+
+        first = self.youtube_api.search_users_by_language(language, maxResults=2)
+        self.assertEqual(first["count"], everyone["count"])
+        rest = self.youtube_api.search_users_by_language(language, pageToken=first["nextPageToken"])
+        self.assertEqual(first["data"] + rest["data"], everyone["data"])
+
+        self.youtube_api.update_language_preference(self.REAL_USER_ID_ALICE, "xx-TEST")
+        self.assertEqual(
+            [user["id"] for user in self.youtube_api.search_users_by_language("xx-TEST")["data"]],
+            [self.REAL_USER_ID_ALICE]
+        )
+        self.assertEqual(self.youtube_api.search_users_by_language(language)["count"], everyone["count"] - 1)
+
+    def test_update_account_status_and_search(self):
+        """Test updating account status and finding users by status."""
+        suspended = self.youtube_api.search_users_by_account_status("suspended")["count"]
+        result = self.youtube_api.update_account_status(self.REAL_EMAIL_BOB, "suspended")
+        self.assertTrue(result["status"])
+        self.assertEqual(
+            self.youtube_api.get_account_status(self.REAL_USER_ID_BOB)["data"]["account_status"], "suspended"
+        )
+        found = self.youtube_api.search_users_by_account_status("suspended")
+        self.assertEqual(found["count"], suspended + (self.user_data_bob.get("account_status") != "suspended"))
+        self.assertIn(self.REAL_USER_ID_BOB, [user["id"] for user in found["data"]])
+        self.assertFalse(self.youtube_api.update_account_status("nobody@example.com", "active")["status"])
+
+    # --- Analytics Tests ---
+    def test_channel_analytics_counts_todays_activity(self):
+        """Test that uploads, views, likes, comments and subscriptions land in today's window."""
+        today = datetime.now(timezone.utc).date().isoformat()
+        self.youtube_api.authenticate(self.alice_token)
+        channel_id = self.youtube_api.users[self.REAL_USER_ID_ALICE]["channels"][0]
+        before = self.youtube_api.get_channel_analytics(channel_id)["data"]["totals"]
+        video_id = self.youtube_api.upload_video(title="Analytics Video")["id"]
+
+        self.youtube_api.authenticate(self.bob_token)
+        self.youtube_api.get_video(video_id)
+        self.youtube_api.get_video(video_id)
+        self.youtube_api.rate_video(video_id, "like")
+        self.youtube_api.add_comment_to_video(video_id, "Nice")
+        # An undated scenario subscription leaves no day's bucket, so a resubscription counts today
+        if channel_id in self.youtube_api.users[self.REAL_USER_ID_BOB]["subscriptions"]:
+            self.youtube_api.unsubscribe(channel_id)
+        self.youtube_api.subscribe(channel_id)
+        expected_subscribers = 1
+
+        data = self.youtube_api.get_channel_analytics(channel_id, start_date=today, end_date=today)["data"]
+        self.assertEqual(data["period"]["videos"], 1)
+        self.assertEqual(data["period"]["views"], 2)
+        self.assertEqual(data["period"]["likes"], 1)
+        self.assertEqual(data["period"]["comments"], 1)
+        self.assertEqual(data["period"]["subscribers"], expected_subscribers)
+        self.assertEqual(data["totals"]["videos"], before["videos"] + 1)
+        self.assertEqual(data["totals"]["views"], before["views"] + 2)
+
+        empty = self.youtube_api.get_channel_analytics(channel_id, start_date="2000-01-01", end_date="2000-12-31")
+        self.assertEqual(empty["data"]["period"]["videos"], 0)
+
+        bob = self.youtube_api.get_user_analytics(self.REAL_USER_ID_BOB, start_date=today)["data"]
+        self.assertEqual(bob["period"]["likes_given"], 1)
+        self.assertEqual(bob["period"]["comments_made"], 1)
+
+    def test_analytics_removals_leave_the_original_day(self):
+        """Test that deleting an old comment or undoing a like decrements the day it happened on."""
+        today = datetime.now(timezone.utc).date().isoformat()
+        comment = next(
+            data for data in self.youtube_api.comments.values()
+            if data["author_id"] == self.REAL_USER_ID_ALICE and data["video_id"] in self.youtube_api.videos
+        )
+        day = comment["published_at"][:10]
+        channel_id = self.youtube_api.videos[comment["video_id"]]["channel_id"]
+        before = self.youtube_api.get_channel_analytics(channel_id, start_date=day, end_date=day)["data"]["period"]
+        made = self.youtube_api.get_user_analytics(self.REAL_USER_ID_ALICE, start_date=day, end_date=day)
+
+        self.youtube_api.authenticate(self.alice_token)
+        self.youtube_api.delete_comment(comment["id"])
+        after = self.youtube_api.get_channel_analytics(channel_id, start_date=day, end_date=day)["data"]["period"]
+        self.assertEqual(after["comments"], before["comments"] - 1)
+        if day != today:
+            todays = self.youtube_api.get_channel_analytics(channel_id, start_date=today, end_date=today)
+            self.assertEqual(todays["data"]["period"]["comments"], 0)
+        alice = self.youtube_api.get_user_analytics(self.REAL_USER_ID_ALICE, start_date=day, end_date=day)["data"]
+        self.assertEqual(alice["period"]["comments_made"], made["data"]["period"]["comments_made"] - 1)
+
+        video_id = next(
+            vid for vid, data in self.youtube_api.videos.items()
+            if self.REAL_USER_ID_ALICE not in data["liked_by"] and data.get("channel_id") in self.youtube_api.channels
+        )
+        self.youtube_api.rate_video(video_id, "like")
+        self.youtube_api.rate_video(video_id, "none")
+        likes = self.youtube_api.get_user_analytics(self.REAL_USER_ID_ALICE, start_date=today, end_date=today)
+        self.assertEqual(likes["data"]["period"]["likes_given"], 0)
+
+    def test_analytics_invalid_dates(self):
+        """Test analytics with malformed or reversed date windows."""
+        with self.assertRaises(Exception) as context:
+            self.youtube_api.get_channel_analytics(self.REAL_CHANNEL_ID, start_date="01/02/2024")
+        self.assertIn("Invalid date format", str(context.exception))
+        with self.assertRaises(Exception):
+            self.youtube_api.get_user_analytics(
+                self.REAL_USER_ID_ALICE, start_date="2024-02-01", end_date="2024-01-01"
+            )
+        self.assertIsNone(self.youtube_api.get_channel_analytics("nonexistent_channel")["data"])
+
     # --- Caption Tests ---
     def test_youtube_captions_insert(self):
         """Test inserting captions (legacy method)."""
@@ -464,6 +685,58 @@ class TestYouTubeApis(unittest.TestCase):
         )
         self.assertTrue(result.get("status", False))
 
+    def test_search_captions_returns_timestamps(self):
+        """Test that caption search finds the cue where a phrase is spoken."""
+        track = (
+            "1\n00:00:01,000 --> 00:00:03,000\nWelcome back\n\n"
+            "2\n00:01:02,500 --> 00:01:05,000\n<i>Quantum tunnelling</i> is\nstrange\n\n"
+            "3\n00:02:00,000 --> 00:02:01,000\nquantum again"
+        )
+        caption_id = self.youtube_api.youtube_captions_insert(self.REAL_VIDEO_ID, "en", track)["caption_id"]
+
+        result = self.youtube_api.search_captions("quantum tunnelling", video_id=self.REAL_VIDEO_ID)
+        self.assertTrue(result["status"])
+        self.assertEqual(len(result["matches"]), 1)
+        match = result["matches"][0]
+        self.assertEqual(match["caption_id"], caption_id)
+        self.assertEqual(match["start"], "00:01:02.500")
+        self.assertEqual(match["text"], "Quantum tunnelling is strange")
+
+        self.assertEqual(self.youtube_api.search_captions("quantum")["total_matches"], 2)
+        self.assertEqual(self.youtube_api.search_captions("quant")["total_matches"], 0)
+        self.assertEqual(self.youtube_api.search_captions("quantum", language="fr")["total_matches"], 0)
+
+    def test_search_captions_after_update_and_delete(self):
+        """Test that caption updates and deletes keep the search index current."""
+        caption_id = self.youtube_api.youtube_captions_insert(
+            self.REAL_VIDEO_ID, "en", "1\n00:00:00,000 --> 00:00:02,000\nOld marmalade line"
+        )["caption_id"]
+        self.youtube_api.youtube_captions_update(
+            caption_id, "WEBVTT\n\n00:04.000 --> 00:06.000\nNew marzipan line"
+        )
+        self.assertEqual(self.youtube_api.search_captions("marmalade")["total_matches"], 0)
+        matches = self.youtube_api.search_captions("marzipan")["matches"]
+        self.assertEqual([(m["caption_id"], m["start_ms"]) for m in matches], [(caption_id, 4000)])
+
+        self.youtube_api.youtube_captions_delete(caption_id)
+        self.assertEqual(self.youtube_api.search_captions("marzipan")["total_matches"], 0)
+        self.assertFalse(self.youtube_api.search_captions("")["status"])
+
+    def test_captions_keep_full_track_in_channel_state(self):
+        """Test that the stored caption entry keeps the whole track, not just its snippet."""
+        track = "".join(
+            f"{n}\n00:00:{n:02d},000 --> 00:00:{n:02d},900\nLine number {n}\n\n" for n in range(1, 8)
+        )
+        caption_id = self.youtube_api.youtube_captions_insert(self.REAL_VIDEO_ID, "en", track)["caption_id"]
+        channel_id = self.youtube_api.videos[self.REAL_VIDEO_ID]["channel_id"]
+        caption_data = self.youtube_api.channels[channel_id]["captions"][caption_id]
+        self.assertEqual(caption_data["track_content"], track)
+        self.assertTrue(caption_data["content_snippet"].endswith("..."))
+
+        updated = "1\n00:00:00,000 --> 00:00:02,000\nReplaced"
+        self.youtube_api.youtube_captions_update(caption_id, updated)
+        self.assertEqual(caption_data["track_content"], updated)
+
     # --- Reset Data Tests ---
     def test_reset_data(self):
         """Test resetting data clears authentication."""
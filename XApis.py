@@ -1,19 +1,81 @@
 # Inspired by https://developers.google.com/youtube/v3/docs
 
 from datetime import datetime
+import bisect
 import copy
+import heapq
+import itertools
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from state_loader import load_default_state
+from text_index import TextIndex
 
 DEFAULT_STATE = load_default_state("XApis")
 
+
+class _FollowerRanking:
+    """
+    Verified users ordered by follower count, highest first, with O(1) updates.
+
+    A follow or unfollow moves a count by exactly one, so the user only has to cross the edge of
+    its run of equal counts. It swaps places with the first (or last) user of that run, and the
+    run boundaries shift by one. Users loaded together start ordered by UUID within a count; later
+    moves do not keep ties in UUID order.
+    """
+
+    __slots__ = ("_order", "_positions", "_counts", "_runs")
+
+    def __init__(self, counts: Dict[str, int]):
+        self._order: List[str] = sorted(counts, key=lambda user_id: (-counts[user_id], user_id))
+        self._positions: Dict[str, int] = {user_id: position for position, user_id in enumerate(self._order)}
+        self._counts: Dict[str, int] = dict(counts)
+        self._runs: Dict[int, List[int]] = {} # Follower count -> [first, last] position holding it
+        for position, user_id in enumerate(self._order):
+            self._runs.setdefault(counts[user_id], [position, position])[1] = position
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def page(self, offset: int, limit: int) -> List[Tuple[str, int]]:
+        """Returns (UUID, follower count) pairs for one page of the ranking."""
+        return [(user_id, self._counts[user_id]) for user_id in self._order[offset:offset + limit]]
+
+    def _swap(self, position: int, other: int) -> None:
+        first, second = self._order[position], self._order[other]
+        self._order[position], self._order[other] = second, first
+        self._positions[first], self._positions[second] = other, position
+
+    def move(self, user_id: str, delta: int) -> None:
+        """Adds delta (+1 or -1) to a ranked user's follower count."""
+        count = self._counts[user_id]
+        run = self._runs[count]
+        # A gained follower moves the user to the front of its run, a lost one to the back
+        edge = 0 if delta > 0 else 1
+        boundary = run[edge]
+        self._swap(self._positions[user_id], boundary)
+        run[edge] += 1 if delta > 0 else -1
+        if run[0] > run[1]:
+            del self._runs[count]
+        new_run = self._runs.get(count + delta)
+        if new_run is None:
+            self._runs[count + delta] = [boundary, boundary]
+        else:
+            new_run[1 - edge] = boundary
+        self._counts[user_id] = count + delta
+
+
 class XApis:
     """
     An API class for simulating X (formerly Twitter) operations.
     This class provides an in-memory backend for development and testing purposes.
     """
 
+    HOME_TIMELINE_SIZE = 800  # Posts kept per home timeline buffer
+    FANOUT_FOLLOWER_LIMIT = 10000  # Authors with more followers are merged into timelines at read time
+
     def __init__(self):
         """
         Initializes the XApis instance, setting up the in-memory data stores and loading the default scenario.
@@ -35,6 +97,19 @@ class XApis:
         self.direct_messages: Dict[str, Any] = {} # Keyed by DM conversation UUID
         self.access_token: Optional[str] = None
         self.current_user_id: Optional[str] = None
+        self._post_text_index = TextIndex() # Substring search over post text
+        self._author_posts: Dict[str, List[Tuple[str, str]]] = {} # Author UUID -> sorted (created_at, post UUID)
+        self._followers: Dict[str, set] = {} # User UUID -> UUIDs of their followers
+        self._following: Dict[str, set] = {} # User UUID -> UUIDs of the accounts they follow
+        self._home_timelines: Dict[str, List[Tuple[str, str]]] = {} # User UUID -> sorted (created_at, post UUID), built lazily
+        self._high_follower_authors: set = set() # UUIDs of authors above FANOUT_FOLLOWER_LIMIT followers
+        self._likes_received: Dict[str, int] = {} # Author UUID -> running total of likes on their posts
+        self._conversations_by_participant: Dict[str, set] = {} # User UUID -> UUIDs of their DM conversations
+        self._conversations_by_members: Dict[frozenset, str] = {} # Participant set -> DM conversation UUID
+        self._last_messages: Dict[str, Dict[str, Any]] = {} # DM conversation UUID -> its newest message
+        self._user_name_index = TextIndex() # Substring search over names and usernames
+        self._bio_text_index = TextIndex() # Substring search over user bios
+        self._verified_by_followers = _FollowerRanking({}) # Verified users by follower count
 
         self._load_scenario(DEFAULT_STATE)
 
@@ -65,6 +140,34 @@ class XApis:
         self.users = copy.deepcopy(scenario.get("users", {}))
         self.posts = copy.deepcopy(scenario.get("posts", {}))
         self.direct_messages = copy.deepcopy(scenario.get("direct_messages", {}))
+        self._post_text_index = TextIndex()
+        self._author_posts = {}
+        for post_id, post in self.posts.items():
+            self._post_text_index.add(post_id, post.get("text", ""))
+            self._author_posts.setdefault(post["author_id"], []).append((post.get("created_at", ""), post_id))
+        for author_posts in self._author_posts.values():
+            author_posts.sort()
+        self._reconcile_engagement()
+        self._reconcile_follow_graph()
+        self._user_name_index = TextIndex()
+        self._bio_text_index = TextIndex()
+        for user_id in self.users:
+            self._index_user_profile(user_id)
+        self._verified_by_followers = _FollowerRanking({
+            user_id: len(self._followers[user_id])
+            for user_id, user_data in self.users.items() if user_data.get("is_verified", False)
+        })
+        self._conversations_by_participant = {}
+        self._conversations_by_members = {}
+        self._last_messages = {}
+        for conv_id, conv_data in self.direct_messages.items():
+            # Keep messages oldest first so the last one is always the newest
+            conv_data.setdefault("messages", []).sort(key=self._message_time)
+            self._index_conversation(conv_id)
+        self._home_timelines = {}
+        self._high_follower_authors = {
+            user_id for user_id, followers in self._followers.items() if len(followers) > self.FANOUT_FOLLOWER_LIMIT
+        }
         print("XApis: Loaded scenario with UUIDs for users, posts, and DMs.")
 
     def authenticate(self, access_token: str) -> Dict[str, Any]:
@@ -196,14 +299,31 @@ class XApis:
             Optional[List[str]]: A list of post UUIDs if the user exists, or None if the user is not found.
         """
         user_data = self._get_user_data(user_id)
-        return user_data.get("posts") if user_data else None
+        return list(user_data.get("posts", {})) if user_data else None
+
+    def _post_response(self, post_id: str) -> Dict[str, Any]:
+        """
+        Helper method to copy a stored post for an API response.
+        
+        Posts keep their likers as an insertion-ordered dict of UUID -> None so likes and unlikes
+        are O(1); responses carry them as a list in like order, as in the scenario data.
+        
+        Args:
+            post_id (str): The UUID of the post to copy.
+        
+        Returns:
+            Dict[str, Any]: A deep copy of the post with "likes" as a list.
+        """
+        post = copy.deepcopy(self.posts[post_id])
+        post["likes"] = list(post.get("likes", {}))
+        return post
 
     def _get_user_direct_messages_data(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
         Helper method to retrieve all DM conversations that include a specific user.
         
-        This method filters the global direct_messages dictionary to find all conversations where
-        the specified user is a participant.
+        This method reads the user's conversations from the participant index rather than
+        filtering the global direct_messages dictionary.
         
         Args:
             user_id (str): The UUID of the user whose DM conversations to retrieve.
@@ -213,13 +333,47 @@ class XApis:
                 conversations where the user is a participant. Returns an empty dict if the user
                 has no conversations.
         """
-        # This structure needs careful handling as DMs are global, but filtered by user
-        # For this, we'll iterate through global DMs to find user's conversations
         return {
-            conv_id: conv_data for conv_id, conv_data in self.direct_messages.items()
-            if user_id in conv_data.get("participants", [])
+            conv_id: self.direct_messages[conv_id]
+            for conv_id in self._conversations_by_participant.get(user_id, ())
         }
 
+    @staticmethod
+    def _message_time(message: Dict[str, Any]) -> str:
+        """
+        Helper method to return a DM's timestamp; scenario messages use "timestamp", new ones "created_at".
+        """
+        return message.get("created_at") or message.get("timestamp", "")
+
+    def _index_conversation(self, conversation_id: str) -> None:
+        """
+        Helper method to add a DM conversation to the participant index and last-message pointers.
+        
+        Args:
+            conversation_id (str): The UUID of a conversation present in self.direct_messages.
+        """
+        conv_data = self.direct_messages[conversation_id]
+        participants = conv_data.get("participants", [])
+        for participant_id in participants:
+            self._conversations_by_participant.setdefault(participant_id, set()).add(conversation_id)
+        self._conversations_by_members.setdefault(frozenset(participants), conversation_id)
+        if conv_data.get("messages"):
+            self._last_messages[conversation_id] = conv_data["messages"][-1]
+
+    def _unindex_conversation(self, conversation_id: str) -> None:
+        """
+        Helper method to remove a DM conversation from the participant index and last-message pointers.
+        
+        Args:
+            conversation_id (str): The UUID of the conversation being deleted.
+        """
+        participants = self.direct_messages[conversation_id].get("participants", [])
+        for participant_id in participants:
+            self._conversations_by_participant.get(participant_id, set()).discard(conversation_id)
+        if self._conversations_by_members.get(frozenset(participants)) == conversation_id:
+            del self._conversations_by_members[frozenset(participants)]
+        self._last_messages.pop(conversation_id, None)
+
     def get_user_by_id(self, user_id: str) -> Dict[str, Any]:
         """
         Retrieves complete user information by user ID, including credentials.
@@ -244,9 +398,12 @@ class XApis:
                 "message": f"User with ID {user_id} not found."
             }
         
-        # Return complete user data including the user_id itself
+        # Return complete user data including the user_id itself, with its ID sets as lists
         result = {"user_id": user_id}
         result.update(user_data)
+        for field in ("followers", "following", "posts", "liked_posts"):
+            if field in result:
+                result[field] = list(result[field])
         return result
 
     def _update_user_data(self, user_id: str, key: str, value: Any) -> bool:
@@ -266,6 +423,237 @@ class XApis:
             self.users[user_id][key] = value
             return True
         return False
+
+    def _index_user_profile(self, user_id: str) -> None:
+        """
+        Helper method to add a user's name, username and bio to the user search indexes.
+        
+        Args:
+            user_id (str): The UUID of a user present in self.users.
+        """
+        user_data = self.users[user_id]
+        self._user_name_index.add(user_id, user_data.get("name"), user_data.get("username"))
+        self._bio_text_index.add(user_id, user_data.get("bio"))
+
+    def _unindex_user_profile(self, user_id: str) -> None:
+        """
+        Helper method to remove a user's name, username and bio from the user search indexes.
+        
+        Args:
+            user_id (str): The UUID of the user whose profile is changing.
+        """
+        self._user_name_index.remove(user_id)
+        self._bio_text_index.remove(user_id)
+
+    def _rank_by_followers(self, user_ids, count: int) -> List[str]:
+        """
+        Helper method to return the count most-followed users of a collection, most followed first.
+        """
+        return heapq.nsmallest(count, user_ids, key=lambda user_id: (-len(self._followers.get(user_id, ())), user_id))
+
+    def _reconcile_engagement(self) -> None:
+        """
+        Helper method to make loaded likes agree from every side and seed the engagement totals.
+        
+        Scenario data records likes both on posts ("likes") and on users ("liked_posts"), and
+        carries raw "metrics" instead of "public_metrics". Both like lists, and each user's
+        "posts" list, are converted in place to insertion-ordered dicts of UUID -> None. This
+        merges the two like records so each like appears in both, derives "public_metrics" from
+        them, and computes each author's likes-received total. Afterwards like_tweet,
+        unlike_tweet, create_tweet and delete_tweet keep everything current in O(1) per like.
+        """
+        for post in self.posts.values():
+            post["likes"] = dict.fromkeys(post.get("likes", []))
+        for user_id, user_data in self.users.items():
+            user_data["posts"] = dict.fromkeys(user_data.get("posts", []))
+            user_data["liked_posts"] = dict.fromkeys(user_data.get("liked_posts", []))
+            for post_id in user_data["liked_posts"]:
+                if post_id in self.posts:
+                    self.posts[post_id]["likes"].setdefault(user_id, None)
+        for post_id, post in self.posts.items():
+            for user_id in post["likes"]:
+                if user_id in self.users:
+                    self.users[user_id]["liked_posts"].setdefault(post_id, None)
+        self._likes_received = {}
+        for post_id, post in self.posts.items():
+            raw_metrics = post.get("metrics", {})
+            like_count = len(post["likes"])
+            post["public_metrics"] = {
+                "retweet_count": len(post.get("reposts", [])),
+                "reply_count": raw_metrics.get("replies", 0),
+                "like_count": like_count,
+                "quote_count": raw_metrics.get("quotes", 0),
+                "impression_count": raw_metrics.get("views", 0)
+            }
+            if "likes" in raw_metrics:
+                raw_metrics["likes"] = like_count
+            self._likes_received[post["author_id"]] = self._likes_received.get(post["author_id"], 0) + like_count
+
+    def _reconcile_follow_graph(self) -> None:
+        """
+        Helper method to build the set-backed follow graph from the users' follower lists.
+        
+        Scenario data records each follow on the follower ("following") and on the followed
+        account ("followers"), and the two sides do not always agree. Both lists are converted
+        in place to insertion-ordered dicts of UUID -> None, so an edge is added or removed in
+        O(1) while pages keep follow order. An edge present on either side is added to the other,
+        and the adjacency sets are built from the result. Afterwards follow_user and
+        unfollow_user keep dicts and sets in step.
+        """
+        for user_data in self.users.values():
+            user_data["followers"] = dict.fromkeys(user_data.get("followers", []))
+            user_data["following"] = dict.fromkeys(user_data.get("following", []))
+        self._followers = {user_id: set(user_data["followers"]) for user_id, user_data in self.users.items()}
+        self._following = {user_id: set(user_data["following"]) for user_id, user_data in self.users.items()}
+        for user_id, user_data in self.users.items():
+            for followed_id in list(user_data["following"]):
+                followers = self._followers.setdefault(followed_id, set())
+                if user_id not in followers:
+                    followers.add(user_id)
+                    if followed_id in self.users:
+                        self.users[followed_id]["followers"][user_id] = None
+            for follower_id in list(user_data["followers"]):
+                following = self._following.setdefault(follower_id, set())
+                if user_id not in following:
+                    following.add(user_id)
+                    if follower_id in self.users:
+                        self.users[follower_id]["following"][user_id] = None
+
+    def _set_follow_edge(self, follower_id: str, followed_id: str, following: bool) -> None:
+        """
+        Helper method to add or remove one follow edge and update everything that depends on it.
+        
+        Updates the adjacency sets and both users' ordered dicts, the verified follower ranking, the
+        fan-out status of the followed account, and invalidates the home timelines it affects.
+        
+        Args:
+            follower_id (str): The UUID of the user who follows.
+            followed_id (str): The UUID of the followed user.
+            following (bool): True to add the edge, False to remove it.
+        """
+        followers = self._followers.setdefault(followed_id, set())
+        if following:
+            followers.add(follower_id)
+            self._following.setdefault(follower_id, set()).add(followed_id)
+            self.users[follower_id]["following"][followed_id] = None
+            self.users[followed_id]["followers"][follower_id] = None
+        else:
+            followers.discard(follower_id)
+            self._following.get(follower_id, set()).discard(followed_id)
+            self.users[follower_id]["following"].pop(followed_id, None)
+            self.users[followed_id]["followers"].pop(follower_id, None)
+        new_count = len(followers)
+        
+        if followed_id in self._verified_by_followers:
+            self._verified_by_followers.move(followed_id, 1 if following else -1)
+        
+        # The follower's timeline gains or loses a source; crossing the fan-out limit changes
+        # how every follower's timeline sees this author
+        self._home_timelines.pop(follower_id, None)
+        was_high = followed_id in self._high_follower_authors
+        if (new_count > self.FANOUT_FOLLOWER_LIMIT) != was_high:
+            if was_high:
+                self._high_follower_authors.discard(followed_id)
+            else:
+                self._high_follower_authors.add(followed_id)
+            for user_id in followers:
+                self._home_timelines.pop(user_id, None)
+
+    def _is_fanout_author(self, user_id: str) -> bool:
+        """
+        Helper method to check whether an author's posts are pushed into followers' home timelines.
+        
+        Authors above FANOUT_FOLLOWER_LIMIT followers are not fanned out on write; their posts are
+        merged into each follower's home timeline when it is read instead.
+        """
+        return user_id not in self._high_follower_authors
+
+    def _get_home_timeline_buffer(self, user_id: str) -> List[Tuple[str, str]]:
+        """
+        Helper method to retrieve a user's home timeline buffer, building it on first access.
+        
+        The buffer holds the newest HOME_TIMELINE_SIZE (created_at, post UUID) entries, oldest
+        first, from the user and the fanned-out accounts they follow. create_tweet and
+        delete_tweet keep built buffers current.
+        
+        Args:
+            user_id (str): The UUID of the timeline owner.
+        
+        Returns:
+            List[Tuple[str, str]]: The user's sorted timeline buffer (a live reference).
+        """
+        buffer = self._home_timelines.get(user_id)
+        if buffer is None:
+            sources = [user_id] + [
+                followed_id for followed_id in self._get_user_data(user_id).get("following", [])
+                if followed_id != user_id and self._is_fanout_author(followed_id)
+            ]
+            entries = heapq.merge(*(
+                self._author_posts.get(source_id, [])[-self.HOME_TIMELINE_SIZE:] for source_id in set(sources)
+            ))
+            buffer = list(entries)[-self.HOME_TIMELINE_SIZE:]
+            self._home_timelines[user_id] = buffer
+        return buffer
+
+    @staticmethod
+    def _newest_entries(sources: List[List[Tuple[str, str]]], before: Optional[Tuple[str, str]],
+                        floor: Optional[Tuple[str, str]], count: int) -> List[Tuple[str, str]]:
+        """
+        Helper method to merge the newest entries of several sorted (created_at, post UUID) lists.
+        
+        Args:
+            sources (List[List[Tuple[str, str]]]): Entry lists, each sorted oldest first.
+            before (Optional[Tuple[str, str]]): Only entries older than this are taken (None for no bound).
+            floor (Optional[Tuple[str, str]]): Only entries at or after this are taken (None for no bound).
+            count (int): The number of entries to return at most.
+        
+        Returns:
+            List[Tuple[str, str]]: Up to count entries, newest first.
+        """
+        streams = []
+        for entries in sources:
+            end = bisect.bisect_left(entries, before) if before else len(entries)
+            start = bisect.bisect_left(entries, floor) if floor else 0
+            streams.append(reversed(entries[max(start, end - count):end]))
+        return list(heapq.merge(*streams, reverse=True))[:count]
+
+    def _fan_out_post(self, post_id: str) -> None:
+        """
+        Helper method to push a new post into the author's and followers' built home timelines.
+        
+        Args:
+            post_id (str): The UUID of the newly created post.
+        """
+        post = self.posts[post_id]
+        author_id = post["author_id"]
+        entry = (post.get("created_at", ""), post_id)
+        recipients = {author_id}
+        if self._is_fanout_author(author_id):
+            recipients.update(self._followers.get(author_id, ()))
+        for recipient_id in recipients:
+            buffer = self._home_timelines.get(recipient_id)
+            if buffer is not None:
+                bisect.insort(buffer, entry)
+                if len(buffer) > self.HOME_TIMELINE_SIZE:
+                    del buffer[0]
+
+    def _remove_from_timelines(self, post: Dict[str, Any]) -> None:
+        """
+        Helper method to remove a deleted post from the author index and built home timelines.
+        
+        Args:
+            post (Dict[str, Any]): The data of the post being deleted.
+        """
+        author_id = post["author_id"]
+        entry = (post.get("created_at", ""), post["id"])
+        for buffer in [self._author_posts.get(author_id)] + [
+            self._home_timelines.get(recipient_id)
+            for recipient_id in self._followers.get(author_id, set()) | {author_id}
+        ]:
+            if buffer:
+                position = bisect.bisect_left(buffer, entry)
+                if position < len(buffer) and buffer[position] == entry:
+                    del buffer[position]
     
     def get_user_profile(self) -> Dict[str, Any]:
         """
@@ -324,7 +712,7 @@ class XApis:
             "public_metrics": {
                 "followers_count": len(user_data.get("followers", [])),
                 "following_count": len(user_data.get("following", [])),
-                "tweet_count": len(user_data.get("posts", [])),
+                "tweet_count": len(self._author_posts.get(self.current_user_id, [])),
                 "like_count": len(user_data.get("liked_posts", []))
             }
         }
@@ -382,8 +770,8 @@ class XApis:
         if not user_data:
             raise Exception("User data not found")
         
-        follower_uuids = user_data.get("followers", [])
-        paginated_followers = follower_uuids[offset:offset + limit]
+        follower_uuids = user_data.get("followers", {})
+        paginated_followers = itertools.islice(follower_uuids, offset, offset + limit)
         
         followers_details = [
             {
@@ -456,8 +844,8 @@ class XApis:
         if not user_data:
             raise Exception("User data not found")
         
-        following_uuids = user_data.get("following", [])
-        paginated_following = following_uuids[offset:offset + limit]
+        following_uuids = user_data.get("following", {})
+        paginated_following = itertools.islice(following_uuids, offset, offset + limit)
         
         following_details = [
             {
@@ -478,6 +866,211 @@ class XApis:
             }
         }
 
+    def follow_user(self, target_user_id: str) -> None:
+        """
+        Follow another user as the authenticated user.
+        
+        Adds the follow edge to both users' lists and the follow graph. The target's tweets appear
+        in the authenticated user's home timeline from the next read.
+
+        Args:
+            target_user_id (str): The UUID of the user to follow.
+
+        Returns:
+            None: This method returns nothing on success.
+
+        Raises:
+            Exception: If not authenticated (authenticate() has not been called successfully)
+            Exception: If the target user does not exist in the backend
+            Exception: If the target is the authenticated user
+            Exception: If the authenticated user already follows the target
+        
+        Side Effects:
+            - Appends target_user_id to the user's "following" list and the user to the target's "followers" list
+            - Updates follower-count rankings used by search and get_verified_users
+        
+        Example:
+            >>> api = XApis()
+            >>> api.authenticate("token_user@example.com")
+            >>> api.follow_user("target-user-uuid")
+        """
+        self._ensure_authenticated()
+        
+        if target_user_id not in self.users:
+            raise Exception("Target user not found")
+        if target_user_id == self.current_user_id:
+            raise Exception("Cannot follow yourself")
+        if target_user_id in self._following.get(self.current_user_id, ()):
+            raise Exception("Already following this user")
+        
+        self._set_follow_edge(self.current_user_id, target_user_id, True)
+
+    def unfollow_user(self, target_user_id: str) -> None:
+        """
+        Stop following a user as the authenticated user.
+
+        Args:
+            target_user_id (str): The UUID of the user to unfollow.
+
+        Returns:
+            None: This method returns nothing on success.
+
+        Raises:
+            Exception: If not authenticated (authenticate() has not been called successfully)
+            Exception: If the target user does not exist in the backend
+            Exception: If the authenticated user does not follow the target
+        
+        Side Effects:
+            - Removes the follow edge from both users' lists and the follow graph
+            - Updates follower-count rankings used by search and get_verified_users
+        
+        Example:
+            >>> api = XApis()
+            >>> api.authenticate("token_user@example.com")
+            >>> api.unfollow_user("target-user-uuid")
+        """
+        self._ensure_authenticated()
+        
+        if target_user_id not in self.users:
+            raise Exception("Target user not found")
+        if target_user_id not in self._following.get(self.current_user_id, ()):
+            raise Exception("Not following this user")
+        
+        self._set_follow_edge(self.current_user_id, target_user_id, False)
+
+    def get_mutual_followers(self, user_id: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """
+        Retrieve the accounts that follow both the authenticated user and another user.
+        
+        Computed as an intersection of the two users' follower sets, walking the smaller one.
+        Results are sorted by follower count (most followed first) and paginated.
+
+        Args:
+            user_id (str): The UUID of the other user.
+            limit (int, optional): Maximum number of users to return. Defaults to 20.
+            offset (int, optional): Number of users to skip. Defaults to 0.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing paginated mutual follower data:
+                {
+                    "data": [                       # Users following both accounts
+                        {
+                            "id": str,              # User UUID
+                            "username": str,        # X handle
+                            "name": str,            # Display name
+                            "verified": bool        # Verification status
+                        },
+                        # ... more users
+                    ],
+                    "pagination": {
+                        "limit": int,
+                        "offset": int,
+                        "total": int                # Total number of mutual followers
+                    }
+                }
+
+        Raises:
+            Exception: If not authenticated (authenticate() has not been called successfully)
+            Exception: If the other user does not exist in the backend
+        
+        Example:
+            >>> api = XApis()
+            >>> api.authenticate("token_user@example.com")
+            >>> mutual = api.get_mutual_followers("other-user-uuid")
+            >>> print(f"{mutual['pagination']['total']} followers in common")
+        """
+        self._ensure_authenticated()
+        
+        if user_id not in self.users:
+            raise Exception("User not found")
+        
+        mine = self._followers.get(self.current_user_id, set())
+        theirs = self._followers.get(user_id, set())
+        smaller, larger = (mine, theirs) if len(mine) <= len(theirs) else (theirs, mine)
+        mutual = [follower_id for follower_id in smaller if follower_id in larger and follower_id in self.users]
+        
+        return {
+            "data": [
+                {
+                    "id": follower_id,
+                    "username": self.users[follower_id]["username"],
+                    "name": self.users[follower_id]["name"],
+                    "verified": self.users[follower_id].get("is_verified", False)
+                }
+                for follower_id in self._rank_by_followers(mutual, offset + limit)[offset:]
+            ],
+            "pagination": {
+                "limit": limit,
+                "offset": offset,
+                "total": len(mutual)
+            }
+        }
+
+    def suggest_follows(self, limit: int = 10) -> Dict[str, Any]:
+        """
+        Suggest accounts for the authenticated user to follow, ranked by friends-of-friends.
+        
+        A candidate's score is the number of accounts the user follows that follow the candidate,
+        i.e. the user's row of the follow adjacency matrix squared. Only the adjacency sets of the
+        accounts the user follows are read. Ties are broken by follower count.
+
+        Args:
+            limit (int, optional): Maximum number of suggestions to return. Defaults to 10.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing the suggestions:
+                {
+                    "data": [                       # Suggested users, best first
+                        {
+                            "id": str,              # User UUID
+                            "username": str,        # X handle
+                            "name": str,            # Display name
+                            "verified": bool,       # Verification status
+                            "followed_by_count": int  # Accounts you follow that follow this user
+                        },
+                        # ... more suggestions
+                    ]
+                }
+
+        Raises:
+            Exception: If not authenticated (authenticate() has not been called successfully)
+        
+        Note:
+            - Never suggests the user themselves or accounts they already follow
+        
+        Example:
+            >>> api = XApis()
+            >>> api.authenticate("token_user@example.com")
+            >>> for user in api.suggest_follows(limit=5)["data"]:
+            ...     print(f"@{user['username']} (followed by {user['followed_by_count']} you follow)")
+        """
+        self._ensure_authenticated()
+        
+        following = self._following.get(self.current_user_id, set())
+        scores: Dict[str, int] = {}
+        for followed_id in following:
+            for candidate_id in self._following.get(followed_id, ()):
+                scores[candidate_id] = scores.get(candidate_id, 0) + 1
+        for excluded_id in following | {self.current_user_id}:
+            scores.pop(excluded_id, None)
+        
+        ranked = heapq.nsmallest(
+            limit, (user_id for user_id in scores if user_id in self.users),
+            key=lambda user_id: (-scores[user_id], -len(self._followers.get(user_id, ())), user_id)
+        )
+        return {
+            "data": [
+                {
+                    "id": user_id,
+                    "username": self.users[user_id]["username"],
+                    "name": self.users[user_id]["name"],
+                    "verified": self.users[user_id].get("is_verified", False),
+                    "followed_by_count": scores[user_id]
+                }
+                for user_id in ranked
+            ]
+        }
+
     def get_liked_tweets(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """
         Retrieve a paginated list of tweets that the authenticated user has liked.
@@ -543,11 +1136,11 @@ class XApis:
         if not user_data:
             raise Exception("User data not found")
         
-        liked_post_uuids = user_data.get("liked_posts", [])
-        paginated_likes = liked_post_uuids[offset:offset + limit]
+        liked_post_uuids = user_data.get("liked_posts", {})
+        paginated_likes = itertools.islice(liked_post_uuids, offset, offset + limit)
         
         liked_posts_details = [
-            copy.deepcopy(self.posts[p_id]) for p_id in paginated_likes if p_id in self.posts
+            self._post_response(p_id) for p_id in paginated_likes if p_id in self.posts
         ]
         
         return {
@@ -598,6 +1191,7 @@ class XApis:
         Side Effects:
             - Creates a new tweet entry in self.posts dictionary
             - Appends the new tweet UUID to the user's "posts" list
+            - Pushes the tweet into the home timelines of the user and their followers
             - Increments the user's "api_usage.posts_created" counter
             - Prints a confirmation message to stdout with tweet ID and username
         
@@ -623,6 +1217,7 @@ class XApis:
             "lang": "en",
             "possibly_sensitive": False,
             "edit_history_tweet_ids": [post_uuid],
+            "likes": {},
             "public_metrics": {
                 "retweet_count": 0,
                 "reply_count": 0,
@@ -632,11 +1227,14 @@ class XApis:
             }
         }
         self.posts[post_uuid] = new_post
-        user_data["posts"].append(post_uuid)
+        self._post_text_index.add(post_uuid, text)
+        bisect.insort(self._author_posts.setdefault(self.current_user_id, []), (new_post["created_at"], post_uuid))
+        self._fan_out_post(post_uuid)
+        user_data.setdefault("posts", {})[post_uuid] = None
         user_data["api_usage"]["posts_created"] = user_data["api_usage"].get("posts_created", 0) + 1
         
         print(f"Tweet created: ID={post_uuid} by {user_data['username']}")
-        return copy.deepcopy(new_post)
+        return self._post_response(post_uuid)
 
     def delete_tweet(self, tweet_id: str) -> None:
         """
@@ -661,7 +1259,8 @@ class XApis:
         Side Effects:
             - Removes the tweet entry from self.posts dictionary
             - Removes tweet_id from the author's "posts" list
-            - Removes tweet_id from all users' "liked_posts" lists
+            - Removes tweet_id from all likers' "liked_posts"
+            - Removes the tweet from home timelines
             - Prints a confirmation message to stdout
         
         Note:
@@ -685,14 +1284,18 @@ class XApis:
             raise Exception("Not authorized to delete this tweet")
 
         if tweet_id in self.posts:
+            self._post_text_index.remove(tweet_id)
+            self._remove_from_timelines(post)
             del self.posts[tweet_id]
             # Remove from author's list of posts
-            if self.current_user_id in self.users and tweet_id in self.users[self.current_user_id].get("posts", []):
-                self.users[self.current_user_id]["posts"].remove(tweet_id)
-            # Remove from any user's liked_posts
-            for u_data in self.users.values():
-                if tweet_id in u_data.get("liked_posts", []):
-                    u_data["liked_posts"].remove(tweet_id)
+            if self.current_user_id in self.users:
+                self.users[self.current_user_id].get("posts", {}).pop(tweet_id, None)
+            # Remove from the liked_posts of the users who liked it
+            for liker_id in post["likes"]:
+                self.users.get(liker_id, {}).get("liked_posts", {}).pop(tweet_id, None)
+            self._likes_received[self.current_user_id] = max(
+                0, self._likes_received.get(self.current_user_id, 0) - post["public_metrics"]["like_count"]
+            )
             
             print(f"Tweet deleted: ID={tweet_id}")
         else:
@@ -746,7 +1349,7 @@ class XApis:
         if not post_data:
             raise Exception("Tweet not found")
         
-        return copy.deepcopy(post_data)
+        return self._post_response(tweet_id)
 
     def get_user_tweets(self, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """
@@ -813,21 +1416,120 @@ class XApis:
         if not user_data:
             raise Exception("User data not found")
 
-        user_post_uuids = user_data.get("posts", [])
-        user_posts = [
-            copy.deepcopy(self.posts[p_id]) for p_id in user_post_uuids if p_id in self.posts
+        # The author index is sorted oldest first, so the page is read from its end
+        author_posts = self._author_posts.get(self.current_user_id, [])
+        end = max(len(author_posts) - offset, 0)
+        paginated_posts = [
+            self._post_response(p_id) for _, p_id in reversed(author_posts[max(end - limit, 0):end])
         ]
-        # Sort by creation time, most recent first
-        user_posts.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        paginated_posts = user_posts[offset:offset + limit]
         
         return {
             "data": paginated_posts,
             "pagination": {
                 "limit": limit,
                 "offset": offset,
-                "total": len(user_posts)
+                "total": len(author_posts)
+            }
+        }
+
+    def get_home_timeline(self, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve the authenticated user's home timeline: their own tweets and tweets from accounts they follow.
+        
+        Tweets are returned newest first and paginated with an opaque cursor. Timelines are kept as
+        bounded buffers that create_tweet fills by fan-out to the author's followers, so a page is
+        read directly from the buffer. Tweets from accounts with more than FANOUT_FOLLOWER_LIMIT
+        followers are not fanned out and are merged in at read time instead.
+
+        Args:
+            limit (int, optional): Maximum number of tweets to return in a single response. Must be
+                at least 1. Defaults to 20.
+            cursor (Optional[str], optional): Pagination cursor. Pass the next_cursor from a previous
+                response to get the following (older) page. Defaults to None (start from the newest).
+
+        Returns:
+            Dict[str, Any]: A dictionary containing a page of the home timeline:
+                {
+                    "data": [                       # Complete tweet objects (sorted newest first)
+                        {
+                            "id": str,              # Tweet UUID
+                            "author_id": str,       # Author's user UUID
+                            "text": str,            # Tweet text content
+                            "created_at": str,      # Tweet creation timestamp (ISO 8601)
+                            # ... other tweet fields
+                        },
+                        # ... more tweets
+                    ],
+                    "pagination": {
+                        "limit": int,               # Requested page size
+                        "result_count": int,        # Number of tweets in this page
+                        "next_cursor": str          # Cursor for the next page (None when exhausted)
+                    }
+                }
+
+        Raises:
+            Exception: If not authenticated (authenticate() has not been called successfully)
+            Exception: If user data cannot be found in the backend
+            Exception: If limit is less than 1
+            Exception: If the cursor is malformed
+        
+        Note:
+            - Timelines buffer at most HOME_TIMELINE_SIZE fanned-out tweets; pages older than the
+              buffer are read from each followed account's own tweets instead
+            - Returns deep copies of tweet data
+        
+        Example:
+            >>> api = XApis()
+            >>> api.authenticate("token_user@example.com")
+            >>> page = api.get_home_timeline(limit=10)
+            >>> older = api.get_home_timeline(limit=10, cursor=page["pagination"]["next_cursor"])
+        """
+        self._ensure_authenticated()
+        
+        user_data = self._get_user_data(self.current_user_id)
+        if not user_data:
+            raise Exception("User data not found")
+        
+        if limit < 1:
+            raise Exception("Limit must be at least 1")
+        
+        before = None
+        if cursor:
+            created_at, separator, post_id = cursor.partition("|")
+            if not separator or not post_id:
+                raise Exception("Invalid cursor")
+            before = (created_at, post_id)
+        
+        # The buffer holds every fanned-out entry from its oldest one on, so first page from it and
+        # the high-follower accounts down to that horizon
+        buffer = self._get_home_timeline_buffer(self.current_user_id)
+        horizon = buffer[0] if buffer else None
+        sources = [buffer]
+        sources.extend(
+            self._author_posts.get(author_id, []) for author_id in self._high_follower_authors
+            if self.current_user_id in self._followers.get(author_id, ()) and author_id != self.current_user_id
+        )
+        page = self._newest_entries(sources, before, horizon, limit + 1) if horizon else []
+        if len(page) <= limit:
+            # The page reaches past the buffer, so read every source from its own post index
+            sources = [self._author_posts.get(self.current_user_id, [])]
+            sources.extend(
+                self._author_posts.get(followed_id, []) for followed_id in user_data.get("following", {})
+                if followed_id != self.current_user_id
+            )
+            page = self._newest_entries(sources, before, None, limit + 1)
+        
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = "|".join(page[-1])
+        
+        return {
+            "data": [self._post_response(post_id) for _, post_id in page],
+            "pagination": {
+                "limit": limit,
+                "result_count": len(page),
+                "next_cursor": next_cursor
             }
         }
 
@@ -853,9 +1555,9 @@ class XApis:
             Exception: If the user has already liked this tweet (duplicate like prevention)
         
         Side Effects:
-            - Appends tweet_id to the user's "liked_posts" list
+            - Adds tweet_id to the user's "liked_posts" and the user to the tweet's "likes"
             - Increments the tweet's "public_metrics.like_count" by 1
-            - Initializes public_metrics dict if it doesn't exist on the tweet
+            - Increments the author's running likes-received total
             - Prints a confirmation message to stdout with tweet ID and username
         
         Example:
@@ -874,15 +1576,18 @@ class XApis:
         if not post:
             raise Exception("Tweet not found")
 
-        if tweet_id in user.get("liked_posts", []):
+        likers = post["likes"]
+        if self.current_user_id in likers:
             raise Exception("Tweet already liked by this user")
         
-        user.setdefault("liked_posts", []).append(tweet_id)
+        likers[self.current_user_id] = None
+        user["liked_posts"][tweet_id] = None
         
-        # Update public metrics
-        if "public_metrics" not in post:
-            post["public_metrics"] = {"retweet_count": 0, "reply_count": 0, "like_count": 0, "quote_count": 0, "impression_count": 0}
-        post["public_metrics"]["like_count"] = post["public_metrics"].get("like_count", 0) + 1
+        # Update public metrics and the author's running total
+        post["public_metrics"]["like_count"] = len(likers)
+        if "likes" in post.get("metrics", {}):
+            post["metrics"]["likes"] = len(likers)
+        self._likes_received[post["author_id"]] = self._likes_received.get(post["author_id"], 0) + 1
         
         print(f"Tweet liked: ID={tweet_id} by {user['username']}")
 
@@ -908,8 +1613,9 @@ class XApis:
             Exception: If the user has not liked this tweet (cannot unlike what wasn't liked)
         
         Side Effects:
-            - Removes tweet_id from the user's "liked_posts" list
-            - Decrements the tweet's "public_metrics.like_count" by 1 (minimum 0)
+            - Removes tweet_id from the user's "liked_posts" and the user from the tweet's "likes"
+            - Decrements the tweet's "public_metrics.like_count" by 1
+            - Decrements the author's running likes-received total
             - Prints a confirmation message to stdout with tweet ID and username
         
         Example:
@@ -929,14 +1635,18 @@ class XApis:
         if not post:
             raise Exception("Tweet not found")
 
-        if tweet_id not in user.get("liked_posts", []):
+        likers = post["likes"]
+        if self.current_user_id not in likers:
             raise Exception("Tweet not liked by this user")
         
-        user.setdefault("liked_posts", []).remove(tweet_id)
+        del likers[self.current_user_id]
+        user["liked_posts"].pop(tweet_id, None)
         
-        # Update public metrics
-        if "public_metrics" in post:
-            post["public_metrics"]["like_count"] = max(0, post["public_metrics"].get("like_count", 0) - 1)
+        # Update public metrics and the author's running total
+        post["public_metrics"]["like_count"] = len(likers)
+        if "likes" in post.get("metrics", {}):
+            post["metrics"]["likes"] = len(likers)
+        self._likes_received[post["author_id"]] = max(0, self._likes_received.get(post["author_id"], 0) - 1)
         
         print(f"Tweet unliked: ID={tweet_id} by {user['username']}")
 
@@ -979,7 +1689,7 @@ class XApis:
         
         Note:
             - Only returns conversations where the user is a participant
-            - Messages within each conversation are sorted by timestamp to find the last message
+            - Conversations are ordered by last activity (most recent message first)
             - Participant usernames are resolved from user IDs
         
         Example:
@@ -996,51 +1706,50 @@ class XApis:
         if self.current_user_id not in self.users:
             raise Exception("User not found")
 
-        user_conversations = []
-        for conv_id, conv_data in self.direct_messages.items():
-            if self.current_user_id in conv_data.get("participants", []):
-                # Get participant details (usernames)
-                participant_usernames = []
-                for p_uuid in conv_data["participants"]:
-                    p_data = self.users.get(p_uuid)
-                    if p_data:
-                        participant_usernames.append(p_data["username"])
-                
-                # Get the last message
-                last_message = None
-                if conv_data["messages"]:
-                    # Ensure messages are sorted by timestamp for correct "last message"
-                    sorted_messages = sorted(conv_data["messages"], key=lambda msg: msg.get("created_at", ""))
-                    last_message = sorted_messages[-1].get("text", "")
-
-                user_conversations.append({
-                    "conversation_id": conv_id,
-                    "participants": participant_usernames,
-                    "last_message_snippet": last_message
-                })
-        
-        # Pagination
-        paginated_conversations = user_conversations[offset:offset + limit]
+        conversation_ids = self._conversations_by_participant.get(self.current_user_id, set())
+        
+        # Most recently active first; only the requested page is ranked and built
+        def last_activity(conv_id: str) -> Tuple[str, str]:
+            last_message = self._last_messages.get(conv_id)
+            return (self._message_time(last_message) if last_message else "", conv_id)
+        
+        page_ids = heapq.nlargest(offset + limit, conversation_ids, key=last_activity)[offset:]
+        
+        paginated_conversations = []
+        for conv_id in page_ids:
+            conv_data = self.direct_messages[conv_id]
+            last_message = self._last_messages.get(conv_id)
+            paginated_conversations.append({
+                "conversation_id": conv_id,
+                "participants": [
+                    self.users[p_uuid]["username"] for p_uuid in conv_data["participants"] if p_uuid in self.users
+                ],
+                "last_message_snippet": last_message.get("text", "") if last_message else None
+            })
         
         return {
             "data": paginated_conversations,
             "pagination": {
                 "limit": limit,
                 "offset": offset,
-                "total": len(user_conversations)
+                "total": len(conversation_ids)
             }
         }
 
-    def get_dm_conversation(self, conversation_id: str) -> Dict[str, Any]:
+    def get_dm_conversation(self, conversation_id: str, limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
         """
-        Retrieve all messages within a specific DM conversation. Requires user to be a participant.
+        Retrieve messages within a specific DM conversation. Requires user to be a participant.
         
-        This method returns the complete conversation data including all messages in chronological order.
+        This method returns the conversation data including its messages in chronological order.
         The authenticated user must be a participant in the conversation to access it, ensuring privacy.
 
         Args:
             conversation_id (str): The UUID of the conversation to retrieve. Must be a valid conversation
                 ID that exists in the backend and includes the authenticated user as a participant.
+            limit (Optional[int], optional): Maximum number of messages to return. Defaults to None
+                (return every message).
+            offset (int, optional): Number of most recent messages to skip when limit is given.
+                Defaults to 0, so offset=0 returns the latest page and offset=limit the page before it.
 
         Returns:
             Dict[str, Any]: A deep copy of the conversation data with sorted messages:
@@ -1055,7 +1764,12 @@ class XApis:
                             "created_at": str       # Message timestamp (ISO 8601)
                         },
                         # ... more messages in chronological order
-                    ]
+                    ],
+                    "pagination": {                 # Only present when limit is given
+                        "limit": int,
+                        "offset": int,
+                        "total": int                # Total messages in the conversation
+                    }
                 }
 
         Raises:
@@ -1064,7 +1778,7 @@ class XApis:
             Exception: If the authenticated user is not a participant in this conversation (authorization failure)
         
         Note:
-            - Messages are sorted by created_at timestamp in ascending order (oldest first)
+            - Messages are kept sorted by timestamp in ascending order (oldest first), so pages are sliced directly
             - Returns a deep copy to prevent external modifications to backend state
         
         Example:
@@ -1085,10 +1799,14 @@ class XApis:
         if self.current_user_id not in conv_data.get("participants", []):
             raise Exception("Not authorized to view this conversation")
         
-        # Sort messages by timestamp
-        sorted_messages = sorted(conv_data.get("messages", []), key=lambda msg: msg.get("created_at", ""))
-        conversation_copy = copy.deepcopy(conv_data)
-        conversation_copy["messages"] = sorted_messages
+        messages = conv_data.get("messages", [])
+        conversation_copy = {key: copy.deepcopy(value) for key, value in conv_data.items() if key != "messages"}
+        if limit is None:
+            conversation_copy["messages"] = copy.deepcopy(messages)
+        else:
+            end = max(len(messages) - offset, 0)
+            conversation_copy["messages"] = copy.deepcopy(messages[max(end - limit, 0):end])
+            conversation_copy["pagination"] = {"limit": limit, "offset": offset, "total": len(messages)}
         
         return conversation_copy
 
@@ -1129,7 +1847,7 @@ class XApis:
         
         Side Effects:
             - Creates a new conversation in self.direct_messages if none exists between the users
-            - Appends the new message to the conversation's "messages" list
+            - Appends the new message to the conversation's "messages" list and makes it the last message
             - Increments the sender's "api_usage.dms_sent" counter
             - Prints a confirmation message to stdout with conversation ID and usernames
         
@@ -1151,12 +1869,7 @@ class XApis:
             raise Exception("Recipient user not found")
 
         # Find existing conversation or create a new one
-        conversation_id = None
-        for conv_id, conv_data in self.direct_messages.items():
-            participants = set(conv_data.get("participants", []))
-            if participants == {self.current_user_id, recipient_id}:
-                conversation_id = conv_id
-                break
+        conversation_id = self._conversations_by_members.get(frozenset((self.current_user_id, recipient_id)))
 
         if not conversation_id:
             conversation_id = self._generate_unique_id()
@@ -1165,6 +1878,7 @@ class XApis:
                 "participants": sorted([self.current_user_id, recipient_id]), # Ensure consistent order
                 "messages": []
             }
+            self._index_conversation(conversation_id)
         
         new_message = {
             "id": self._generate_unique_id(), # Unique ID for the message
@@ -1173,6 +1887,7 @@ class XApis:
             "created_at": datetime.now().isoformat(timespec='milliseconds') + "Z"
         }
         self.direct_messages[conversation_id]["messages"].append(new_message)
+        self._last_messages[conversation_id] = new_message
         
         # Update API usage for the sender
         sender_data = self.users[self.current_user_id]
@@ -1227,6 +1942,7 @@ class XApis:
 
         # Delete from global store
         if conversation_id in self.direct_messages:
+            self._unindex_conversation(conversation_id)
             del self.direct_messages[conversation_id]
             print(f"Conversation {conversation_id} deleted by user {self.current_user_id}")
 
@@ -1392,10 +2108,12 @@ class XApis:
         if not user_data:
             raise Exception("User data not found")
         
+        self._unindex_user_profile(self.current_user_id)
         if bio is not None:
             user_data["bio"] = bio
         if name is not None:
             user_data["name"] = name
+        self._index_user_profile(self.current_user_id)
         
         return {
             "id": user_data.get("id"),
@@ -1434,7 +2152,8 @@ class XApis:
             Exception: If user data cannot be found in the backend
         
         Note:
-            - total_likes_received is calculated by summing like_count from all tweets by this user
+            - total_likes_received is a running total of like_count across the user's tweets, kept
+              current by like_tweet, unlike_tweet and delete_tweet
             - engagement_ratio is rounded to 2 decimal places
             - engagement_ratio uses max(tweet_count, 1) to avoid division by zero
         
@@ -1454,8 +2173,8 @@ class XApis:
         if not user_data:
             raise Exception("User data not found")
 
-        user_posts = [p for p in self.posts.values() if p.get("author_id") == self.current_user_id]
-        total_likes_received = sum(p.get("public_metrics", {}).get("like_count", 0) for p in user_posts)
+        tweet_count = len(self._author_posts.get(self.current_user_id, []))
+        total_likes_received = self._likes_received.get(self.current_user_id, 0)
         
         return {
             "user_id": self.current_user_id,
@@ -1465,11 +2184,11 @@ class XApis:
             "public_metrics": {
                 "followers_count": len(user_data.get("followers", [])),
                 "following_count": len(user_data.get("following", [])),
-                "tweet_count": len(user_data.get("posts", [])),
+                "tweet_count": tweet_count,
                 "like_count": len(user_data.get("liked_posts", []))
             },
             "total_likes_received": total_likes_received,
-            "engagement_ratio": round(total_likes_received / max(len(user_posts), 1), 2)
+            "engagement_ratio": round(total_likes_received / max(tweet_count, 1), 2)
         }
 
     def search_users_by_bio(self, search_term: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
@@ -1515,7 +2234,8 @@ class XApis:
         Note:
             - This method does NOT require authentication
             - Search is case-insensitive
-            - Uses substring matching (not exact word matching)
+            - Uses substring matching (not exact word matching), served from a bio word index
+            - Results are sorted by follower count (most followed first)
             - Users with empty bios will not match any search term
         
         Example:
@@ -1526,31 +2246,28 @@ class XApis:
             >>> for user in results['data']:
             ...     print(f"@{user['username']}: {user['bio']}")
         """
-        matching_users = []
-        search_term_lower = search_term.lower()
-        
-        for user_id, user_data in self.users.items():
-            bio = user_data.get("bio", "").lower()
-            if search_term_lower in bio:
-                matching_users.append({
-                    "id": user_id,
-                    "username": user_data.get("username"),
-                    "name": user_data.get("name"),
-                    "bio": user_data.get("bio"),
-                    "verified": user_data.get("is_verified", False),
-                    "public_metrics": {
-                        "followers_count": len(user_data.get("followers", []))
-                    }
-                })
-        
-        paginated_users = matching_users[offset:offset + limit]
+        matching_ids = self._bio_text_index.search(search_term)
+        
+        paginated_users = []
+        for user_id in self._rank_by_followers(matching_ids, offset + limit)[offset:]:
+            user_data = self.users[user_id]
+            paginated_users.append({
+                "id": user_id,
+                "username": user_data.get("username"),
+                "name": user_data.get("name"),
+                "bio": user_data.get("bio"),
+                "verified": user_data.get("is_verified", False),
+                "public_metrics": {
+                    "followers_count": len(user_data.get("followers", []))
+                }
+            })
         
         return {
             "data": paginated_users,
             "pagination": {
                 "limit": limit,
                 "offset": offset,
-                "total": len(matching_users)
+                "total": len(matching_ids)
             }
         }
 
@@ -1609,34 +2326,29 @@ class XApis:
             ...     followers = user['public_metrics']['followers_count']
             ...     print(f"@{user['username']}: {followers:,} followers")
         """
-        verified_users = []
-        
-        for user_id, user_data in self.users.items():
-            if user_data.get("is_verified", False):
-                verified_users.append({
-                    "id": user_id,
-                    "username": user_data.get("username"),
-                    "name": user_data.get("name"),
-                    "bio": user_data.get("bio"),
-                    "profile_picture_url": user_data.get("profile_picture_url"),
-                    "created_at": user_data.get("joined_date"),
-                    "verified": True,
-                    "public_metrics": {
-                        "followers_count": len(user_data.get("followers", []))
-                    }
-                })
-        
-        # Sort by follower count (most followed first)
-        verified_users.sort(key=lambda x: x["public_metrics"]["followers_count"], reverse=True)
-        
-        paginated_users = verified_users[offset:offset + limit]
+        # Verified users are kept sorted by follower count, so the page is a slice
+        paginated_users = []
+        for user_id, followers_count in self._verified_by_followers.page(offset, limit):
+            user_data = self.users[user_id]
+            paginated_users.append({
+                "id": user_id,
+                "username": user_data.get("username"),
+                "name": user_data.get("name"),
+                "bio": user_data.get("bio"),
+                "profile_picture_url": user_data.get("profile_picture_url"),
+                "created_at": user_data.get("joined_date"),
+                "verified": True,
+                "public_metrics": {
+                    "followers_count": followers_count
+                }
+            })
         
         return {
             "data": paginated_users,
             "pagination": {
                 "limit": limit,
                 "offset": offset,
-                "total": len(verified_users)
+                "total": len(self._verified_by_followers)
             }
         }
 
@@ -1687,10 +2399,9 @@ class XApis:
 
         Note:
             - This method does NOT require authentication (public endpoint)
-            - Search is case-insensitive substring matching
+            - Search is case-insensitive substring matching, for queries of any length
             - Searches both display name (name) and handle (username)
             - Results sorted by follower count (descending)
-            - Empty query returns no results
         
         Example:
             >>> api = XApis()
@@ -1707,45 +2418,37 @@ class XApis:
             except ValueError:
                 offset = 0
 
-        query_lower = query.lower()
-        matching_users = []
-        
-        # Search in both name and username fields
-        for user_id, user_data in self.users.items():
-            name = user_data.get("name", "").lower()
-            username = user_data.get("username", "").lower()
-            
-            if query_lower in name or query_lower in username:
-                matching_users.append({
-                    "kind": "x#user",
-                    "etag": "",
-                    "id": user_id,
-                    "username": user_data.get("username"),
-                    "name": user_data.get("name"),
-                    "bio": user_data.get("bio", ""),
-                    "verified": user_data.get("is_verified", False),
-                    "public_metrics": {
-                        "followers_count": len(user_data.get("followers", []))
-                    }
-                })
-        
-        # Sort by follower count (most followed first)
-        matching_users.sort(key=lambda x: x["public_metrics"]["followers_count"], reverse=True)
-        
-        paginated_users = matching_users[offset:offset + maxResults]
+        matching_ids = self._user_name_index.search(query)
+        
+        # Most followed first; only the requested page is built
+        paginated_users = []
+        for user_id in self._rank_by_followers(matching_ids, offset + maxResults)[offset:]:
+            user_data = self.users[user_id]
+            paginated_users.append({
+                "kind": "x#user",
+                "etag": "",
+                "id": user_id,
+                "username": user_data.get("username"),
+                "name": user_data.get("name"),
+                "bio": user_data.get("bio", ""),
+                "verified": user_data.get("is_verified", False),
+                "public_metrics": {
+                    "followers_count": len(user_data.get("followers", []))
+                }
+            })
         
         result = {
             "kind": "x#userSearchListResponse",
             "etag": "",
             "pageInfo": {
-                "totalResults": len(matching_users),
+                "totalResults": len(matching_ids),
                 "resultsPerPage": len(paginated_users)
             },
             "items": paginated_users
         }
         
         # Add nextPageToken if there are more results
-        if offset + maxResults < len(matching_users):
+        if offset + maxResults < len(matching_ids):
             result["nextPageToken"] = str(offset + maxResults)
         
         return result
@@ -1820,47 +2523,38 @@ class XApis:
             except ValueError:
                 offset = 0
 
-        query_lower = query.lower()
-        matching_tweets = []
-        
-        # Search in tweet text
-        for tweet_id, tweet_data in self.posts.items():
-            text = tweet_data.get("text", "").lower()
-            
-            if query_lower in text:
-                matching_tweets.append({
-                    "kind": "x#tweet",
-                    "etag": "",
-                    "id": tweet_id,
-                    "author_id": tweet_data.get("author_id"),
-                    "text": tweet_data.get("text"),
-                    "created_at": tweet_data.get("created_at"),
-                    "public_metrics": {
-                        "retweet_count": len(tweet_data.get("reposts", [])),
-                        "reply_count": tweet_data.get("metrics", {}).get("replies", 0),
-                        "like_count": len(tweet_data.get("likes", [])),
-                        "quote_count": tweet_data.get("metrics", {}).get("quotes", 0),
-                        "impression_count": tweet_data.get("metrics", {}).get("views", 0)
-                    }
-                })
-        
-        # Sort by creation time, most recent first
-        matching_tweets.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        paginated_tweets = matching_tweets[offset:offset + maxResults]
+        matching_ids = self._post_text_index.search(query)
+        
+        # Newest offset + maxResults matches, most recent first; only the page is built
+        newest_ids = heapq.nlargest(
+            offset + maxResults, matching_ids,
+            key=lambda post_id: self.posts[post_id].get("created_at", "")
+        )
+        paginated_tweets = []
+        for tweet_id in newest_ids[offset:]:
+            tweet_data = self.posts[tweet_id]
+            paginated_tweets.append({
+                "kind": "x#tweet",
+                "etag": "",
+                "id": tweet_id,
+                "author_id": tweet_data.get("author_id"),
+                "text": tweet_data.get("text"),
+                "created_at": tweet_data.get("created_at"),
+                "public_metrics": dict(tweet_data["public_metrics"])
+            })
         
         result = {
             "kind": "x#tweetSearchListResponse",
             "etag": "",
             "pageInfo": {
-                "totalResults": len(matching_tweets),
+                "totalResults": len(matching_ids),
                 "resultsPerPage": len(paginated_tweets)
             },
             "items": paginated_tweets
         }
         
         # Add nextPageToken if there are more results
-        if offset + maxResults < len(matching_tweets):
+        if offset + maxResults < len(matching_ids):
             result["nextPageToken"] = str(offset + maxResults)
         
         return result
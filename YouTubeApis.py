@@ -1,9 +1,13 @@
 # Inspired by https://developers.google.com/youtube/v3/docs
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from itertools import accumulate, islice
+import bisect
 import copy
+import heapq
+import re
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import sys
 from pathlib import Path
 
@@ -12,9 +16,119 @@ parent_dir = Path(__file__).parent
 sys.path.insert(0, str(parent_dir / 'UnitTests'))
 
 from UnitTests.test_data_helper import BackendDataLoader
+from text_index import TextIndex
 
 DEFAULT_STATE = BackendDataLoader.get_youtube_data()
 
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Metrics a channel accrues; each is also credited to the channel owner's user aggregates
+_CHANNEL_METRICS = ("views", "likes", "comments", "subscribers", "videos")
+# Metrics for a user's own activity on other videos and channels
+_USER_ACTIVITY_METRICS = ("likes_given", "comments_made", "subscriptions")
+_CUE_TIMING_PATTERN = re.compile(
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{3})\s*-->\s*(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{3})"
+)
+_CUE_MARKUP_PATTERN = re.compile(r"<[^>]+>")
+
+
+def _parse_caption_cues(track_content: str) -> List[Tuple[int, int, str]]:
+    """
+    Parse SRT or WebVTT caption content into (start_ms, end_ms, text) cues.
+    
+    Each cue's text lines are joined with spaces and stripped of inline markup. Content without
+    any timing lines is kept as a single untimed cue at 0 ms.
+    """
+    cues = []
+    for block in re.split(r"\n\s*\n", track_content.replace("\r\n", "\n").strip()):
+        lines = block.split("\n")
+        for position, line in enumerate(lines):
+            timing = _CUE_TIMING_PATTERN.search(line)
+            if timing:
+                parts = [int(part or 0) for part in timing.groups()]
+                start_ms = ((parts[0] * 60 + parts[1]) * 60 + parts[2]) * 1000 + parts[3]
+                end_ms = ((parts[4] * 60 + parts[5]) * 60 + parts[6]) * 1000 + parts[7]
+                text = " ".join(_CUE_MARKUP_PATTERN.sub("", " ".join(lines[position + 1:])).split())
+                if text:
+                    cues.append((start_ms, end_ms, text))
+                break
+    if not cues and track_content.strip():
+        cues.append((0, 0, " ".join(track_content.split())))
+    return cues
+
+
+def _format_cue_time(milliseconds: int) -> str:
+    """Format a cue offset as HH:MM:SS.mmm."""
+    seconds, millis = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
+def _day_ordinal(timestamp: Optional[str] = None) -> Optional[int]:
+    """
+    Convert an ISO 8601 timestamp or YYYY-MM-DD date to a day ordinal, or today's ordinal if None.
+    Returns None for timestamps that cannot be parsed.
+    """
+    if timestamp is None:
+        return datetime.now(timezone.utc).date().toordinal()
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).date().toordinal()
+    except (AttributeError, ValueError):
+        return None
+
+
+class _DailySeries:
+    """
+    Per-day counts of one metric, stored as a dense array starting at the first recorded day.
+    
+    Window sums are answered from a prefix-sum array. Adding to the latest day keeps the prefix
+    sums current in O(1); adding to an earlier day invalidates them until the next query.
+    """
+
+    __slots__ = ("first_day", "counts", "_prefix")
+
+    def __init__(self):
+        self.first_day: Optional[int] = None
+        self.counts: List[int] = []
+        self._prefix: Optional[List[int]] = None
+
+    def add(self, day: int, amount: int) -> None:
+        if self.first_day is None:
+            self.first_day = day
+        elif day < self.first_day:
+            self.counts[:0] = [0] * (self.first_day - day)
+            self.first_day = day
+            self._prefix = None
+        index = day - self.first_day
+        if index >= len(self.counts):
+            padding = index + 1 - len(self.counts)
+            self.counts.extend([0] * padding)
+            if self._prefix is not None:
+                self._prefix.extend([self._prefix[-1]] * padding)
+        self.counts[index] += amount
+        if self._prefix is not None:
+            if index == len(self.counts) - 1:
+                self._prefix[-1] += amount
+            else:
+                self._prefix = None
+
+    def total(self, start_day: int, end_day: int) -> int:
+        """Sum of the counts from start_day to end_day inclusive."""
+        if self.first_day is None:
+            return 0
+        low = max(start_day - self.first_day, 0)
+        high = min(end_day - self.first_day + 1, len(self.counts))
+        if low >= high:
+            return 0
+        if self._prefix is None:
+            self._prefix = list(accumulate(self.counts, initial=0))
+        return self._prefix[high] - self._prefix[low]
+
+    def last_day(self) -> Optional[int]:
+        return None if self.first_day is None else self.first_day + len(self.counts) - 1
+
+
 class YouTubeApis:
     """
     An API class for simulating YouTube operations.
@@ -47,6 +161,20 @@ class YouTubeApis:
         self.comments: Dict[str, Any] = {} # Keyed by comment UUID
         self.access_token: Optional[str] = None
         self.current_user_id: Optional[str] = None
+        self._video_search_index = TextIndex() # Substring search over video titles, descriptions and tags
+        self._video_comments: Dict[str, List[Tuple[str, str]]] = {} # Video UUID -> sorted (published_at, comment UUID)
+        self._users_by_email: Dict[str, Dict[str, None]] = {} # Email -> ordered set of user UUIDs
+        self._users_by_display_name: Dict[str, Dict[str, None]] = {} # Display name -> ordered set of user UUIDs
+        self._users_by_language: Dict[str, Dict[str, None]] = {} # Language preference -> ordered set of user UUIDs
+        self._users_by_account_status: Dict[str, Dict[str, None]] = {} # Account status -> ordered set of user UUIDs
+        self._channel_totals: Dict[str, Dict[str, int]] = {} # Channel UUID -> metric -> lifetime count
+        self._channel_daily: Dict[str, Dict[str, _DailySeries]] = {} # Channel UUID -> metric -> daily counts
+        self._user_totals: Dict[str, Dict[str, int]] = {} # User UUID -> metric -> lifetime count
+        self._user_daily: Dict[str, Dict[str, _DailySeries]] = {} # User UUID -> metric -> daily counts
+        self._caption_tracks: Dict[str, Dict[str, Any]] = {} # Caption UUID -> parsed track with timed cues
+        self._video_captions: Dict[str, set] = {} # Video UUID -> caption UUIDs
+        self._caption_word_index: Dict[str, set] = {} # Lowercased cue word -> caption UUIDs containing it
+        self._cue_text_pool: Dict[str, List[Any]] = {} # Cue text -> [shared string, reference count]
 
         self._load_scenario(DEFAULT_STATE)
 
@@ -81,6 +209,39 @@ class YouTubeApis:
         self.videos = copy.deepcopy(scenario.get("videos", {}))
         self.playlists = copy.deepcopy(scenario.get("playlists", {}))
         self.comments = {}
+        self._video_search_index = TextIndex()
+        self._video_comments = {}
+        for video_id in self.videos:
+            self._index_video(video_id)
+            self._load_video_comments(video_id)
+        self._users_by_email = {}
+        self._users_by_display_name = {}
+        self._users_by_language = {}
+        self._users_by_account_status = {}
+        for user_id, user_data in self.users.items():
+            self._index_user_identifiers(user_id)
+            self._move_user_bucket(self._users_by_language, user_id, None, user_data.get("language_preference"))
+            self._move_user_bucket(self._users_by_account_status, user_id, None, user_data.get("account_status", "active"))
+        # Membership lists are kept as insertion-ordered dicts of UUID -> day ordinal added (None when
+        # the scenario does not say) for O(1) add and remove
+        for user_data in self.users.values():
+            user_data["subscriptions"] = dict.fromkeys(user_data.get("subscriptions", []))
+            user_data["liked_videos"] = dict.fromkeys(user_data.get("liked_videos", []))
+        for channel_data in self.channels.values():
+            channel_data["subscribers"] = dict.fromkeys(channel_data.get("subscribers", []))
+        for video_data in self.videos.values():
+            video_data["liked_by"] = dict.fromkeys(video_data.get("liked_by", []))
+        self._load_analytics()
+        self._caption_tracks = {}
+        self._video_captions = {}
+        self._caption_word_index = {}
+        self._cue_text_pool = {}
+        for channel_id, channel_data in self.channels.items():
+            # Every stored caption is indexed, even one whose video is gone, so it can still be updated or deleted
+            for caption_id, caption_data in channel_data.get("captions", {}).items():
+                track_content = caption_data.get("track_content", caption_data.get("content_snippet", ""))
+                self._index_caption_track(caption_id, channel_id, caption_data.get("video_id"),
+                                          caption_data.get("language", ""), track_content)
         print("YouTubeApis: Loaded scenario with UUIDs for users, channels, videos, playlists, and comments.")
 
     def authenticate(self, access_token: str) -> Dict[str, Any]:
@@ -129,11 +290,7 @@ class YouTubeApis:
         email = access_token.replace("token_", "")
         
         # Find user by email
-        user_id = None
-        for uid, user_data in self.users.items():
-            if user_data.get("email") == email:
-                user_id = uid
-                break
+        user_id = self._find_user_by_email(email)
         
         if not user_id:
             raise Exception(f"No user found with email: {email}")
@@ -235,9 +392,9 @@ class YouTubeApis:
                 "message": f"User with ID {user_id} not found."
             }
         
-        # Return complete user data including the user_id itself
+        # Return complete user data including the user_id itself, with its ordered sets as lists
         result = {"user_id": user_id}
-        result.update(user_data)
+        result.update(self._with_member_lists(user_data))
         return result
 
     def _update_user_data(self, user_id: str, key: str, value: Any) -> bool:
@@ -254,10 +411,92 @@ class YouTubeApis:
                 does not exist in the backend.
         """
         if user_id in self.users:
+            if key in ("email", "display_name"):
+                self._unindex_user_identifiers(user_id)
+            elif key == "language_preference":
+                self._move_user_bucket(self._users_by_language, user_id, self.users[user_id].get(key), value)
+            elif key == "account_status":
+                self._move_user_bucket(self._users_by_account_status, user_id, self.users[user_id].get(key, "active"), value)
             self.users[user_id][key] = value
+            if key in ("email", "display_name"):
+                self._index_user_identifiers(user_id)
+            elif key in ("subscriptions", "liked_videos"):
+                self.users[user_id][key] = dict.fromkeys(value)
             return True
         return False
 
+    def _index_user_identifiers(self, user_id: str) -> None:
+        """
+        Helper method to add a user's email and display name to the identifier lookup tables.
+        
+        When several users share a display name, the first one indexed answers lookups, matching
+        the first-match order of a scan over self.users.
+        """
+        user_data = self.users[user_id]
+        self._move_user_bucket(self._users_by_email, user_id, None, user_data.get("email"))
+        self._move_user_bucket(self._users_by_display_name, user_id, None, user_data.get("display_name"))
+
+    def _unindex_user_identifiers(self, user_id: str) -> None:
+        """
+        Helper method to remove a user's email and display name from the identifier lookup tables.
+        
+        The next user indexed under the same value, if any, then answers lookups for it.
+        """
+        user_data = self.users[user_id]
+        self._move_user_bucket(self._users_by_email, user_id, user_data.get("email"), None)
+        self._move_user_bucket(self._users_by_display_name, user_id, user_data.get("display_name"), None)
+
+    @staticmethod
+    def _move_user_bucket(buckets: Dict[str, Dict[str, None]], user_id: str, old_value: Optional[str], new_value: Optional[str]) -> None:
+        """
+        Helper method to move a user between the buckets of a secondary index (None means no bucket).
+        """
+        if old_value == new_value and user_id in buckets.get(new_value, {}):
+            return
+        if old_value is not None and old_value in buckets:
+            buckets[old_value].pop(user_id, None)
+            if not buckets[old_value]:
+                del buckets[old_value]
+        if new_value is not None:
+            buckets.setdefault(new_value, {})[user_id] = None
+
+    @staticmethod
+    def _add_to_ordered_set(items: Dict[str, Optional[int]], item: str, day: Optional[int] = None) -> bool:
+        """
+        Helper method to append an item to an ordered set (a dict of item -> day added) unless already present.
+        
+        Returns:
+            bool: True if the item was added, False if it was already a member.
+        """
+        if item in items:
+            return False
+        items[item] = day
+        return True
+
+    @staticmethod
+    def _remove_from_ordered_set(items: Dict[str, Optional[int]], item: str) -> bool:
+        """
+        Helper method to remove an item from an ordered set (a dict of item -> day added) if present.
+        
+        Returns:
+            bool: True if the item was removed, False if it was not a member.
+        """
+        if item not in items:
+            return False
+        del items[item]
+        return True
+
+    @staticmethod
+    def _with_member_lists(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Helper method to deep-copy a user or video for an API response, with its ordered sets as lists.
+        """
+        response = copy.deepcopy(data)
+        for key in ("subscriptions", "liked_videos", "liked_by"):
+            if isinstance(response.get(key), dict):
+                response[key] = list(response[key])
+        return response
+
     def _get_channel_data(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """
         Helper method to retrieve a channel's complete data dictionary based on its UUID.
@@ -319,9 +558,292 @@ class YouTubeApis:
         """
         if video_id in self.videos:
             self.videos[video_id][key] = value
+            if key in ("title", "description", "tags"):
+                self._index_video(video_id)
             return True
         return False
     
+    def _index_video(self, video_id: str) -> None:
+        """
+        Helper method to add a video's title, description and tags to the search index.
+        
+        Args:
+            video_id (str): The UUID of a video present in self.videos.
+        """
+        video_data = self.videos[video_id]
+        self._video_search_index.add(
+            video_id, video_data.get("title"), video_data.get("description"), *video_data.get("tags", [])
+        )
+
+    def _unindex_video(self, video_id: str) -> None:
+        """
+        Helper method to remove a video from the search index.
+        
+        Args:
+            video_id (str): The UUID of the video being deleted.
+        """
+        self._video_search_index.remove(video_id)
+
+    def _load_video_comments(self, video_id: str) -> None:
+        """
+        Helper method to move a video's scenario comments into the comment store.
+        
+        Scenario comments may be plain strings keyed by author UUID. They are normalized in place to
+        the structured {"id", "text", "published_at"} form with an ID assigned once, so the same
+        comment keeps its ID across calls. Comments without a timestamp take the video's publish time.
+        
+        Args:
+            video_id (str): The UUID of a video present in self.videos.
+        """
+        video_data = self.videos[video_id]
+        comments = video_data.get("comments")
+        if not isinstance(comments, dict):
+            comments = video_data["comments"] = {}
+        default_published_at = video_data.get("published_at", "")
+        for author_id, comment_info in comments.items():
+            if not isinstance(comment_info, dict):
+                comment_info = {"text": str(comment_info)}
+            comment_info = {
+                "id": comment_info.get("id") or self._generate_unique_id(),
+                "text": comment_info.get("text", ""),
+                "published_at": comment_info.get("published_at", default_published_at),
+            }
+            comments[author_id] = comment_info
+            self._store_comment(video_id, author_id, comment_info)
+
+    def _store_comment(self, video_id: str, author_id: str, comment_info: Dict[str, Any]) -> None:
+        """
+        Helper method to add a comment to the comment store and the video's ordered comment index.
+        """
+        self.comments[comment_info["id"]] = {
+            "id": comment_info["id"],
+            "video_id": video_id,
+            "author_id": author_id,
+            "text": comment_info["text"],
+            "published_at": comment_info["published_at"],
+            "likes": 0,
+        }
+        bisect.insort(
+            self._video_comments.setdefault(video_id, []),
+            (comment_info["published_at"], comment_info["id"]),
+        )
+
+    def _discard_comment(self, comment_id: str) -> None:
+        """
+        Helper method to remove a comment from the comment store and its video's comment index.
+        """
+        comment_data = self.comments.pop(comment_id, None)
+        if comment_data is None:
+            return
+        entries = self._video_comments.get(comment_data["video_id"], [])
+        key = (comment_data["published_at"], comment_id)
+        position = bisect.bisect_left(entries, key)
+        if position < len(entries) and entries[position] == key:
+            del entries[position]
+
+    def _build_comment_thread(self, comment_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Helper method to format a stored comment as a youtube#commentThread resource.
+        """
+        comment_id = comment_data["id"]
+        author_info = self._get_user_data(comment_data["author_id"])
+        return {
+            "kind": "youtube#commentThread",
+            "etag": f"etag_{comment_id}",
+            "id": comment_id,
+            "snippet": {
+                "videoId": comment_data["video_id"],
+                "topLevelComment": {
+                    "kind": "youtube#comment",
+                    "etag": f"etag_{comment_id}",
+                    "id": comment_id,
+                    "snippet": {
+                        "authorDisplayName": author_info.get("display_name", "Unknown") if author_info else "Unknown",
+                        "authorChannelId": author_info.get("channels", [""])[0] if author_info and author_info.get("channels") else "",
+                        "videoId": comment_data["video_id"],
+                        "textDisplay": comment_data["text"],
+                        "textOriginal": comment_data["text"],
+                        "canRate": True,
+                        "likeCount": comment_data.get("likes", 0),
+                        "publishedAt": comment_data["published_at"],
+                        "updatedAt": comment_data["published_at"]
+                    }
+                },
+                "canReply": True,
+                "totalReplyCount": 0,
+                "isPublic": True
+            }
+        }
+
+    def _load_analytics(self) -> None:
+        """
+        Helper method to rebuild the analytics aggregates from the loaded scenario.
+        
+        Uploads and comments carry timestamps and are bucketed by day. Scenario views, likes and
+        subscriptions have no dates, so they only seed the lifetime totals.
+        """
+        self._channel_totals = {}
+        self._channel_daily = {}
+        self._user_totals = {}
+        self._user_daily = {}
+        for channel_id, channel_data in self.channels.items():
+            self._record_channel_metric(channel_id, "subscribers", channel_data.get("subscriber_count", 0), None)
+        for video_id, video_data in self.videos.items():
+            channel_id = video_data.get("channel_id")
+            if channel_id not in self.channels:
+                continue
+            self._record_channel_metric(channel_id, "videos", 1, _day_ordinal(video_data.get("published_at", "")))
+            self._record_channel_metric(channel_id, "views", video_data.get("views", 0), None)
+            self._record_channel_metric(channel_id, "likes", video_data.get("likes", 0), None)
+        for comment_data in self.comments.values():
+            day = _day_ordinal(comment_data["published_at"])
+            channel_id = self.videos[comment_data["video_id"]].get("channel_id")
+            if channel_id in self.channels:
+                self._record_channel_metric(channel_id, "comments", 1, day)
+            self._record_user_metric(comment_data["author_id"], "comments_made", 1, day)
+        for user_id, user_data in self.users.items():
+            self._record_user_metric(user_id, "likes_given", len(user_data.get("liked_videos", [])), None)
+            self._record_user_metric(user_id, "subscriptions", len(user_data.get("subscriptions", [])), None)
+
+    def _record_metric(self, totals: Dict[str, Dict[str, int]], daily: Dict[str, Dict[str, _DailySeries]],
+                       key: str, metric: str, amount: int, day: Optional[int]) -> None:
+        """
+        Helper method to add an amount to one lifetime counter and, when the day is known, its daily bucket.
+        """
+        key_totals = totals.setdefault(key, {})
+        key_totals[metric] = key_totals.get(metric, 0) + amount
+        if day is not None:
+            key_daily = daily.setdefault(key, {})
+            if metric not in key_daily:
+                key_daily[metric] = _DailySeries()
+            key_daily[metric].add(day, amount)
+
+    def _record_channel_metric(self, channel_id: str, metric: str, amount: int, day: Optional[int]) -> None:
+        """
+        Helper method to record a change in a channel metric and credit it to the channel owner.
+        
+        Args:
+            channel_id (str): The UUID of the channel.
+            metric (str): One of the channel metrics ("views", "likes", "comments", "subscribers", "videos").
+            amount (int): The change to apply, negative for removals.
+            day (Optional[int]): Day ordinal of the event, or None for undated changes that only
+                affect lifetime totals.
+        """
+        self._record_metric(self._channel_totals, self._channel_daily, channel_id, metric, amount, day)
+        owner_id = self.channels.get(channel_id, {}).get("owner_id")
+        if owner_id:
+            self._record_metric(self._user_totals, self._user_daily, owner_id, metric, amount, day)
+
+    def _record_user_metric(self, user_id: str, metric: str, amount: int, day: Optional[int]) -> None:
+        """
+        Helper method to record a change in one of a user's own activity metrics.
+        
+        Args:
+            user_id (str): The UUID of the user.
+            metric (str): One of "likes_given", "comments_made" or "subscriptions".
+            amount (int): The change to apply, negative for removals.
+            day (Optional[int]): Day ordinal of the event, or None for undated changes.
+        """
+        self._record_metric(self._user_totals, self._user_daily, user_id, metric, amount, day)
+
+    @staticmethod
+    def _summarize_metrics(totals: Dict[str, int], daily: Dict[str, _DailySeries], metrics: Tuple[str, ...],
+                           start_date: Optional[str], end_date: Optional[str]) -> Dict[str, Any]:
+        """
+        Helper method to report lifetime totals and date-window sums for a set of metrics.
+        
+        Raises:
+            Exception: If start_date or end_date is not a valid YYYY-MM-DD date, or start_date is after end_date.
+        """
+        try:
+            start_day = date.fromisoformat(start_date).toordinal() if start_date else None
+            end_day = date.fromisoformat(end_date).toordinal() if end_date else None
+        except ValueError:
+            raise Exception("Invalid date format. Use YYYY-MM-DD")
+        if start_day is not None and end_day is not None and start_day > end_day:
+            raise Exception("start_date must not be after end_date")
+        if start_day is None:
+            start_day = min((series.first_day for series in daily.values()), default=None)
+        if end_day is None:
+            end_day = max((series.last_day() for series in daily.values()), default=None)
+        window = {
+            metric: daily[metric].total(start_day, end_day)
+            if metric in daily and start_day is not None and end_day is not None else 0
+            for metric in metrics
+        }
+        return {
+            "totals": {metric: totals.get(metric, 0) for metric in metrics},
+            "period": {
+                "start_date": date.fromordinal(start_day).isoformat() if start_day is not None else None,
+                "end_date": date.fromordinal(end_day).isoformat() if end_day is not None else None,
+                **window
+            }
+        }
+
+    def _index_caption_track(self, caption_id: str, channel_id: str, video_id: str, language: str, track_content: str) -> None:
+        """
+        Helper method to parse a caption track into timed cues and add it to the caption indexes.
+        
+        Cue texts are pooled so identical lines (e.g. "[Music]") share one string across all tracks.
+        Each track keeps its own word -> cue positions map, and the global word index points at the
+        tracks containing each word.
+        """
+        cues = []
+        word_cues: Dict[str, List[int]] = {}
+        for position, (start_ms, end_ms, text) in enumerate(_parse_caption_cues(track_content)):
+            pooled = self._cue_text_pool.get(text)
+            if pooled is None:
+                pooled = self._cue_text_pool[text] = [text, 0]
+            pooled[1] += 1
+            cues.append((start_ms, end_ms, pooled[0]))
+            for word in set(_TOKEN_PATTERN.findall(text.lower())):
+                word_cues.setdefault(word, []).append(position)
+        self._caption_tracks[caption_id] = {
+            "channel_id": channel_id,
+            "video_id": video_id,
+            "language": language,
+            "cues": cues,
+            "word_cues": word_cues,
+        }
+        self._video_captions.setdefault(video_id, set()).add(caption_id)
+        for word in word_cues:
+            self._caption_word_index.setdefault(word, set()).add(caption_id)
+
+    def _unindex_caption_track(self, caption_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Helper method to remove a caption track from the caption indexes and release its pooled cue texts.
+        
+        Returns:
+            Optional[Dict[str, Any]]: The removed track, or None if the caption was not indexed.
+        """
+        track = self._caption_tracks.pop(caption_id, None)
+        if track is None:
+            return None
+        for _, _, text in track["cues"]:
+            pooled = self._cue_text_pool[text]
+            pooled[1] -= 1
+            if not pooled[1]:
+                del self._cue_text_pool[text]
+        video_captions = self._video_captions.get(track["video_id"])
+        if video_captions is not None:
+            video_captions.discard(caption_id)
+            if not video_captions:
+                del self._video_captions[track["video_id"]]
+        for word in track["word_cues"]:
+            postings = self._caption_word_index.get(word)
+            if postings is not None:
+                postings.discard(caption_id)
+                if not postings:
+                    del self._caption_word_index[word]
+        return track
+
+    def _get_channel_title(self, channel_id: Optional[str]) -> str:
+        """
+        Helper method to return a channel's title, or an empty string if the channel is unknown.
+        """
+        channel_data = self.channels.get(channel_id) if channel_id else None
+        return channel_data.get("title", "") if channel_data else ""
+
     def _get_playlist_data(self, playlist_id: str) -> Optional[Dict[str, Any]]:
         """
         Helper method to retrieve a playlist's complete data dictionary based on its UUID.
@@ -388,8 +910,7 @@ class YouTubeApis:
         """
         Helper method to search for and retrieve a user's UUID by their email address.
         
-        This method iterates through all users in the backend and performs a case-sensitive
-        match on the email field.
+        This method performs a case-sensitive lookup in the email index.
         
         Args:
             email (str): The email address to search for. Must match exactly (case-sensitive).
@@ -398,17 +919,13 @@ class YouTubeApis:
             Optional[str]: The UUID of the first user found with the matching email address,
                 or None if no user with that email exists in the backend.
         """
-        for user_id, user_data in self.users.items():
-            if user_data.get("email") == email:
-                return user_id
-        return None
+        return next(iter(self._users_by_email.get(email, ())), None)
 
     def _find_user_by_display_name(self, display_name: str) -> Optional[str]:
         """
         Helper method to search for and retrieve a user's UUID by their display name.
         
-        This method iterates through all users in the backend and performs a case-sensitive
-        match on the display_name field.
+        This method performs a case-sensitive lookup in the display name index.
         
         Args:
             display_name (str): The display name to search for. Must match exactly (case-sensitive).
@@ -417,10 +934,7 @@ class YouTubeApis:
             Optional[str]: The UUID of the first user found with the matching display name,
                 or None if no user with that display name exists in the backend.
         """
-        for user_id, user_data in self.users.items():
-            if user_data.get("display_name") == display_name:
-                return user_id
-        return None
+        return next(iter(self._users_by_display_name.get(display_name, ())), None)
 
     def _get_user_id_from_identifier(self, identifier: str) -> Optional[str]:
         """
@@ -602,11 +1116,11 @@ class YouTubeApis:
         if not user_data:
             raise Exception("User data not found")
         
-        subscribed_channel_ids = user_data.get("subscriptions", [])
+        subscribed_channel_ids = user_data.get("subscriptions", {})
         
         # Simple pagination (offset-based)
         offset = int(pageToken) if pageToken else 0
-        paginated_ids = subscribed_channel_ids[offset:offset + maxResults]
+        paginated_ids = islice(subscribed_channel_ids, offset, offset + maxResults)
         
         items = []
         for channel_uuid in paginated_ids:
@@ -700,12 +1214,14 @@ class YouTubeApis:
         if not channel_data:
             raise Exception("Channel not found")
         
-        if channel_id in user_data.get("subscriptions", []):
+        today = _day_ordinal()
+        if not self._add_to_ordered_set(user_data.setdefault("subscriptions", {}), channel_id, today):
             raise Exception("Already subscribed to this channel")
         
-        user_data["subscriptions"].append(channel_id)
-        channel_data["subscribers"].append(self.current_user_id)
+        self._add_to_ordered_set(channel_data.setdefault("subscribers", {}), self.current_user_id, today)
         channel_data["subscriber_count"] = channel_data.get("subscriber_count", 0) + 1
+        self._record_channel_metric(channel_id, "subscribers", 1, today)
+        self._record_user_metric(self.current_user_id, "subscriptions", 1, today)
         
         return {
             "kind": "youtube#subscription",
@@ -766,13 +1282,16 @@ class YouTubeApis:
         if not channel_data:
             raise Exception("Channel not found")
         
-        if channel_id not in user_data.get("subscriptions", []):
+        subscriptions = user_data.get("subscriptions", {})
+        # The subscription leaves the day it was made on; scenario subscriptions have no day
+        subscribed_day = subscriptions.get(channel_id)
+        if not self._remove_from_ordered_set(subscriptions, channel_id):
             raise Exception("Not subscribed to this channel")
         
-        user_data["subscriptions"].remove(channel_id)
-        if self.current_user_id in channel_data.get("subscribers", []):
-            channel_data["subscribers"].remove(self.current_user_id)
+        self._remove_from_ordered_set(channel_data.get("subscribers", {}), self.current_user_id)
         channel_data["subscriber_count"] = max(0, channel_data.get("subscriber_count", 0) - 1)
+        self._record_channel_metric(channel_id, "subscribers", -1, subscribed_day)
+        self._record_user_metric(self.current_user_id, "subscriptions", -1, subscribed_day)
         
         print(f"Unsubscribed from channel {channel_id}")
 
@@ -980,7 +1499,7 @@ class YouTubeApis:
             "description": description,
             "owner_id": self.current_user_id,
             "created_at": created_at,
-            "subscribers": [],
+            "subscribers": {},
             "videos": [],
             "playlists": [],
             "country": "US",
@@ -1247,6 +1766,8 @@ class YouTubeApis:
         
         # Increment view count for realism
         video_data["views"] = video_data.get("views", 0) + 1
+        if video_data.get("channel_id") in self.channels:
+            self._record_channel_metric(video_data["channel_id"], "views", 1, _day_ordinal())
         
         return {
             "kind": "youtube#video",
@@ -1370,9 +1891,11 @@ class YouTubeApis:
             "dislikes": 0,
             "comments": {},
             "tags": tags if tags is not None else [],
-            "liked_by": []
+            "liked_by": {}
         }
         self.videos[video_uuid] = new_video
+        self._index_video(video_uuid)
+        self._record_channel_metric(channel_id, "videos", 1, _day_ordinal())
         channel_data["videos"].append(video_uuid)
         channel_data["video_count"] = channel_data.get("video_count", 0) + 1
         
@@ -1456,6 +1979,23 @@ class YouTubeApis:
             raise Exception("Only the video owner can delete this video")
 
         if video_id in self.videos:
+            self._unindex_video(video_id)
+            # The video's lifetime views, likes and comments leave the channel totals, each from
+            # the day it was recorded on when that day is known
+            self._record_channel_metric(channel_id, "videos", -1, _day_ordinal(video_data.get("published_at", "")))
+            self._record_channel_metric(channel_id, "views", -video_data.get("views", 0), None)
+            liked_by = video_data.get("liked_by", {})
+            dated_likes = [day for day in liked_by.values() if day is not None]
+            for day in dated_likes:
+                self._record_channel_metric(channel_id, "likes", -1, day)
+            self._record_channel_metric(channel_id, "likes", -(video_data.get("likes", 0) - len(dated_likes)), None)
+            for caption_id in list(self._video_captions.get(video_id, ())):
+                track = self._unindex_caption_track(caption_id)
+                self.channels.get(track["channel_id"], {}).get("captions", {}).pop(caption_id, None)
+            for _, comment_id in self._video_comments.pop(video_id, []):
+                comment_data = self.comments.pop(comment_id, None)
+                if comment_data is not None:
+                    self._record_comment_change(video_data, comment_data, -1)
             del self.videos[video_id]
             
             # Remove from channel's video list
@@ -1463,12 +2003,15 @@ class YouTubeApis:
                 channel_data["videos"].remove(video_id)
                 channel_data["video_count"] = max(0, channel_data.get("video_count", 0) - 1)
             
-            # Remove from any user's watch history or liked videos
+            # Remove from any user's watch history, and from the liked videos of users who liked it
             for u_data in self.users.values():
                 if video_id in u_data.get("watch_history", []):
                     u_data["watch_history"].remove(video_id)
-                if video_id in u_data.get("liked_videos", []):
-                    u_data["liked_videos"].remove(video_id)
+            for liker_id, liked_day in liked_by.items():
+                liker_data = self.users.get(liker_id)
+                if liker_data is not None:
+                    self._record_user_metric(liker_id, "likes_given", -1, liked_day)
+                    self._remove_from_ordered_set(liker_data.get("liked_videos", {}), video_id)
             
             # Remove from any playlists
             for p_data in self.playlists.values():
@@ -1539,26 +2082,46 @@ class YouTubeApis:
         if not user_data:
             raise Exception("User data not found")
 
-        liked_by_list = video_data.get("liked_by", [])
+        liked_by = video_data.setdefault("liked_by", {})
+        liked_videos = user_data.setdefault("liked_videos", {})
         
         if rating == "like":
-            if self.current_user_id not in liked_by_list:
+            today = _day_ordinal()
+            if self._add_to_ordered_set(liked_by, self.current_user_id, today):
                 video_data["likes"] = video_data.get("likes", 0) + 1
-                liked_by_list.append(self.current_user_id)
-                if video_id not in user_data.get("liked_videos", []):
-                    user_data.setdefault("liked_videos", []).append(video_id)
+                self._add_to_ordered_set(liked_videos, video_id, today)
+                self._record_rating_change(video_data, 1, today)
                 print(f"Video {video_id} liked by user {self.current_user_id}")
         elif rating == "none":
-            # Remove like
-            if self.current_user_id in liked_by_list:
+            # Remove like, from the day it was given on
+            liked_day = liked_by.get(self.current_user_id)
+            if self._remove_from_ordered_set(liked_by, self.current_user_id):
                 video_data["likes"] = max(0, video_data.get("likes", 0) - 1)
-                liked_by_list.remove(self.current_user_id)
-                if video_id in user_data.get("liked_videos", []):
-                    user_data.setdefault("liked_videos", []).remove(video_id)
+                self._remove_from_ordered_set(liked_videos, video_id)
+                self._record_rating_change(video_data, -1, liked_day)
                 print(f"Like removed from video {video_id}")
         else:
             raise Exception("Invalid rating. Must be 'like' or 'none'")
 
+    def _record_rating_change(self, video_data: Dict[str, Any], amount: int, day: Optional[int]) -> None:
+        """
+        Helper method to record a like (1) or like removal (-1) by the authenticated user in the analytics.
+        
+        A removal passes the day the like was given (None for scenario likes), so it leaves that day's bucket.
+        """
+        if video_data.get("channel_id") in self.channels:
+            self._record_channel_metric(video_data["channel_id"], "likes", amount, day)
+        self._record_user_metric(self.current_user_id, "likes_given", amount, day)
+
+    def _record_comment_change(self, video_data: Dict[str, Any], comment_data: Dict[str, Any], amount: int) -> None:
+        """
+        Helper method to record a comment being added (1) or removed (-1) on the comment's own publish day.
+        """
+        day = _day_ordinal(comment_data.get("published_at", ""))
+        if video_data.get("channel_id") in self.channels:
+            self._record_channel_metric(video_data["channel_id"], "comments", amount, day)
+        self._record_user_metric(comment_data["author_id"], "comments_made", amount, day)
+
     def search_videos(self, query: str, maxResults: int = 10, pageToken: Optional[str] = None) -> Dict[str, Any]:
         """
         Search for videos based on a query string. This is a public endpoint requiring no authentication.
@@ -1618,7 +2181,8 @@ class YouTubeApis:
         Note:
             - This method does NOT require authentication
             - Results are sorted by view count (most viewed first)
-            - Search is case-insensitive and uses substring matching
+            - Search is case-insensitive and uses substring matching, served from a substring index
+              over titles, descriptions and tags
         
         Example:
             >>> api = YouTubeApis()
@@ -1629,17 +2193,7 @@ class YouTubeApis:
         if not query or not query.strip():
             raise Exception("Query parameter is required")
         
-        query_lower = query.lower()
-        matching_videos = []
-        
-        for video_uuid, video_data in self.videos.items():
-            if query_lower in video_data.get("title", "").lower() or \
-               query_lower in video_data.get("description", "").lower() or \
-               any(query_lower in tag.lower() for tag in video_data.get("tags", [])):
-                matching_videos.append((video_uuid, video_data))
-        
-        # Sort by views (most popular first)
-        matching_videos.sort(key=lambda x: x[1].get("views", 0), reverse=True)
+        matching_ids = self._video_search_index.search(query)
         
         # Pagination
         offset = 0
@@ -1649,11 +2203,15 @@ class YouTubeApis:
             except:
                 offset = 0
         
-        total_results = len(matching_videos)
-        paginated_videos = matching_videos[offset:offset + maxResults]
+        # Most viewed offset + maxResults matches (most popular first); only the page is built
+        total_results = len(matching_ids)
+        paginated_ids = heapq.nlargest(
+            offset + maxResults, matching_ids, key=lambda video_id: self.videos[video_id].get("views", 0)
+        )[offset:]
         
         items = []
-        for video_id, video_data in paginated_videos:
+        for video_id in paginated_ids:
+            video_data = self.videos[video_id]
             items.append({
                 "kind": "youtube#searchResult",
                 "etag": f"etag_{video_id}",
@@ -1666,7 +2224,7 @@ class YouTubeApis:
                     "channelId": video_data.get("channel_id"),
                     "title": video_data.get("title"),
                     "description": video_data.get("description"),
-                    "channelTitle": self._get_channel_data(video_data.get("channel_id", "")).get("title", "") if video_data.get("channel_id") else ""
+                    "channelTitle": self._get_channel_title(video_data.get("channel_id"))
                 }
             })
         
@@ -2344,18 +2902,31 @@ class YouTubeApis:
         if not isinstance(self.videos[video_id]["comments"], dict):
             self.videos[video_id]["comments"] = {}
         
-        # Add comment
+        # Add comment, replacing any earlier comment by the same user
         comment_id = self._generate_unique_id()
         published_at = datetime.now(timezone.utc).isoformat()
-        
-        self.videos[video_id]["comments"][self.current_user_id] = {
+        previous_comment = self.videos[video_id]["comments"].get(self.current_user_id)
+        replaced = None
+        if isinstance(previous_comment, dict):
+            replaced = self._get_comment_data(previous_comment.get("id"))
+            if replaced is not None:
+                # The replaced comment leaves its own day; the new one is counted today
+                self._record_comment_change(video_data, replaced, -1)
+            self._discard_comment(previous_comment.get("id"))
+        
+        comment_info = {
             "id": comment_id,
             "text": text,
             "published_at": published_at
         }
+        self.videos[video_id]["comments"][self.current_user_id] = comment_info
+        self._store_comment(video_id, self.current_user_id, comment_info)
         
         # Increment comment count
-        self.videos[video_id]["comments_count"] = self.videos[video_id].get("comments_count", 0) + 1
+        if previous_comment is None:
+            self.videos[video_id]["comments_count"] = self.videos[video_id].get("comments_count", 0) + 1
+        if previous_comment is None or replaced is not None:
+            self._record_comment_change(video_data, self.comments[comment_id], 1)
         
         print(f"Comment added on video {video_id} by {user_data['display_name']}: {text}")
         
@@ -2376,7 +2947,7 @@ class YouTubeApis:
             }
         }
 
-    def list_comments_for_video(self, video_id: str, maxResults: int = 20, pageToken: Optional[str] = None) -> Dict[str, Any]:
+    def list_comments_for_video(self, video_id: str, maxResults: int = 20, pageToken: Optional[str] = None, order: str = "time") -> Dict[str, Any]:
         """
         List all comments for a video with pagination. This is a public endpoint requiring no authentication.
         
@@ -2394,6 +2965,9 @@ class YouTubeApis:
                 returns the first page. The token format is "offset_{number}" where {number} is the
                 offset in the comments list. Use the "nextPageToken" from a previous response to get
                 subsequent pages. Defaults to None.
+            order (str, optional): Sort order of the comment threads. "time" returns the newest
+                comments first; "relevance" returns the most liked comments first, newest first among
+                equal like counts. Defaults to "time".
 
         Returns:
             Dict[str, Any]: A dictionary containing comment threads in YouTube API v3 format:
@@ -2439,69 +3013,41 @@ class YouTubeApis:
 
         Raises:
             Exception: If the specified video_id does not exist in the backend
+            Exception: If order is not "time" or "relevance"
         
         Note:
             - This method does NOT require authentication
             - Comments are stored per user (one comment per user per video in this simulation)
+            - Comment IDs are stable, so page tokens stay valid between calls
+            - Only the comments on the requested page are formatted
             - The "Unknown" author is used if the commenting user data is not found
         """
         video_data = self._get_video_data(video_id)
         if not video_data:
             raise Exception("Video not found")
+        if order not in ("time", "relevance"):
+            raise Exception("order must be 'time' or 'relevance'")
 
-        comments_data = video_data.get("comments", {})
-        comment_items = []
-        
-        if isinstance(comments_data, dict):
-            for author_id, comment_info in comments_data.items():
-                author_info = self._get_user_data(author_id)
-                
-                # Handle both old simple dict and new structured format
-                if isinstance(comment_info, dict):
-                    comment_id = comment_info.get("id", self._generate_unique_id())
-                    text = comment_info.get("text", "")
-                    published_at = comment_info.get("published_at", datetime.now(timezone.utc).isoformat())
-                else:
-                    comment_id = self._generate_unique_id()
-                    text = str(comment_info)
-                    published_at = datetime.now(timezone.utc).isoformat()
-                
-                comment_items.append({
-                    "kind": "youtube#commentThread",
-                    "etag": f"etag_{comment_id}",
-                    "id": comment_id,
-                    "snippet": {
-                        "videoId": video_id,
-                        "topLevelComment": {
-                            "kind": "youtube#comment",
-                            "etag": f"etag_{comment_id}",
-                            "id": comment_id,
-                            "snippet": {
-                                "authorDisplayName": author_info.get("display_name", "Unknown") if author_info else "Unknown",
-                                "authorChannelId": author_info.get("channels", [""])[0] if author_info and author_info.get("channels") else "",
-                                "videoId": video_id,
-                                "textDisplay": text,
-                                "textOriginal": text,
-                                "canRate": True,
-                                "likeCount": 0,
-                                "publishedAt": published_at,
-                                "updatedAt": published_at
-                            }
-                        },
-                        "canReply": True,
-                        "totalReplyCount": 0,
-                        "isPublic": True
-                    }
-                })
         # Pagination
         offset = 0
         if pageToken:
             try:
                 offset = int(pageToken.split("_")[1])
             except:
-                offset = 0       
-        total_results = len(comment_items)
-        paginated_comments = comment_items[offset:offset + maxResults]
+                offset = 0
+        
+        entries = self._video_comments.get(video_id, [])
+        total_results = len(entries)
+        if order == "time":
+            # Entries are oldest first; slice the page from the end and reverse only that
+            end = max(total_results - offset, 0)
+            page_entries = entries[max(end - maxResults, 0):end][::-1]
+        else:
+            page_entries = heapq.nlargest(
+                offset + maxResults, entries,
+                key=lambda entry: (self.comments[entry[1]].get("likes", 0), entry)
+            )[offset:]
+        paginated_comments = [self._build_comment_thread(self.comments[comment_id]) for _, comment_id in page_entries]
         
         response = {
             "kind": "youtube#commentThreadListResponse",
@@ -2522,8 +3068,7 @@ class YouTubeApis:
         """
         Delete a comment from a video. Only the comment author can delete it.
         
-        This method removes a comment from a video by searching through all videos to find the comment
-        with the specified ID. The comment must have been posted by the currently authenticated user.
+        This method removes the comment with the specified ID from its video. The comment must have been posted by the currently authenticated user.
         The video's comment count is decremented. Only the author of a comment can delete it, ensuring
         users can't delete others' comments.
 
@@ -2544,9 +3089,7 @@ class YouTubeApis:
             - Decrements the video's "comments_count" by 1 (minimum 0)
         
         Note:
-            This method searches through all videos to find the comment, which may be less efficient
-            for large numbers of videos. The search stops after finding and deleting the first matching
-            comment.
+            The comment is looked up directly in the comment store by its ID.
         
         Example:
             >>> api = YouTubeApis()
@@ -2557,32 +3100,26 @@ class YouTubeApis:
         """
         self._ensure_authenticated()
         
-        # Find comment across all videos
-        comment_found = False
-        for video_id, video_data in self.videos.items():
-            comments = video_data.get("comments", {})
-            if isinstance(comments, dict):
-                # Check if current user has a comment
-                if self.current_user_id in comments:
-                    comment_info = comments[self.current_user_id]
-                    # Check if this is the comment to delete
-                    if isinstance(comment_info, dict) and comment_info.get("id") == comment_id:
-                        del comments[self.current_user_id]
-                        self.videos[video_id]["comments_count"] = max(0, self.videos[video_id].get("comments_count", 1) - 1)
-                        comment_found = True
-                        break
-        
-        if not comment_found:
+        comment_data = self._get_comment_data(comment_id)
+        if not comment_data or comment_data["author_id"] != self.current_user_id:
             raise Exception("Comment not found or you are not the author")
+        
+        video_id = comment_data["video_id"]
+        video_data = self.videos.get(video_id)
+        if video_data is not None:
+            video_data.get("comments", {}).pop(self.current_user_id, None)
+            video_data["comments_count"] = max(0, video_data.get("comments_count", 1) - 1)
+            self._record_comment_change(video_data, comment_data, -1)
+        self._discard_comment(comment_id)
 
     def youtube_captions_insert(self, video_id: str, language: str, track_content: str) -> Dict[str, Any]:
         """
-        Upload a caption/subtitle track for a video. Simulates adding captions without storing actual files.
+        Upload a caption/subtitle track for a video.
         
         This method simulates the YouTube captions API by storing caption metadata (language, status, and
-        a snippet of the content) in the channel's captions dictionary. In a real implementation, this would
-        upload and process SRT, VTT, or other caption file formats. The caption is stored in the channel that
-        owns the video, not directly with the video.
+        a snippet of the content) in the channel's captions dictionary. The full track is parsed into timed
+        cues (SRT and WebVTT timings are recognized) and indexed so it can be searched with search_captions.
+        The caption metadata is stored in the channel that owns the video, not directly with the video.
 
         Args:
             video_id (str): The UUID of the video to add captions to. Must be a valid video ID that exists
@@ -2593,7 +3130,8 @@ class YouTubeApis:
             track_content (str): The full content of the caption track as a string. In real usage, this would
                 be SRT format (with timestamps) or similar. For example:
                 "1\n00:00:00,000 --> 00:00:02,000\nHello World\n\n2\n00:00:02,000 --> 00:00:05,000\nWelcome to the video"
-                Only the first 50 characters are stored (plus "...") as a content snippet.
+                The first 50 characters (plus "...") are kept as a content snippet; content without timing
+                lines is stored as a single cue at 00:00:00.000.
 
         Returns:
             Dict[str, Any]: A dictionary indicating the result of the caption upload:
@@ -2612,10 +3150,11 @@ class YouTubeApis:
 
         Side Effects:
             - Creates a new caption entry in the channel's "captions" dictionary (if video found)
-            - The caption entry includes: id, video_id, language, status="serving", content_snippet
+            - The caption entry includes: id, video_id, language, status="serving", content_snippet,
+              track_content (the full text, so reloading the state restores every cue), cue_count
+            - Adds the track's cues to the caption search index
         
         Note:
-            - This is a simulation and doesn't actually process or store full caption files
             - Returns failure if video not found or if the video's channel is not found
             - Does not require authentication in this simulation (though real YouTube API would)
         
@@ -2635,12 +3174,15 @@ class YouTubeApis:
         if channel_id and channel_id in self.channels:
             if "captions" not in self.channels[channel_id]:
                 self.channels[channel_id]["captions"] = {}
+            self._index_caption_track(caption_id, channel_id, video_id, language, track_content)
             self.channels[channel_id]["captions"][caption_id] = {
                 "id": caption_id,
                 "video_id": video_id,
                 "language": language,
                 "status": "serving",
-                "content_snippet": track_content[:50] + "..." if len(track_content) > 50 else track_content
+                "content_snippet": track_content[:50] + "..." if len(track_content) > 50 else track_content,
+                "track_content": track_content,
+                "cue_count": len(self._caption_tracks[caption_id]["cues"])
             }
             return {"status": True, "caption_id": caption_id, "language": language}
         return {"message": "Channel for video not found.", "status": False}
@@ -2649,17 +3191,15 @@ class YouTubeApis:
         """
         Update an existing caption track with new content. Simulates updating captions by caption ID.
         
-        This method searches through all channels' caption dictionaries to find and update a caption
-        with the specified ID. Only the content snippet (first 50 characters) is updated to simulate
-        caption content modification. In a real implementation, this would replace the entire caption
-        file with new timing and text.
+        This method looks up the caption by ID and replaces its cues with the parsed new content. The
+        track's old cues are removed from the caption search index and the new ones added.
 
         Args:
             id (str): The UUID of the caption track to update. Must be a valid caption ID that exists
                 in some channel's captions dictionary.
-            track_content (str): The new content for the caption track. In real usage, this would be
-                the complete SRT or VTT formatted caption file content. Only the first 50 characters
-                (plus "...") are stored as a content snippet in this simulation.
+            track_content (str): The new content for the caption track, usually the complete SRT or VTT
+                formatted caption file content. The first 50 characters (plus "...") are kept as a
+                content snippet.
 
         Returns:
             Dict[str, Any]: A dictionary indicating the result of the update operation:
@@ -2677,10 +3217,10 @@ class YouTubeApis:
                 }
 
         Side Effects:
-            - Updates the "content_snippet" field of the caption entry (if found)
+            - Updates the "content_snippet", "track_content" and "cue_count" fields of the caption entry (if found)
+            - Re-indexes the track's cues for search_captions
         
         Note:
-            - Searches through all channels to find the caption
             - Does not modify language or other caption metadata, only content
             - Does not require authentication in this simulation
         
@@ -2691,18 +3231,23 @@ class YouTubeApis:
             >>> print(result["message"])
             'Caption updated.'
         """
-        for _, channel_data in self.channels.items():
-            if "captions" in channel_data and id in channel_data["captions"]:
-                channel_data["captions"][id]["content_snippet"] = track_content[:50] + "..." if len(track_content) > 50 else track_content
-                return {"status": True, "caption_id": id, "message": "Caption updated."}
-        return {"message": "Caption track not found.", "status": False}
+        track = self._unindex_caption_track(id)
+        if track is None:
+            return {"message": "Caption track not found.", "status": False}
+        
+        self._index_caption_track(id, track["channel_id"], track["video_id"], track["language"], track_content)
+        caption_data = self.channels[track["channel_id"]]["captions"][id]
+        caption_data["content_snippet"] = track_content[:50] + "..." if len(track_content) > 50 else track_content
+        caption_data["track_content"] = track_content
+        caption_data["cue_count"] = len(self._caption_tracks[id]["cues"])
+        return {"status": True, "caption_id": id, "message": "Caption updated."}
 
     def youtube_captions_delete(self, id: str) -> Dict[str, Any]:
         """
         Delete a caption track from a video permanently.
         
-        This method searches through all channels' caption dictionaries to find and remove a caption
-        with the specified ID. Once deleted, the caption is permanently removed and cannot be recovered.
+        This method looks up the caption by ID, removes it from its channel's caption dictionary and
+        drops its cues from the caption search index. Once deleted, the caption is permanently removed and cannot be recovered.
         In a real implementation, this would delete the caption file from YouTube's storage.
 
         Args:
@@ -2725,9 +3270,9 @@ class YouTubeApis:
 
         Side Effects:
             - Removes the caption entry from the channel's "captions" dictionary (if found)
+            - Removes the track's cues from the caption search index
         
         Note:
-            - Searches through all channels to find the caption
             - Deletion is permanent and cannot be undone
             - Does not require authentication in this simulation (though real YouTube API would)
         
@@ -2737,11 +3282,106 @@ class YouTubeApis:
             >>> if result["status"]:
             ...     print(f"Deleted: {result['deleted_caption_id']}")
         """
-        for channel_id, channel_data in self.channels.items():
-            if "captions" in channel_data and id in channel_data["captions"]:
-                del self.channels[channel_id]["captions"][id]
-                return {"status": True, "deleted_caption_id": id}
-        return {"message": "Caption track not found.", "status": False}
+        track = self._unindex_caption_track(id)
+        if track is None:
+            return {"message": "Caption track not found.", "status": False}
+        
+        self.channels[track["channel_id"]]["captions"].pop(id, None)
+        return {"status": True, "deleted_caption_id": id}
+
+    def search_captions(self, query: str, video_id: Optional[str] = None, language: Optional[str] = None, maxResults: int = 20) -> Dict[str, Any]:
+        """
+        Find the moments in videos where the captions mention a word or phrase.
+        
+        Every word of the query must appear as a whole word in the same cue, and multi-word queries
+        must also appear as a phrase in the cue text (case-insensitive). Candidate tracks come from the
+        global caption word index (or the video's own tracks), and candidate cues from each track's
+        word -> cue positions map, so only cues containing the rarest query word are inspected.
+
+        Args:
+            query (str): The word or phrase to look for, e.g. "neural networks".
+            video_id (Optional[str], optional): Restrict the search to one video's caption tracks.
+                Defaults to None (all videos).
+            language (Optional[str], optional): Restrict the search to tracks in this language code.
+                Defaults to None (all languages).
+            maxResults (int, optional): Maximum number of matches to return. Defaults to 20.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the matching cues:
+                Success case:
+                {
+                    "status": True,
+                    "total_matches": int,           # Number of matching cues before maxResults
+                    "matches": [                    # Ordered by video, track, then start time
+                        {
+                            "caption_id": str,
+                            "video_id": str,
+                            "language": str,
+                            "start": str,           # Cue start as HH:MM:SS.mmm
+                            "end": str,             # Cue end as HH:MM:SS.mmm
+                            "start_ms": int,
+                            "end_ms": int,
+                            "text": str             # The full cue text
+                        },
+                        # ... more matches
+                    ]
+                }
+                
+                Failure cases:
+                {
+                    "message": str,                 # "Query parameter is required." or "Video not found."
+                    "status": False
+                }
+        
+        Note:
+            - Does not require authentication
+            - Matching is on whole words: "net" does not match a cue that only says "network"
+        
+        Example:
+            >>> api = YouTubeApis()
+            >>> api.youtube_captions_insert("video-uuid", "en", "1\n00:01:02,000 --> 00:01:05,000\nNeural networks explained")
+            >>> result = api.search_captions("neural networks", video_id="video-uuid")
+            >>> print(result["matches"][0]["start"])
+            '00:01:02.000'
+        """
+        words = _TOKEN_PATTERN.findall(query.lower()) if query else []
+        if not words:
+            return {"message": "Query parameter is required.", "status": False}
+        if video_id is not None and video_id not in self.videos:
+            return {"message": "Video not found.", "status": False}
+        
+        phrase = " ".join(query.lower().split())
+        query_words = set(words)
+        candidate_ids = set(self._video_captions.get(video_id, ())) if video_id is not None else None
+        for word in words:
+            postings = self._caption_word_index.get(word, set())
+            candidate_ids = set(postings) if candidate_ids is None else candidate_ids & postings
+            if not candidate_ids:
+                break
+        
+        matches = []
+        for caption_id in sorted(candidate_ids, key=lambda cid: (self._caption_tracks[cid]["video_id"], cid)):
+            track = self._caption_tracks[caption_id]
+            if language is not None and track["language"] != language:
+                continue
+            rarest = min(words, key=lambda word: len(track["word_cues"][word]))
+            for position in track["word_cues"][rarest]:
+                start_ms, end_ms, text = track["cues"][position]
+                text_lower = text.lower()
+                if phrase not in text_lower or not query_words <= set(_TOKEN_PATTERN.findall(text_lower)):
+                    continue
+                matches.append({
+                    "caption_id": caption_id,
+                    "video_id": track["video_id"],
+                    "language": track["language"],
+                    "start": _format_cue_time(start_ms),
+                    "end": _format_cue_time(end_ms),
+                    "start_ms": start_ms,
+                    "end_ms": end_ms,
+                    "text": text
+                })
+        
+        return {"status": True, "total_matches": len(matches), "matches": matches[:maxResults]}
 
     def get_user_by_email(self, email: str) -> Dict[str, Any]:
         """
@@ -2794,7 +3434,7 @@ class YouTubeApis:
         """
         user_id = self._find_user_by_email(email)
         if user_id:
-            return {"data": copy.deepcopy(self.users[user_id])}
+            return {"data": self._with_member_lists(self.users[user_id])}
         return {"data": None, "message": "User not found"}
 
     def get_user_by_display_name(self, display_name: str) -> Dict[str, Any]:
@@ -2843,7 +3483,7 @@ class YouTubeApis:
         """
         user_id = self._find_user_by_display_name(display_name)
         if user_id:
-            return {"data": copy.deepcopy(self.users[user_id])}
+            return {"data": self._with_member_lists(self.users[user_id])}
         return {"data": None, "message": "User not found"}
 
     def get_watch_later_playlist(self, user_identifier: str) -> Dict[str, Any]:
@@ -2908,7 +3548,7 @@ class YouTubeApis:
         for video_id in user_data.get("watch_later_playlist", []):
             video_data = self._get_video_data(video_id)
             if video_data:
-                watch_later_videos.append(copy.deepcopy(video_data))
+                watch_later_videos.append(self._with_member_lists(video_data))
         
         return {"data": watch_later_videos}
 
@@ -3266,8 +3906,7 @@ class YouTubeApis:
         if not user_id:
             return {"status": False, "message": "User not found"}
         
-        user_data = self.users[user_id]
-        user_data["language_preference"] = language
+        self._update_user_data(user_id, "language_preference", language)
         
         return {"status": True, "message": "Language preference updated"}
 
@@ -3326,6 +3965,47 @@ class YouTubeApis:
         
         return {"data": {"account_status": status}}
 
+    def update_account_status(self, user_identifier: str, status: str) -> Dict[str, Any]:
+        """
+        Update the account status for a user.
+
+        Args:
+            user_identifier (str): The user identification, which can be:
+                - User UUID (e.g., "550e8400-e29b-41d4-a716-446655440000")
+                - Email address (e.g., "user@example.com")
+                - Display name (e.g., "John Doe")
+            status (str): The new account status (e.g., "active", "suspended", "restricted", "closed").
+
+        Returns:
+            Dict[str, Any]: A dictionary indicating success or failure:
+                Success case:
+                {
+                    "status": True,
+                    "message": "Account status updated"
+                }
+                
+                Failure case (user not found):
+                {
+                    "status": False,
+                    "message": "User not found"
+                }
+        
+        Note:
+            - Does not require authentication (utility method for managing any user's settings)
+            - Does not validate the status value
+        
+        Example:
+            >>> api = YouTubeApis()
+            >>> api.update_account_status("user@example.com", "suspended")
+        """
+        user_id = self._get_user_id_from_identifier(user_identifier)
+        if not user_id:
+            return {"status": False, "message": "User not found"}
+        
+        self._update_user_data(user_id, "account_status", status)
+        
+        return {"status": True, "message": "Account status updated"}
+
     def get_channel_history(self, user_identifier: str) -> Dict[str, Any]:
         """
         Retrieve a user's channel browsing/viewing history.
@@ -3479,7 +4159,7 @@ class YouTubeApis:
         
         return {"status": True, "message": "Channel added to history"}
 
-    def get_user_analytics(self, user_identifier: str) -> Dict[str, Any]:
+    def get_user_analytics(self, user_identifier: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieve comprehensive analytics and statistics about a user's YouTube activity.
         
@@ -3493,22 +4173,36 @@ class YouTubeApis:
                 - User UUID (e.g., "550e8400-e29b-41d4-a716-446655440000")
                 - Email address (e.g., "user@example.com")
                 - Display name (e.g., "John Doe")
+            start_date (Optional[str], optional): First day (YYYY-MM-DD) of the "period" window.
+                Defaults to the user's earliest dated activity.
+            end_date (Optional[str], optional): Last day (YYYY-MM-DD, inclusive) of the "period" window.
+                Defaults to the user's latest dated activity.
 
         Returns:
             Dict[str, Any]: A dictionary with a "data" key containing comprehensive analytics:
                 Success case:
                 {
                     "data": {
-                        "total_channels": int,          # Number of channels owned
+                        "user_id": str, "display_name": str, "email": str, "joined_date": str,
+                        "account_status": str, "language_preference": str,
+                        "total_videos_watched": int,    # Number of videos in watch history
+                        "total_subscriptions": int,     # Number of channels subscribed to
+                        "total_liked_videos": int,      # Number of videos liked
+                        "total_channels_owned": int,    # Number of channels owned
+                        "watch_later_count": int,       # Number of videos in Watch Later
+                        "notification_settings": Dict[str, bool],
                         "total_videos_uploaded": int,   # Total videos across all owned channels
                         "total_views": int,             # Combined views across all owned videos
-                        "total_subscribers": int,       # Combined subscribers across all channels
+                        "total_subscribers": int,       # Combined subscribers across all owned channels
                         "total_likes_received": int,    # Combined likes on all owned videos
-                        "subscriptions_count": int,     # Number of channels subscribed to
-                        "watch_history_count": int,     # Number of videos in watch history
-                        "liked_videos_count": int,      # Number of videos liked
-                        "watch_later_count": int,       # Number of videos in Watch Later
-                        "comments_made_count": int      # Number of comments posted
+                        "comments_received_count": int, # Comments on all owned videos
+                        "comments_made_count": int,     # Number of comments posted
+                        "period": {                     # Net changes within the date window
+                            "start_date": str or None,
+                            "end_date": str or None,
+                            "views": int, "likes": int, "comments": int, "subscribers": int, "videos": int,
+                            "likes_given": int, "comments_made": int, "subscriptions": int
+                        }
                     }
                 }
                 
@@ -3518,10 +4212,14 @@ class YouTubeApis:
                     "message": "User not found"
                 }
         
+        Raises:
+            Exception: If start_date or end_date is not a valid YYYY-MM-DD date, or start_date is after end_date
+        
         Note:
             - Does not require authentication
-            - Calculates statistics by iterating through user's channels and videos
-            - Counts are computed in real-time from current backend state
+            - Totals come from counters kept current by uploads, views, ratings, comments and subscriptions
+            - Window sums are answered from per-day prefix sums; scenario views, likes and subscriptions
+              carry no dates, so they appear in the totals but not in any window
             - Returns 0 for all counts if user has no activity
         
         Example:
@@ -3533,15 +4231,6 @@ class YouTubeApis:
             ...     print(f"Total views: {analytics['total_views']}")
             ...     print(f"Subscribers: {analytics['total_subscribers']}")
         """
-        """
-        Get comprehensive analytics for a user.
-
-        Args:
-            user_identifier (str): The user ID, email, or display name.
-
-        Returns:
-            Dict: A dictionary containing user analytics.
-        """
         user_id = self._get_user_id_from_identifier(user_identifier)
         if not user_id:
             return {"data": None, "message": "User not found"}
@@ -3570,31 +4259,143 @@ class YouTubeApis:
             "notification_settings": user_data.get("notification_settings", {})
         }
         
+        summary = self._summarize_metrics(
+            self._user_totals.get(user_id, {}), self._user_daily.get(user_id, {}),
+            _CHANNEL_METRICS + _USER_ACTIVITY_METRICS, start_date, end_date
+        )
+        totals = summary["totals"]
+        analytics.update({
+            "total_videos_uploaded": totals["videos"],
+            "total_views": totals["views"],
+            "total_subscribers": totals["subscribers"],
+            "total_likes_received": totals["likes"],
+            "comments_received_count": totals["comments"],
+            "comments_made_count": totals["comments_made"],
+            "period": summary["period"]
+        })
+        
         return {"data": analytics}
 
-    def search_users_by_language(self, language: str) -> Dict[str, Any]:
+    def get_channel_analytics(self, channel_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve lifetime and date-window statistics for a channel.
+        
+        Args:
+            channel_id (str): The UUID of the channel.
+            start_date (Optional[str], optional): First day (YYYY-MM-DD) of the "period" window.
+                Defaults to the channel's earliest dated activity.
+            end_date (Optional[str], optional): Last day (YYYY-MM-DD, inclusive) of the "period" window.
+                Defaults to the channel's latest dated activity.
+        
+        Returns:
+            Dict[str, Any]: A dictionary with a "data" key:
+                Success case:
+                {
+                    "data": {
+                        "channel_id": str,
+                        "title": str,
+                        "totals": {"views": int, "likes": int, "comments": int, "subscribers": int, "videos": int},
+                        "period": {
+                            "start_date": str or None,
+                            "end_date": str or None,
+                            "views": int, "likes": int, "comments": int, "subscribers": int, "videos": int
+                        }
+                    }
+                }
+                
+                Failure case (channel not found):
+                {
+                    "data": None,
+                    "message": "Channel not found"
+                }
+        
+        Raises:
+            Exception: If start_date or end_date is not a valid YYYY-MM-DD date, or start_date is after end_date
+        
+        Note:
+            - Does not require authentication
+            - Period values are net daily changes (unlikes, unsubscribes and deletions count negatively)
+              summed from per-day prefix sums
+            - Scenario views, likes and subscribers carry no dates, so they appear only in "totals"
+        
+        Example:
+            >>> api = YouTubeApis()
+            >>> stats = api.get_channel_analytics("channel-uuid-123", start_date="2024-01-01", end_date="2024-01-31")
+            >>> print(stats["data"]["period"]["videos"])
+        """
+        channel_data = self._get_channel_data(channel_id)
+        if not channel_data:
+            return {"data": None, "message": "Channel not found"}
+        
+        summary = self._summarize_metrics(
+            self._channel_totals.get(channel_id, {}), self._channel_daily.get(channel_id, {}),
+            _CHANNEL_METRICS, start_date, end_date
+        )
+        return {
+            "data": {
+                "channel_id": channel_id,
+                "title": channel_data.get("title", ""),
+                **summary
+            }
+        }
+
+    def search_users_by_language(self, language: str, maxResults: Optional[int] = None, pageToken: Optional[str] = None) -> Dict[str, Any]:
         """
         Search for users by their language preference.
 
         Args:
             language (str): The language code to search for.
+            maxResults (Optional[int], optional): Maximum number of users to return. Defaults to None (all users).
+            pageToken (Optional[str], optional): "offset_{n}" token from a previous response's "nextPageToken".
 
         Returns:
-            Dict: A dictionary containing matching users.
+            Dict: A dictionary containing matching users under "data", the total number of matches under
+                "count", and a "nextPageToken" when maxResults is given and more users remain.
         """
-        matching_users = []
+        return self._list_user_bucket(self._users_by_language.get(language, {}), maxResults, pageToken)
+
+    def search_users_by_account_status(self, status: str, maxResults: Optional[int] = None, pageToken: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Search for users by their account status. Users without a stored status count as "active".
+
+        Args:
+            status (str): The account status to search for (e.g., "active", "suspended").
+            maxResults (Optional[int], optional): Maximum number of users to return. Defaults to None (all users).
+            pageToken (Optional[str], optional): "offset_{n}" token from a previous response's "nextPageToken".
+
+        Returns:
+            Dict: A dictionary containing matching users under "data", the total number of matches under
+                "count", and a "nextPageToken" when maxResults is given and more users remain.
+        """
+        return self._list_user_bucket(self._users_by_account_status.get(status, {}), maxResults, pageToken)
+
+    def _list_user_bucket(self, bucket: Dict[str, None], maxResults: Optional[int], pageToken: Optional[str]) -> Dict[str, Any]:
+        """
+        Helper method to format one page of a secondary-index bucket as user summaries.
+        """
+        offset = 0
+        if pageToken:
+            try:
+                offset = int(pageToken.split("_")[1])
+            except:
+                offset = 0
+        stop = None if maxResults is None else offset + maxResults
         
-        for user_id, user_data in self.users.items():
-            if user_data.get("language_preference") == language:
-                matching_users.append({
-                    "id": user_id,
-                    "display_name": user_data.get("display_name"),
-                    "email": user_data.get("email"),
-                    "account_status": user_data.get("account_status", "active"),
-                    "joined_date": user_data.get("joined_date")
-                })
+        matching_users = []
+        for user_id in islice(bucket, offset, stop):
+            user_data = self.users[user_id]
+            matching_users.append({
+                "id": user_id,
+                "display_name": user_data.get("display_name"),
+                "email": user_data.get("email"),
+                "account_status": user_data.get("account_status", "active"),
+                "joined_date": user_data.get("joined_date")
+            })
         
-        return {"data": matching_users, "count": len(matching_users)}
+        response = {"data": matching_users, "count": len(bucket)}
+        if stop is not None and stop < len(bucket):
+            response["nextPageToken"] = f"offset_{stop}"
+        return response
 
     def reset_data(self) -> None:
         """
@@ -0,0 +1,102 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+_MAX_GRAM = 3
+
+
+def _grams(word: str) -> set:
+    """Returns every substring of word with 1 to _MAX_GRAM characters."""
+    return {word[i:i + size] for size in range(1, _MAX_GRAM + 1) for i in range(len(word) - size + 1)}
+
+
+class TextIndex:
+    """
+    Case-insensitive substring search over one or more text fields per item.
+
+    Items are indexed by the words (runs of word characters) in their lowercased fields. Each
+    vocabulary word is also indexed under its substrings of up to three characters. A query word
+    of at most three characters finds the vocabulary words containing it with one lookup. A
+    longer query word intersects the word sets of its trigrams, smallest first, and keeps the
+    words that contain it. Only items posted under those words are compared with the full query.
+    """
+
+    __slots__ = ("_postings", "_fields", "_grams")
+
+    def __init__(self):
+        self._postings: Dict[str, set] = {}  # Word -> IDs of items containing it
+        self._fields: Dict[Any, Tuple[str, ...]] = {}  # Item ID -> its lowercased fields
+        self._grams: Dict[str, set] = {}  # Substring of up to three characters -> words containing it
+
+    def __contains__(self, item_id: Any) -> bool:
+        return item_id in self._fields
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @staticmethod
+    def _words(fields: Iterable[str]) -> set:
+        return set(TOKEN_PATTERN.findall(" ".join(fields)))
+
+    def add(self, item_id: Any, *fields: Optional[str]) -> None:
+        """Indexes an item's fields, replacing whatever was indexed for it before."""
+        self.remove(item_id)
+        lowered = tuple((field or "").lower() for field in fields)
+        self._fields[item_id] = lowered
+        for word in self._words(lowered):
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = set()
+                for gram in _grams(word):
+                    self._grams.setdefault(gram, set()).add(word)
+            postings.add(item_id)
+
+    def remove(self, item_id: Any) -> None:
+        """Drops an item from the index; unknown IDs are ignored."""
+        lowered = self._fields.pop(item_id, None)
+        if lowered is None:
+            return
+        for word in self._words(lowered):
+            postings = self._postings[word]
+            postings.discard(item_id)
+            if postings:
+                continue
+            del self._postings[word]
+            for gram in _grams(word):
+                words = self._grams[gram]
+                words.discard(word)
+                if not words:
+                    del self._grams[gram]
+
+    def _words_containing(self, token: str) -> set:
+        if len(token) <= _MAX_GRAM:
+            return self._grams.get(token, set())
+        trigrams = {token[i:i + _MAX_GRAM] for i in range(len(token) - _MAX_GRAM + 1)}
+        words: Optional[set] = None
+        for gram in sorted(trigrams, key=lambda gram: len(self._grams.get(gram, ()))):
+            found = self._grams.get(gram)
+            if not found:
+                return set()
+            words = set(found) if words is None else words & found
+        return {word for word in words if token in word}
+
+    def search(self, query: str) -> List[Any]:
+        """
+        Returns the IDs of items with a field containing query, ignoring case.
+
+        Every word of the query lies inside some word of a matching field, so candidates are the
+        intersection, over the query's words, of the postings of the words containing each one.
+        A query without word characters falls back to checking every item.
+        """
+        query_lower = query.lower()
+        candidates: Optional[set] = None
+        for token in sorted(set(TOKEN_PATTERN.findall(query_lower)), key=len, reverse=True):
+            token_items = set()
+            for word in self._words_containing(token):
+                token_items.update(self._postings[word])
+            candidates = token_items if candidates is None else candidates & token_items
+            if not candidates:
+                return []
+        if candidates is None:
+            candidates = self._fields.keys()
+        return [item_id for item_id in candidates if any(query_lower in field for field in self._fields[item_id])]